@@ -0,0 +1,54 @@
+"""
+답변 캐시 Port (Secondary)
+
+재작성된 질의(UnderstandingUserQueries 결과)의 임베딩으로 이전 답변을 재사용합니다.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+@dataclass(frozen=True)
+class CachedAnswer:
+    """캐시된 답변 (생성 답변 + 검색 문서)"""
+
+    rewritten_query: str
+    general_answer: str
+    general_answer_template: Optional[str] = None
+    retrieved_contents: List[Dict[str, Any]] = field(default_factory=list)
+    index_names: Tuple[str, ...] = ()
+    created_at: datetime = field(default_factory=datetime.now)
+
+
+@dataclass(frozen=True)
+class AnswerCacheHit:
+    """캐시 조회 결과"""
+
+    answer: CachedAnswer
+    similarity: float
+
+
+class AnswerCachePort(ABC):
+    """의미 기반 답변 캐시 Port"""
+
+    @abstractmethod
+    def lookup(self, service_id: str, query_embedding: Sequence[float]) -> Optional[AnswerCacheHit]:
+        """서비스별로 가장 유사한 답변 조회 (임계값 미만이면 None)"""
+        pass
+
+    @abstractmethod
+    def store(self, service_id: str, query_embedding: Sequence[float], answer: CachedAnswer) -> None:
+        """답변 저장"""
+        pass
+
+    @abstractmethod
+    def invalidate_index(self, index_name: str) -> int:
+        """해당 인덱스 문서로 생성된 답변 무효화 (삭제된 항목 수 반환)"""
+        pass
+
+    @abstractmethod
+    def invalidate_all(self) -> int:
+        """전체 무효화 (삭제된 항목 수 반환)"""
+        pass
@@ -0,0 +1,27 @@
+"""
+메시지 ID 시퀀스 Port (Secondary)
+
+스레드별 message_id(1부터 증가)를 발급합니다.
+구현체에 따라 단일 프로세스 / 다중 워커(공유 저장소) 환경을 지원합니다.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict
+
+
+class MessageSequencePort(ABC):
+    """스레드별 메시지 ID 발급 Port"""
+
+    @abstractmethod
+    async def next_id(self, thread_id: str) -> int:
+        """스레드의 다음 메시지 ID 발급 (같은 스레드 안에서 중복 없음)"""
+        pass
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """발급 통계 (추적 중인 스레드 수, 공유 저장소 접근 횟수 등)"""
+        pass
+
+    def close(self) -> None:
+        """리소스 정리 (공유 저장소 연결 등)"""
+        pass
@@ -0,0 +1,32 @@
+"""
+연관질문 선계산 저장소 Port (Secondary)
+
+답변 생성 직후 백그라운드에서 시작한 연관질문 생성 결과를 (thread_id, message_id)로 보관합니다.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Coroutine, Dict, List, Optional
+
+
+class SuggestionStorePort(ABC):
+    """연관질문 선계산 저장소 Port"""
+
+    @abstractmethod
+    def schedule(self, thread_id: str, message_id: int, generation: Coroutine[Any, Any, List[str]]) -> None:
+        """연관질문 생성을 백그라운드로 시작하고 결과를 보관"""
+        pass
+
+    @abstractmethod
+    async def get(self, thread_id: str, message_id: int) -> Optional[List[str]]:
+        """선계산 결과 조회 (진행 중이면 완료까지 대기, 없음 / 만료 / 실패면 None)"""
+        pass
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """조회 / 적중 통계"""
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        """진행 중인 생성 취소 및 보관 결과 정리"""
+        pass
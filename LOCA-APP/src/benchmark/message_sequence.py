@@ -0,0 +1,118 @@
+# benchmark/message_sequence.py
+"""
+메시지 ID 시퀀스 경합 벤치마크
+
+여러 프로세스(uvicorn 워커 모사)가 동시에 같은 스레드 집합의 message_id를 발급하며
+처리량, 발급 지연 백분위수, 공유 저장소 접근 횟수, 중복 ID 수를 측정합니다.
+
+LOCA-APP/src 에서 실행:
+    python -m benchmark.message_sequence
+    python -m benchmark.message_sequence --workers 8 --threads 16 --requests 5000 --block-sizes 1 16 128
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Tuple
+
+from infrastructure.adapters.secondary.sequence.in_memory_message_sequence import InMemoryMessageSequence
+from infrastructure.adapters.secondary.sequence.sqlite_message_sequence import SqliteMessageSequence
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="메시지 ID 시퀀스 경합 벤치마크 (다중 프로세스)")
+    parser.add_argument("--workers", type=int, default=4, help="동시에 발급하는 프로세스 수")
+    parser.add_argument("--concurrency", type=int, default=16, help="프로세스당 동시 요청 수")
+    parser.add_argument("--threads", type=int, default=32, help="대화 스레드 수 (적을수록 같은 행 경합 증가)")
+    parser.add_argument("--requests", type=int, default=2000, help="프로세스당 발급 횟수")
+    parser.add_argument("--block-sizes", type=int, nargs="+", default=[1, 16, 128])
+    return parser.parse_args()
+
+
+def _run_worker(backend: str, path: str, block_size: int, args: Dict[str, Any]) -> Tuple[List[Tuple[str, int]], List[float], Dict[str, Any]]:
+    """프로세스 하나에서 발급 부하 실행 (발급된 (thread_id, message_id), 지연(초), 통계 반환)"""
+    if backend == "sqlite":
+        sequence = SqliteMessageSequence(path, block_size=block_size)
+    else:
+        sequence = InMemoryMessageSequence()
+
+    rng = random.Random(os.getpid())
+    thread_ids = [f"thread_{i}" for i in range(args["threads"])]
+    issued: List[Tuple[str, int]] = []
+    latencies: List[float] = []
+
+    async def client(count: int) -> None:
+        for _ in range(count):
+            thread_id = rng.choice(thread_ids)
+            started = time.perf_counter()
+            message_id = await sequence.next_id(thread_id)
+            latencies.append(time.perf_counter() - started)
+            issued.append((thread_id, message_id))
+
+    async def run() -> None:
+        per_client, remainder = divmod(args["requests"], args["concurrency"])
+        await asyncio.gather(*(
+            client(per_client + (1 if i < remainder else 0)) for i in range(args["concurrency"])
+        ))
+
+    asyncio.run(run())
+    stats = sequence.stats()
+    sequence.close()
+    return issued, latencies, stats
+
+
+def _percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def _run_case(backend: str, block_size: int, args: argparse.Namespace) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "message_sequence.db")
+        if backend == "sqlite":
+            # 스키마 / WAL 전환을 미리 끝내 측정에서 제외
+            SqliteMessageSequence(path).close()
+
+        worker_args = {"threads": args.threads, "requests": args.requests, "concurrency": args.concurrency}
+        started = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            futures = [pool.submit(_run_worker, backend, path, block_size, worker_args) for _ in range(args.workers)]
+            results = [future.result() for future in futures]
+        elapsed = time.perf_counter() - started
+
+    issued = [item for result in results for item in result[0]]
+    latencies = [value for result in results for value in result[1]]
+    reservations = sum(result[2].get("reservations", 0) for result in results)
+    duplicates = sum(count - 1 for count in Counter(issued).values() if count > 1)
+    return {
+        "backend": backend,
+        "block_size": block_size if backend == "sqlite" else "-",
+        "issued": len(issued),
+        "throughput_ids_per_s": round(len(issued) / elapsed),
+        "p50_us": round(_percentile(latencies, 0.5) * 1e6, 1),
+        "p99_us": round(_percentile(latencies, 0.99) * 1e6, 1),
+        "reservations": reservations if backend == "sqlite" else "-",
+        "duplicates": duplicates
+    }
+
+
+def main() -> None:
+    args = _parse_args()
+    cases = [("memory", 1)] + [("sqlite", block_size) for block_size in args.block_sizes]
+    columns = ("backend", "block_size", "issued", "throughput_ids_per_s", "p50_us", "p99_us", "reservations", "duplicates")
+
+    print(f"workers={args.workers} concurrency={args.concurrency} threads={args.threads} requests/worker={args.requests}")
+    print(" | ".join(columns))
+    for backend, block_size in cases:
+        row = _run_case(backend, block_size, args)
+        print(" | ".join(str(row[c]) for c in columns))
+    # memory 백엔드의 duplicates는 다중 워커에서 기존 프로세스 단위 카운터가 만드는 중복 ID 수
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+# benchmark/response_encoding.py
+"""
+응답 직렬화 마이크로 벤치마크
+
+기본 경로(response_model 재검증 + jsonable_encoder + json.dumps)와
+ResponseBuilder.json_response 경로(pydantic-core 직렬화, 재검증 생략)의 응답당 비용을 비교합니다.
+
+LOCA-APP/src 에서 실행:
+    python -m benchmark.response_encoding
+    python -m benchmark.response_encoding --iterations 50000 --answer-chars 4000
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime
+from typing import Callable, Dict, List
+
+from fastapi import FastAPI
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from infrastructure.adapters.primary.web.chat.schemas.response_schema import (
+    CompletionResponse,
+    CompletionResponseData,
+    CompletionResponseMeta
+)
+from infrastructure.adapters.primary.web.common.response_builders import ResponseBuilder, encode_json
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="응답 직렬화 마이크로 벤치마크")
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--answer-chars", type=int, default=800, help="답변 길이 (문자 수)")
+    return parser.parse_args()
+
+
+def _build_response(answer_chars: int) -> CompletionResponse:
+    answer = ("롯데카드를 이용하시면 다양한 할인 혜택을 받으실 수 있습니다. " * (answer_chars // 30 + 1))[:answer_chars]
+    return CompletionResponse(
+        meta=CompletionResponseMeta(
+            thread_id="thread_12345",
+            message_id=1,
+            result_status="200",
+            result_status_message="성공",
+            timestamp=datetime.now()
+        ),
+        data=CompletionResponseData(general_answer=answer, general_answer_template="TBD")
+    )
+
+
+def _time_per_call(func: Callable[[], object], iterations: int) -> float:
+    """호출당 평균 시간 (us)"""
+    for _ in range(min(1000, iterations)):
+        func()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def _build_app(response: CompletionResponse) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/default", response_model=CompletionResponse)
+    async def default_path():
+        return response
+
+    @app.get("/fast", response_model=CompletionResponse)
+    async def fast_path():
+        return ResponseBuilder.json_response(response)
+
+    return app
+
+
+async def _call(app: FastAPI, path: str, out: List[bytes]) -> None:
+    """HTTP 서버 없이 ASGI 앱 직접 호출 (응답 본문 수집)"""
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "root_path": "", "query_string": b"",
+        "headers": [], "client": ("127.0.0.1", 1), "server": ("testserver", 80)
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            out.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+
+
+async def _time_endpoint(app: FastAPI, path: str, iterations: int) -> float:
+    out: List[bytes] = []
+    for _ in range(min(1000, iterations)):
+        await _call(app, path, out)
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await _call(app, path, out)
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def main() -> None:
+    args = _parse_args()
+    response = _build_response(args.answer_chars)
+    app = _build_app(response)
+
+    results: Dict[str, float] = {
+        "encode_default_us": _time_per_call(lambda: JSONResponse(jsonable_encoder(response)).body, args.iterations),
+        "encode_fast_us": _time_per_call(lambda: encode_json(response), args.iterations),
+        "endpoint_default_us": asyncio.run(_time_endpoint(app, "/default", args.iterations)),
+        "endpoint_fast_us": asyncio.run(_time_endpoint(app, "/fast", args.iterations))
+    }
+
+    print(f"iterations={args.iterations} answer_chars={args.answer_chars}")
+    for name, value in results.items():
+        print(f"{name}: {value:.1f}")
+    print(f"encode speedup: {results['encode_default_us'] / results['encode_fast_us']:.1f}x, "
+          f"endpoint speedup: {results['endpoint_default_us'] / results['endpoint_fast_us']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
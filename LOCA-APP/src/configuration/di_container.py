@@ -1,4 +1,6 @@
-from typing import Dict, Any
+import asyncio
+import time
+from typing import Dict, Any, Optional
 
 # from domain.ports.conversation_repository import ConversationRepository
 # from domain.ports.query_understanding_service_port import QueryUnderstandingServicePort
@@ -15,6 +17,9 @@ from typing import Dict, Any
 # from infrastructure.adapters.secondary.llm.langchain_llm_adapter import LangChainLLMAdapter
 # from infrastructure.adapters.secondary.llm.embedding_adapter import EmbeddingAdapter
 
+from application.ports.secondary.answer_cache_port import AnswerCachePort
+from application.ports.secondary.message_sequence_port import MessageSequencePort
+from application.ports.secondary.suggestion_store_port import SuggestionStorePort
 from configuration.settings.app_settings import AppSettings
 from configuration.factories.logger_factory import get_logger
 
@@ -25,12 +30,205 @@ class DIContainer:
     def __init__(self, settings: AppSettings):
         self._settings = settings
         self._instances: Dict[str, Any] = {}
+        self._ready = False
+        self._warmup_task: Optional[asyncio.Task] = None
+        self._warmup_report: Dict[str, Any] = {"status": "pending"}
 
     def _get_or_create(self, key: str, factory_func):
         if key not in self._instances:
             self._instances[key] = factory_func()
         return self._instances[key]
 
+    # LLM 클라이언트 (openrouter 클라이언트 계층, 제공자별 공유 커넥션 풀 사용)
+    def llm_client(self):
+        return self._get_or_create("llm_client", self._create_llm_client)
+
+    def _create_llm_client(self):
+        from openrouter.src.client.client_factory import LLMClientFactory, ModelProvider
+        from openrouter.src.settings import Settings as LLMClientSettings
+
+        llm_settings = self._settings.llm
+        provider = ModelProvider(llm_settings.provider)
+        client_settings = {
+            f"{provider.value}_api_key": llm_settings.api_key,
+            f"{provider.value}_model": llm_settings.model,
+            "max_tokens": llm_settings.max_tokens,
+            "temperature": llm_settings.temperature
+        }
+        if provider is ModelProvider.VLLM and llm_settings.base_url:
+            client_settings["vllm_base_url"] = llm_settings.base_url
+
+        # LOCA .env는 클라이언트 설정 형식이 아니므로 읽지 않고 LLM_* 설정으로만 구성
+        return LLMClientFactory.create_client(provider, LLMClientSettings(_env_file=None, **client_settings))
+
+    # 의미 기반 답변 캐시 (재작성 질의 임베딩 기반)
+    def answer_cache(self) -> Optional[AnswerCachePort]:
+        if not self._settings.semantic_cache.enabled:
+            return None
+        return self._get_or_create("answer_cache", self._create_answer_cache)
+
+    def _create_answer_cache(self) -> AnswerCachePort:
+        from infrastructure.adapters.secondary.cache.semantic_answer_cache import InMemorySemanticAnswerCache
+
+        cache_settings = self._settings.semantic_cache
+        return InMemorySemanticAnswerCache(
+            similarity_threshold=cache_settings.similarity_threshold,
+            max_entries_per_service=cache_settings.max_entries_per_service,
+            ttl_seconds=cache_settings.ttl_seconds,
+            quantize_int8=cache_settings.quantize_int8
+        )
+
+    # 연관질문 선계산 저장소 (답변 직후 백그라운드 생성 결과)
+    def suggestion_store(self) -> Optional[SuggestionStorePort]:
+        if not self._settings.suggestion_precompute.enabled:
+            return None
+        return self._get_or_create("suggestion_store", self._create_suggestion_store)
+
+    def _create_suggestion_store(self) -> SuggestionStorePort:
+        from infrastructure.adapters.secondary.cache.suggestion_store import InMemorySuggestionStore
+
+        precompute_settings = self._settings.suggestion_precompute
+        return InMemorySuggestionStore(
+            max_entries=precompute_settings.max_entries,
+            ttl_seconds=precompute_settings.ttl_seconds
+        )
+
+    # 스레드별 메시지 ID 발급 (다중 워커 환경은 sqlite)
+    def message_sequence(self) -> MessageSequencePort:
+        return self._get_or_create("message_sequence", self._create_message_sequence)
+
+    def _create_message_sequence(self) -> MessageSequencePort:
+        sequence_settings = self._settings.message_sequence
+        if sequence_settings.backend == "sqlite":
+            from infrastructure.adapters.secondary.sequence.sqlite_message_sequence import SqliteMessageSequence
+
+            return SqliteMessageSequence(
+                path=sequence_settings.sqlite_path,
+                block_size=sequence_settings.block_size,
+                max_cached_threads=sequence_settings.max_threads
+            )
+
+        from infrastructure.adapters.secondary.sequence.in_memory_message_sequence import InMemoryMessageSequence
+
+        return InMemoryMessageSequence(max_threads=sequence_settings.max_threads)
+
+    def component_stats(self) -> Dict[str, Any]:
+        """구성 요소별 상태 / 통계 (생성되지 않은 구성 요소는 빈 dict)
+
+        llm_pools: 커넥션 풀 (in-use / idle / waiting)
+        llm_rate_limits: 요청 제한기 (대기 시간 / 429 횟수 / 동시성 한도)
+        llm_circuits: 모델별 서킷 (closed / open / half_open)
+        llm_single_flight: 동일 요청 중복 제거
+        llm_token_budget: 프롬프트 토큰 예산 (정리된 호출 수 / 절약한 토큰 수)
+        llm_metrics: 호출 지연(queue wait / connect / TTFT / ITL / E2E) 및 토큰 지표 요약
+        message_sequence: 메시지 ID 발급
+        suggestion_precompute: 연관질문 선계산 적중
+        """
+        client = self._instances.get("llm_client")
+        sequence = self._instances.get("message_sequence")
+        store = self._instances.get("suggestion_store")
+        return {
+            "llm_pools": client.all_pool_stats() if client else {},
+            "llm_rate_limits": client.rate_limiter_stats() if client else {},
+            "llm_circuits": client.circuit_breaker_stats() if client else {},
+            "llm_single_flight": client.single_flight_stats() if client else {},
+            "llm_token_budget": client.token_budget_stats() if client else {},
+            "llm_metrics": client.metrics_snapshot() if client else {},
+            "message_sequence": sequence.stats() if sequence else {},
+            "suggestion_precompute": store.stats() if store else {}
+        }
+
+    def llm_metrics_prometheus(self) -> str:
+        """LLM 호출 지표 (Prometheus 텍스트 형식)"""
+        client = self._instances.get("llm_client")
+        return client.metrics_prometheus() if client else ""
+
+    async def startup(self) -> None:
+        """외부 리소스 초기화 (LLM 커넥션 풀 사전 생성, 워밍업은 백그라운드에서 진행)
+
+        LLM 클라이언트를 만들 수 없으면 예외를 그대로 올려 애플리케이션 시작을 중단합니다.
+        """
+        try:
+            await self.llm_client().open()
+        except Exception as e:
+            logger.error(f"LLM client initialization failed (provider: {self._settings.llm.provider}): {e}")
+            raise
+        logger.info(f"LLM connection pool opened (provider: {self._settings.llm.provider})")
+
+        if self._settings.llm.warmup_enabled:
+            self._warmup_task = asyncio.create_task(self._warm_up())
+        else:
+            self._warmup_report = {"status": "skipped"}
+            self._ready = True
+
+    async def _warm_up(self) -> None:
+        """첫 요청 지연 제거 (커넥션 사전 연결, 모델 카탈로그 / 캐시 적재, 선택적 probe)
+
+        실패(예외 / 시간 초과 / 연결·자원·probe 오류)하면 준비 상태로 전환하지 않고
+        warmup_retry_interval마다 다시 시도합니다. 성공 전까지 /health/ready는 503입니다.
+        """
+        retry_interval = self._settings.llm.warmup_retry_interval
+        attempt = 0
+        while True:
+            attempt += 1
+            started = time.perf_counter()
+            report = await self._warm_up_once()
+            report["attempt"] = attempt
+            report["seconds"] = round(time.perf_counter() - started, 3)
+            self._warmup_report = report
+            if report["status"] == "completed":
+                self._ready = True
+                logger.info(f"Warm-up finished: {report}")
+                return
+            logger.warning(f"Warm-up attempt {attempt} failed, retrying in {retry_interval}s: {report}")
+            await asyncio.sleep(retry_interval)
+
+    async def _warm_up_once(self) -> Dict[str, Any]:
+        llm_settings = self._settings.llm
+        try:
+            self.answer_cache()
+            self.message_sequence()
+            report = await asyncio.wait_for(
+                self.llm_client().warm_up(
+                    connections=llm_settings.warmup_connections,
+                    probe=llm_settings.warmup_probe
+                ),
+                timeout=llm_settings.warmup_timeout
+            )
+        except asyncio.TimeoutError:
+            return {"status": "timeout"}
+        except Exception as e:
+            return {"status": "failed", "error": str(e)}
+        return {"status": "failed" if report.errors else "completed", "llm": report.to_dict()}
+
+    @property
+    def is_ready(self) -> bool:
+        return self._ready
+
+    def readiness(self) -> Dict[str, Any]:
+        """준비 상태 (워밍업 완료 여부 / 결과)"""
+        return {"ready": self._ready, "warmup": self._warmup_report}
+
+    async def shutdown(self) -> None:
+        """외부 리소스 정리 (LLM 커넥션 풀 종료, 메시지 ID 저장소 연결 종료, 진행 중인 연관질문 생성 취소)"""
+        self._ready = False
+        if self._warmup_task is not None and not self._warmup_task.done():
+            self._warmup_task.cancel()
+            try:
+                await self._warmup_task
+            except asyncio.CancelledError:
+                pass
+        client = self._instances.get("llm_client")
+        if client:
+            await client.aclose_all()
+            logger.info("LLM connection pools closed")
+        sequence = self._instances.pop("message_sequence", None)
+        if sequence:
+            sequence.close()
+        suggestion_store = self._instances.pop("suggestion_store", None)
+        if suggestion_store:
+            suggestion_store.close()
+
     # # Domain Port Implementations
     # def conversation_repository(self) -> ConversationRepository:
     #     return self._get_or_create(
@@ -104,7 +302,13 @@ def init_container(settings: AppSettings) -> None:
     global _container
     _container = DIContainer(settings)
 
+async def startup_container() -> None:
+    """DI 컨테이너 리소스 초기화 (커넥션 풀 등)"""
+    await get_container().startup()
+
 async def cleanup_container() -> None:
     """DI 컨테이너 정리"""
     # 데이터베이스 연결 종료, 캐시 정리 등
+    if _container is not None:
+        await _container.shutdown()
     logger.info("DI Container cleanup completed")
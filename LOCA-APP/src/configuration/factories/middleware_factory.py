@@ -1,46 +1,36 @@
-import time
 import logging
-from fastapi import FastAPI, Request, Response
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.middleware.base import BaseHTTPMiddleware
 
+from ..middleware.gateway_middleware import GatewayMiddleware
+from ..middleware.timing_middleware import RequestTimingMiddleware
 from ..settings.app_settings import AppSettings
 
 logger = logging.getLogger(__name__)
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-
-    async def dispatch(self, request: Request, call_next) -> Response:
-        start_time = time.time()
-
-        # 요청 처리
-        response = await call_next(request)
-
-        # 처리 시간 계산 및 로깅
-        process_time = time.time() - start_time
-        logger.info(
-            f"{request.method} {request.url.path} - "
-            f"Status: {response.status_code} - "
-            f"Time: {process_time:.3f}s"
-        )
-
-        return response
-
-
 def setup_middlewares(app: FastAPI, settings: AppSettings) -> None:
-    """미들웨어 설정"""
+    """미들웨어 설정 (나중에 추가한 미들웨어가 바깥쪽에서 실행됨)"""
+
+    # Gateway 미들웨어 (CORS 안쪽: preflight / 오류 응답에도 CORS 헤더 적용)
+    _setup_gateway_middleware(app, settings)
 
     # CORS 미들웨어
     _setup_cors_middleware(app, settings)
 
-    # 요청 로깅 미들웨어 (개발환경에서만)
-    if settings.DEBUG:
-        _setup_logging_middleware(app)
+    # 요청 지연 측정 미들웨어 (가장 바깥쪽, 항상 활성화 / 요청 로그는 개발환경에서만)
+    _setup_timing_middleware(app, settings)
 
     logger.info("Middleware configuration completed")
 
 
+def _setup_gateway_middleware(app: FastAPI, settings: AppSettings) -> None:
+    """Gateway 헤더 검증 / 응답 헤더 설정 미들웨어"""
+    path_prefixes = [f"{settings.API_V1_PREFIX}{path}" for path in settings.gateway.paths]
+    app.add_middleware(GatewayMiddleware, settings=settings, path_prefixes=path_prefixes)
+    logger.debug(f"Gateway middleware configured for {path_prefixes}")
+
+
 def _setup_cors_middleware(app: FastAPI, settings: AppSettings) -> None:
     """CORS 미들웨어 설정"""
     app.add_middleware(
@@ -53,7 +43,7 @@ def _setup_cors_middleware(app: FastAPI, settings: AppSettings) -> None:
     logger.debug("CORS middleware configured")
 
 
-def _setup_logging_middleware(app: FastAPI) -> None:
-    """로깅 미들웨어 설정"""
-    app.add_middleware(RequestLoggingMiddleware)
-    logger.debug("Request logging middleware configured")
+def _setup_timing_middleware(app: FastAPI, settings: AppSettings) -> None:
+    """요청 지연 측정 미들웨어 설정 (/metrics 로 노출)"""
+    app.add_middleware(RequestTimingMiddleware, log_requests=settings.DEBUG)
+    logger.debug("Request timing middleware configured")
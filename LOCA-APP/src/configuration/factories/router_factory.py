@@ -2,6 +2,7 @@
 from typing import List, Optional
 from dataclasses import dataclass
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse, PlainTextResponse
 import importlib
 import logging
 import inspect
@@ -47,6 +48,30 @@ class RouterRegistry:
                 "version": "1.0.0"
             }
 
+        @system_router.get("/health/ready")
+        async def readiness_check():
+            from configuration.di_container import get_container
+            container = get_container()
+            return JSONResponse(container.readiness(), status_code=200 if container.is_ready else 503)
+
+        @system_router.get("/health/stats")
+        async def component_stats():
+            """구성 요소별 상태 (LLM 풀 / 요청 제한 / 서킷 / 중복 제거 / 토큰 예산 / 지표, 메시지 ID, 연관질문 선계산)"""
+            from configuration.di_container import get_container
+            return get_container().component_stats()
+
+        @system_router.get("/metrics/llm", response_class=PlainTextResponse)
+        async def llm_metrics_prometheus():
+            from configuration.di_container import get_container
+            return get_container().llm_metrics_prometheus()
+
+        @system_router.get("/metrics", response_class=PlainTextResponse)
+        async def metrics_prometheus():
+            """HTTP 요청 지연 (라우트 / 상태 코드 / 서비스 ID별) + LLM 클라이언트 지표"""
+            from configuration.di_container import get_container
+            from configuration.middleware.timing_middleware import get_http_metrics
+            return get_http_metrics().to_prometheus() + get_container().llm_metrics_prometheus()
+
         @system_router.get("/")
         async def root():
             return {
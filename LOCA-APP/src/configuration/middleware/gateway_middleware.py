@@ -0,0 +1,105 @@
+"""API Gateway 통합 미들웨어 (순수 ASGI)"""
+import asyncio
+from collections import deque
+from typing import Deque, List, Sequence
+
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from configuration.factories.logger_factory import get_logger
+from infrastructure.adapters.primary.web.common.gateway.schemas.gateway_middleware import (
+    GATEWAY_STATE_KEY,
+    GatewayProcessor
+)
+from infrastructure.adapters.primary.web.common.response_builders import ResponseBuilder
+from ..settings.app_settings import AppSettings
+
+logger = get_logger()
+
+
+class GatewayMiddleware:
+    """Gateway 헤더 검증 / 응답 헤더 설정
+
+    - COMM 헤더를 요청당 한 번 파싱해 GatewayHeader를 request.state.gateway_header에 저장합니다.
+    - 응답 헤더는 http.response.start 메시지에 추가하므로 스트리밍 응답에도 그대로 적용됩니다.
+    - 바디 모드에서는 읽은 바디 메시지를 앱에 그대로 다시 전달합니다 (다시 모아 담지 않음).
+    - 필수 필드가 없으면 핸들러를 호출하지 않고 400(VALIDATION_ERROR)을 반환합니다.
+    """
+
+    def __init__(self, app: ASGIApp, settings: AppSettings, path_prefixes: Sequence[str]):
+        self.app = app
+        self.settings = settings
+        self.path_prefixes = tuple(path_prefixes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (scope["type"] != "http" or scope["method"] == "OPTIONS"
+                or not scope["path"].startswith(self.path_prefixes)):
+            await self.app(scope, receive, send)
+            return
+
+        gateway = self.settings.gateway
+        state = scope.setdefault("state", {})
+        if not gateway.enabled:
+            state[GATEWAY_STATE_KEY] = GatewayProcessor._create_default_header()
+            await self.app(scope, receive, send)
+            return
+
+        gateway_data = GatewayProcessor.extract_from_raw_headers(scope["headers"]) if gateway.header_mode else {}
+
+        if gateway.body_mode and not GatewayProcessor._has_required_fields(gateway_data, self.settings):
+            messages: List[Message] = []
+            try:
+                async with asyncio.timeout(gateway.extraction_timeout):
+                    body = await self._read_body(receive, messages, gateway.max_body_size)
+                GatewayProcessor.merge_body_data(gateway_data, GatewayProcessor.parse_body_comm(body, self.settings))
+            except asyncio.TimeoutError:
+                logger.warning(f"Gateway info extraction timeout after {gateway.extraction_timeout}s")
+            # 이미 읽은 바디 메시지를 먼저 돌려주고 나머지는 원래 receive에서 읽음
+            receive = _replay_receive(messages, receive)
+
+        try:
+            header = GatewayProcessor.build_gateway_header(gateway_data, self.settings)
+        except ValueError as e:
+            error_response = ResponseBuilder.build_validation_error(str(e))
+            response = JSONResponse({"detail": error_response.model_dump()}, status_code=400)
+            await response(scope, receive, send)
+            return
+
+        state[GATEWAY_STATE_KEY] = header
+        header_items = GatewayProcessor.response_header_items(header)
+
+        async def send_with_gateway_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *header_items]
+            await send(message)
+
+        await self.app(scope, receive, send_with_gateway_headers)
+
+    @staticmethod
+    async def _read_body(receive: Receive, messages: List[Message], max_body_size: int) -> bytes:
+        """바디 메시지를 messages에 모으면서 읽음 (max_body_size 초과 시 파싱 없이 중단)"""
+        size = 0
+        while True:
+            message = await receive()
+            messages.append(message)
+            if message["type"] != "http.request":
+                return b""
+            size += len(message.get("body", b""))
+            if size > max_body_size:
+                return b""
+            if not message.get("more_body", False):
+                break
+        if len(messages) == 1:
+            return messages[0].get("body", b"")
+        return b"".join(m.get("body", b"") for m in messages)
+
+
+def _replay_receive(messages: List[Message], receive: Receive) -> Receive:
+    pending: Deque[Message] = deque(messages)
+
+    async def replay() -> Message:
+        if pending:
+            return pending.popleft()
+        return await receive()
+
+    return replay
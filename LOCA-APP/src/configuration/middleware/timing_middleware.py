@@ -0,0 +1,189 @@
+"""요청 지연 측정 미들웨어 (순수 ASGI) 및 라우트별 지연 히스토그램"""
+import logging
+import math
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+# 핸들러가 서비스 ID를 기록하는 request.state 키 (지표 레이블로 사용)
+SERVICE_ID_STATE_KEY = "service_id"
+
+# 라우트에 매칭되지 않은 요청(404 등)의 레이블 (경로별 시계열이 늘어나지 않도록)
+UNMATCHED_ROUTE = "unmatched"
+
+_QUANTILES = (0.5, 0.9, 0.99)
+
+
+class LatencyHistogram:
+    """로그 버킷 지연 히스토그램 (HDR 방식, 관측당 O(1), 메모리 고정)
+
+    10us ~ 약 100s 범위를 2배당 16개 버킷(약 4.4% 정밀도)으로 나눕니다.
+    이벤트 루프 스레드에서만 갱신하므로(관측 중 await 없음) 잠금 없이 사용합니다.
+    """
+    __slots__ = ("_counts", "count", "sum", "max")
+
+    LOWEST = 1e-5
+    STEPS_PER_DOUBLING = 16
+    BUCKETS = 2 + int(math.log2(100.0 / 1e-5) * 16)
+
+    def __init__(self):
+        self._counts = [0] * self.BUCKETS
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        if seconds <= self.LOWEST:
+            index = 0
+        else:
+            index = min(int(math.log2(seconds / self.LOWEST) * self.STEPS_PER_DOUBLING) + 1, self.BUCKETS - 1)
+        self._counts[index] += 1
+        self.count += 1
+        self.sum += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, q: float) -> Optional[float]:
+        """q 분위수 (0~1, 버킷 상한 기준, 최댓값으로 보정)"""
+        if not self.count:
+            return None
+        target = max(1, math.ceil(q * self.count))
+        cumulative = 0
+        for index, bucket_count in enumerate(self._counts):
+            cumulative += bucket_count
+            if cumulative >= target:
+                upper = self.LOWEST * 2 ** (index / self.STEPS_PER_DOUBLING)
+                return min(upper, self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        if not self.count:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "mean": round(self.sum / self.count, 6),
+            **{f"p{int(q * 100)}": round(self.percentile(q), 6) for q in _QUANTILES},
+            "max": round(self.max, 6)
+        }
+
+
+# (메서드, 라우트, 상태 코드, 서비스 ID)
+SeriesKey = Tuple[str, str, int, str]
+
+
+class HttpMetrics:
+    """메서드 / 라우트 / 상태 코드 / 서비스 ID별 요청 지연 (프로세스 단위, 워커별로 집계됨)"""
+
+    def __init__(self):
+        self._series: Dict[SeriesKey, LatencyHistogram] = {}
+
+    def observe(self, method: str, route: str, status: int, service_id: str, seconds: float) -> None:
+        key = (method, route, status, service_id)
+        histogram = self._series.get(key)
+        if histogram is None:
+            histogram = self._series[key] = LatencyHistogram()
+        histogram.observe(seconds)
+
+    def reset(self) -> None:
+        self._series.clear()
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """시계열별 지연 요약 (JSON 직렬화 가능)"""
+        return [
+            {"method": method, "route": route, "status": status, "service_id": service_id, **histogram.to_dict()}
+            for (method, route, status, service_id), histogram in self._series.items()
+        ]
+
+    def to_prometheus(self, prefix: str = "http_server") -> str:
+        """Prometheus 텍스트 형식 (지연은 summary, 요청 수는 counter)"""
+        lines: List[str] = []
+        series = [(_labels(key), histogram) for key, histogram in self._series.items()]
+
+        lines.append(f"# HELP {prefix}_requests_total HTTP 요청 수")
+        lines.append(f"# TYPE {prefix}_requests_total counter")
+        for labels, histogram in series:
+            lines.append(f"{prefix}_requests_total{{{labels}}} {histogram.count}")
+
+        name = f"{prefix}_request_duration_seconds"
+        lines.append(f"# HELP {name} 요청 수신부터 응답 완료까지 지연(초)")
+        lines.append(f"# TYPE {name} summary")
+        for labels, histogram in series:
+            for quantile in _QUANTILES:
+                lines.append(f'{name}{{{labels},quantile="{quantile}"}} {histogram.percentile(quantile):.6f}')
+            lines.append(f"{name}_sum{{{labels}}} {histogram.sum:.6f}")
+            lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(key: SeriesKey) -> str:
+    method, route, status, service_id = key
+    route = route.replace("\\", "\\\\").replace('"', '\\"')
+    return f'method="{method}",route="{route}",status="{status}",service_id="{service_id}"'
+
+
+_http_metrics = HttpMetrics()
+
+
+def get_http_metrics() -> HttpMetrics:
+    """HTTP 요청 지표 인스턴스 반환 (싱글톤)"""
+    return _http_metrics
+
+
+def record_service_id(request: Request, service_id: str) -> None:
+    """요청 지표의 service_id 레이블 지정 (핸들러에서 요청 본문 파싱 후 호출)"""
+    setattr(request.state, SERVICE_ID_STATE_KEY, service_id)
+
+
+class RequestTimingMiddleware:
+    """모든 HTTP 요청의 지연을 라우트 / 상태 코드 / 서비스 ID별로 기록 (항상 활성화)
+
+    - 응답을 감싸지 않고 send 메시지만 관찰하므로 스트리밍 응답도 그대로 전달됩니다
+      (지연은 마지막 바디 전송까지, SSE는 스트림 종료까지).
+    - 라우트 레이블은 실제 경로가 아닌 라우트 템플릿을 사용합니다.
+    - log_requests=True면 요청마다 한 줄 로그를 남깁니다 (기존 개발 환경 요청 로그).
+    """
+
+    def __init__(self, app: ASGIApp, metrics: Optional[HttpMetrics] = None, log_requests: bool = False):
+        self.app = app
+        self.metrics = metrics or get_http_metrics()
+        self.log_requests = log_requests
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        status = 500
+        recorded = False
+
+        def record() -> None:
+            nonlocal recorded
+            if recorded:
+                return
+            recorded = True
+            elapsed = time.perf_counter() - start_time
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or UNMATCHED_ROUTE
+            service_id = scope.get("state", {}).get(SERVICE_ID_STATE_KEY) or "none"
+            self.metrics.observe(scope["method"], route_path, status, service_id, elapsed)
+            if self.log_requests:
+                logger.info(f"{scope['method']} {scope['path']} - Status: {status} - Time: {elapsed:.3f}s")
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                record()
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            # 응답 완료 전에 예외 / 연결 종료로 끝난 경우
+            record()
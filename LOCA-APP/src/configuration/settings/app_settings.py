@@ -8,6 +8,9 @@ from configuration.settings.logging_settings import LoggingSettings
 from configuration.settings.outbound.datebase_settings import DatabaseSettings
 from configuration.settings.inbound.gateway_settings import GatewaySettings
 from configuration.settings.outbound.llm_settings import LLMSettings
+from configuration.settings.outbound.message_sequence_settings import MessageSequenceSettings
+from configuration.settings.outbound.semantic_cache_settings import SemanticCacheSettings
+from configuration.settings.outbound.suggestion_precompute_settings import SuggestionPrecomputeSettings
 
 
 
@@ -45,6 +48,9 @@ class AppSettings(BaseSettings):
     gateway: GatewaySettings = Field(default_factory=GatewaySettings)
     database: DatabaseSettings = Field(default_factory=DatabaseSettings)
     llm: LLMSettings = Field(default_factory=LLMSettings)
+    semantic_cache: SemanticCacheSettings = Field(default_factory=SemanticCacheSettings)
+    message_sequence: MessageSequenceSettings = Field(default_factory=MessageSequenceSettings)
+    suggestion_precompute: SuggestionPrecomputeSettings = Field(default_factory=SuggestionPrecomputeSettings)
 
     # # Elasticsearch
     # ELASTICSEARCH_HOST: str = "localhost"
@@ -1,5 +1,7 @@
 """Gateway 설정"""
 
+from typing import List
+
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
@@ -14,6 +16,12 @@ class GatewaySettings(BaseSettings):
         env="GATEWAY_ENABLED"
     )
 
+    paths: List[str] = Field(
+        default=["/chat"],
+        description="Gateway 헤더를 검증 / 설정할 경로 접두어 (API prefix 기준)",
+        env="GATEWAY_PATHS"
+    )
+
     # === 통신 방식 설정 ===
     header_mode: bool = Field(
         default=True,
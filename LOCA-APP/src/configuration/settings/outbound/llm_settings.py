@@ -1,16 +1,28 @@
 """LLM 설정"""
 
 from pydantic import Field
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class LLMSettings(BaseSettings):
-    provider: str = Field(default="openai", env="LLM_PROVIDER")  # ✅ 이제 env 사용 가능
-    api_key: str = Field(default="", env="LLM_API_KEY")
-    model: str = Field(default="gpt-4", env="LLM_MODEL")
-    max_tokens: int = Field(default=2000, env="LLM_MAX_TOKENS")
-    temperature: float = Field(default=0.1, env="LLM_TEMPERATURE")
+    """LLM 클라이언트 설정 (환경 변수는 LLM_ 접두어, 예: LLM_PROVIDER)"""
 
-    class Config:
-        env_file = ".env"
-        extra = "ignore"
+    provider: str = Field(default="openai")  # openai / claude / qwen / openrouter / vllm
+    api_key: str = Field(default="")
+    model: str = Field(default="gpt-4")
+    max_tokens: int = Field(default=2000)
+    temperature: float = Field(default=0.1)
+    base_url: str = Field(default="", description="vllm 제공자 주소 (미지정 시 클라이언트 기본값)")
+
+    # 시작 시 워밍업 (완료 전까지 /health/ready는 503)
+    warmup_enabled: bool = Field(default=True)
+    warmup_connections: int = Field(default=4, ge=0)
+    warmup_probe: bool = Field(default=False)  # 1토큰 완료 요청으로 전체 경로 확인
+    warmup_timeout: float = Field(default=30.0, gt=0.0)
+    warmup_retry_interval: float = Field(default=10.0, gt=0.0)  # 실패 시 재시도 간격 (성공 전까지 준비 상태 아님)
+
+    model_config = SettingsConfigDict(
+        env_prefix="LLM_",
+        env_file=".env",
+        extra="ignore"
+    )
@@ -0,0 +1,29 @@
+"""메시지 ID 시퀀스 설정"""
+
+from typing import Literal
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class MessageSequenceSettings(BaseSettings):
+    """스레드별 message_id 발급 설정 (환경 변수는 MESSAGE_SEQUENCE_ 접두어, 예: MESSAGE_SEQUENCE_BACKEND)
+
+    memory: 프로세스 단위 카운터 (단일 워커 / 개발 환경)
+    sqlite: 호스트 단위 공유 카운터 (다중 uvicorn 워커)
+    """
+
+    backend: Literal["memory", "sqlite"] = Field(default="memory")
+    max_threads: int = Field(default=100_000, ge=1)
+    sqlite_path: str = Field(default="data/message_sequence.db")
+    block_size: int = Field(
+        default=1,
+        ge=1,
+        description="워커별 예약 구간 크기 (1이면 스레드 안에서 발급 순서 보장, 크면 공유 저장소 접근 감소)"
+    )
+
+    model_config = SettingsConfigDict(
+        env_prefix="MESSAGE_SEQUENCE_",
+        env_file=".env",
+        extra="ignore"
+    )
@@ -0,0 +1,20 @@
+"""의미 기반 답변 캐시 설정"""
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class SemanticCacheSettings(BaseSettings):
+    """재작성 질의 임베딩 기반 답변 캐시 설정 (환경 변수는 SEMANTIC_CACHE_ 접두어, 예: SEMANTIC_CACHE_ENABLED)"""
+
+    enabled: bool = Field(default=False)
+    similarity_threshold: float = Field(default=0.92, ge=0.0, le=1.0)
+    max_entries_per_service: int = Field(default=5000, ge=1)
+    ttl_seconds: float = Field(default=3600.0, gt=0.0)
+    quantize_int8: bool = Field(default=False)
+
+    model_config = SettingsConfigDict(
+        env_prefix="SEMANTIC_CACHE_",
+        env_file=".env",
+        extra="ignore"
+    )
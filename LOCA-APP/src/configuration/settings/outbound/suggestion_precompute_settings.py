@@ -0,0 +1,18 @@
+"""연관질문 선계산 설정"""
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class SuggestionPrecomputeSettings(BaseSettings):
+    """답변 직후 연관질문 백그라운드 생성 설정 (환경 변수는 SUGGESTION_PRECOMPUTE_ 접두어, 예: SUGGESTION_PRECOMPUTE_ENABLED)"""
+
+    enabled: bool = Field(default=False)
+    max_entries: int = Field(default=10_000, ge=1)
+    ttl_seconds: float = Field(default=300.0, gt=0.0)
+
+    model_config = SettingsConfigDict(
+        env_prefix="SUGGESTION_PRECOMPUTE_",
+        env_file=".env",
+        extra="ignore"
+    )
@@ -4,7 +4,7 @@ Thread Aggregate Root (대화 히스토리 관리)
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import Callable, List, Optional, Dict, Any
 from enum import Enum
 
 from ...common.value_objects.thread_id_vo import ThreadIdVO
@@ -200,7 +200,30 @@ class ThreadAggregate:
         """API 메시지 형식으로 변환"""
         return [msg.to_api_format() for msg in self.messages]
 
-    def get_context_messages(self, max_messages: int = 10) -> List[MessageEntity]:
-        """컨텍스트용 최근 메시지들"""
+    def get_context_messages(
+            self,
+            max_messages: int = 10,
+            max_tokens: Optional[int] = None,
+            token_counter: Optional[Callable[[str], int]] = None
+    ) -> List[MessageEntity]:
+        """컨텍스트용 최근 메시지들 (max_tokens 지정 시 최근 메시지부터 토큰 예산까지)"""
         sorted_messages = sorted(self._messages, key=lambda m: m.msg_no.value)
-        return sorted_messages[-max_messages:] if max_messages > 0 else sorted_messages
\ No newline at end of file
+        recent = sorted_messages[-max_messages:] if max_messages > 0 else sorted_messages
+        if max_tokens is None:
+            return recent
+
+        count = token_counter or self._estimate_tokens
+        selected: List[MessageEntity] = []
+        used = 0
+        for message in reversed(recent):
+            used += count(message.content.content)
+            if used > max_tokens and selected:
+                break
+            selected.append(message)
+        selected.reverse()
+        return selected
+
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        """보수적 토큰 추정 (UTF-8 3바이트당 1토큰, 한글 음절 ~= 1토큰)"""
+        return len(text.encode("utf-8")) // 3 + 4
\ No newline at end of file
@@ -1,12 +1,23 @@
 from fastapi import APIRouter, Request, Response
 from datetime import datetime
-from typing import Dict
+from typing import AsyncIterator
+import json
+import re
 
+from configuration.di_container import get_container
 from configuration.factories.logger_factory import get_logger
 from infrastructure.adapters.primary.web.common.schemas.base_schemas import ErrorResponse
 from .schemas.request_schema import CompletionRequest
-from .schemas.response_schema import CompletionResponse, CompletionResponseMeta, CompletionResponseData
-from ..common.decorators import handle_exceptions, log_request_response, validate_request, handle_gateway_integration
+from .schemas.response_schema import (
+    CompletionResponse,
+    CompletionResponseMeta,
+    CompletionResponseData,
+    CompletionStreamDone
+)
+from ..common.decorators import endpoint_pipeline
+from ..common.event_stream import EventStreamResponse, format_event
+from ..common.response_builders import ResponseBuilder
+from ..suggestion.suggestion_generator import generate_suggestion_list
 
 logger = get_logger()
 
@@ -19,16 +30,9 @@ chat_router = APIRouter(
     }
 )
 
-# 메시지 ID 카운터 (실제로는 데이터베이스나 캐시에서 관리)
-message_counters: Dict[str, int] = {}
-
-
-def get_next_message_id(thread_id: str) -> int:
-    """스레드별 다음 메시지 ID 생성"""
-    if thread_id not in message_counters:
-        message_counters[thread_id] = 0
-    message_counters[thread_id] += 1
-    return message_counters[thread_id]
+async def get_next_message_id(thread_id: str) -> int:
+    """스레드별 다음 메시지 ID 생성 (MessageSequencePort, 설정에 따라 워커 간 공유)"""
+    return await get_container().message_sequence().next_id(thread_id)
 
 
 @chat_router.post(
@@ -37,10 +41,7 @@ def get_next_message_id(thread_id: str) -> int:
     summary="LOCA앱 통합 챗봇",
     description="사용자 질문을 받아 AI가 생성한 답변을 반환합니다."
 )
-@handle_exceptions
-@log_request_response
-@validate_request
-@handle_gateway_integration
+@endpoint_pipeline
 async def process_chat(
         request_body: CompletionRequest,
         request: Request,
@@ -48,11 +49,12 @@ async def process_chat(
 ) -> CompletionResponse:
     print(request.headers)
 
-    return await _process_chat_dummy(request_body)
+    return ResponseBuilder.json_response(await _process_chat_dummy(request_body))
 
 async def _process_chat_dummy(request: CompletionRequest) -> CompletionResponse:
     answer = _generate_dummy_answer(request.user_input, request.service_id.value)
-    message_id = get_next_message_id(request.thread_id)
+    message_id = await get_next_message_id(request.thread_id)
+    _precompute_suggestions(request, message_id, answer)
 
     response = CompletionResponse(
         meta=CompletionResponseMeta(
@@ -71,6 +73,78 @@ async def _process_chat_dummy(request: CompletionRequest) -> CompletionResponse:
     return response
 
 
+@chat_router.post(
+    "/completions/stream",
+    response_class=EventStreamResponse,
+    summary="LOCA앱 통합 챗봇 (스트리밍)",
+    description="답변을 text/event-stream으로 전송합니다. "
+                "meta(thread_id, message_id) -> delta(답변 증분, 반복) -> done(전체 답변, 템플릿, 검색 문서) 순서이며 "
+                "생성 중 오류가 나면 error 이벤트로 종료합니다."
+)
+@endpoint_pipeline
+async def process_chat_stream(
+        request_body: CompletionRequest,
+        request: Request,
+        response: Response
+) -> EventStreamResponse:
+    # 요청 검증 오류는 스트림 시작 전에 일반 오류 응답으로 반환 (Gateway 헤더는 GatewayMiddleware에서 검증 / 설정)
+    meta = CompletionResponseMeta(
+        thread_id=request_body.thread_id,
+        message_id=await get_next_message_id(request_body.thread_id),
+        result_status="200",
+        result_status_message="성공",
+        timestamp=datetime.now()
+    )
+    return EventStreamResponse(_chat_event_stream(request_body, meta))
+
+
+async def _chat_event_stream(request: CompletionRequest, meta: CompletionResponseMeta) -> AsyncIterator[bytes]:
+    """meta -> delta -> done 이벤트 생성"""
+    yield format_event("meta", meta.model_dump_json())
+
+    parts = []
+    try:
+        async for delta in _stream_dummy_answer(request.user_input, request.service_id.value):
+            parts.append(delta)
+            # 증분마다 모델 검증을 거치지 않도록 직접 직렬화 (CompletionStreamDelta 형식)
+            yield format_event("delta", json.dumps({"content": delta}, ensure_ascii=False))
+
+        done = CompletionStreamDone(
+            general_answer="".join(parts),
+            general_answer_template="TBD",
+            retrieved_contents=[]
+        )
+        _precompute_suggestions(request, meta.message_id, done.general_answer)
+        yield format_event("done", done.model_dump_json())
+
+    except Exception as e:
+        # 응답 헤더가 이미 전송되었으므로 상태 코드 대신 error 이벤트로 알림
+        logger.error(f"Chat stream failed for thread_id: {request.thread_id}: {e}")
+        error_response = ResponseBuilder.build_internal_error(
+            "답변 생성 중 오류가 발생했습니다.",
+            request.thread_id
+        )
+        yield format_event("error", error_response.model_dump_json())
+
+
+def _precompute_suggestions(request: CompletionRequest, message_id: int, answer: str) -> None:
+    """답변 확정 직후 연관질문 생성을 백그라운드로 시작 (이어지는 /chat/suggestions 요청이 결과 재사용)"""
+    suggestion_store = get_container().suggestion_store()
+    if suggestion_store is None:
+        return
+    suggestion_store.schedule(
+        request.thread_id,
+        message_id,
+        generate_suggestion_list(request.service_id.value, request.user_input, answer)
+    )
+
+
+async def _stream_dummy_answer(user_input: str, service_id: str) -> AsyncIterator[str]:
+    """더미 답변을 어절 단위 증분으로 전송 (LLM 스트림 연결 전까지 사용)"""
+    for delta in re.findall(r"\S+\s*", _generate_dummy_answer(user_input, service_id)):
+        yield delta
+
+
 def _generate_dummy_answer(user_input: str, service_id: str) -> str:
     """더미 답변 생성"""
 
@@ -4,6 +4,8 @@ Chat 응답 스키마
 채팅 관련 응답 데이터 모델을 정의합니다.
 """
 
+from typing import Any, Dict, List
+
 from pydantic import BaseModel, Field
 
 from infrastructure.adapters.primary.web.common.schemas.base_schemas import (
@@ -62,4 +64,23 @@ class CompletionResponse(BaseResponse):
                     # "general_answer_template": None
                 }
             }
-        }
\ No newline at end of file
+        }
+
+
+class CompletionStreamDelta(BaseModel):
+    """스트리밍 응답 delta 이벤트 스키마"""
+
+    content: str = Field(
+        ...,
+        description="답변 증분 텍스트",
+        example="롯데카드를 "
+    )
+
+
+class CompletionStreamDone(CompletionResponseData):
+    """스트리밍 응답 done 이벤트 스키마 (전체 답변 + 템플릿 + 검색 문서)"""
+
+    retrieved_contents: List[Dict[str, Any]] = Field(
+        default_factory=list,
+        description="답변 생성에 사용한 검색 문서"
+    )
@@ -1,21 +1,77 @@
 import functools
-from typing import Callable, Any
-from fastapi import HTTPException, status, Request, Response
+import inspect
+from typing import Callable, Any, Optional
+
+from fastapi import HTTPException, Request, status
+from pydantic import BaseModel
 
 from configuration.factories.logger_factory import get_logger
+from configuration.middleware.timing_middleware import record_service_id
 from .response_builders import ResponseBuilder
+from .validators import REQUEST_FIELD_VALIDATORS
 
 logger = get_logger()
 
 
-def handle_exceptions(func: Callable) -> Callable:
+def endpoint_pipeline(func: Callable) -> Callable:
+    """엔드포인트 파이프라인 (요청 검증 -> 요청/응답 로깅 -> 오류 응답 변환)
+
+    라우터 등록 시 한 번 핸들러 시그니처를 분석해 요청 본문 / Request / Response 파라미터와
+    본문 모델에 적용할 검증기를 결정하고, 요청마다 하나의 함수로 실행합니다.
+    Gateway 헤더 검증 / 응답 헤더는 GatewayMiddleware에서 처리합니다.
+    FastAPI는 엔드포인트를 키워드 인자로만 호출합니다.
+    """
+    name = func.__name__
+    body_name: Optional[str] = None
+    request_name: Optional[str] = None
+    checks = ()
+    has_thread_id = has_service_id = False
+
+    for param in inspect.signature(func).parameters.values():
+        annotation = param.annotation
+        if not inspect.isclass(annotation):
+            continue
+        if issubclass(annotation, Request):
+            request_name = param.name
+        elif issubclass(annotation, BaseModel) and body_name is None:
+            body_name = param.name
+            fields = annotation.model_fields
+            checks = tuple(
+                (field_name, validator)
+                for field_name, validator in REQUEST_FIELD_VALIDATORS.items()
+                if field_name in fields
+            )
+            has_thread_id = "thread_id" in fields
+            has_service_id = "service_id" in fields
+
     @functools.wraps(func)
-    async def wrapper(*args, **kwargs) -> Any:
+    async def wrapper(**kwargs) -> Any:
+        body = kwargs[body_name] if body_name else None
+        thread_id = body.thread_id if has_thread_id else None
+
         try:
-            return await func(*args, **kwargs)
+            for field_name, validator in checks:
+                validator(getattr(body, field_name))
+
+            if has_service_id and request_name:
+                record_service_id(kwargs[request_name], body.service_id.value)
+
+            if thread_id:
+                logger.info(f"Processing {name} request for thread_id: {thread_id}")
+            else:
+                logger.info(f"Processing {name} request")
+
+            result = await func(**kwargs)
+
+            if thread_id:
+                logger.info(f"Completed {name} for thread_id: {thread_id}")
+            else:
+                logger.info(f"Completed {name}")
+            return result
+
         except ValueError as e:
-            logger.error(f"Validation error in {func.__name__}: {e}")
-            error_response = ResponseBuilder.build_validation_error(str(e))
+            logger.error(f"Validation error in {name}: {e}")
+            error_response = ResponseBuilder.build_validation_error(str(e), thread_id)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=error_response.model_dump()
@@ -23,7 +79,7 @@ def handle_exceptions(func: Callable) -> Callable:
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Unexpected error in {func.__name__}: {e}")
+            logger.error(f"Unexpected error in {name}: {e}")
             error_response = ResponseBuilder.build_internal_error(
                 "처리 중 예상치 못한 오류가 발생했습니다."
             )
@@ -33,125 +89,3 @@ def handle_exceptions(func: Callable) -> Callable:
             )
 
     return wrapper
-
-
-def log_request_response(func: Callable) -> Callable:
-    """요청/응답 로깅 데코레이터"""
-
-    @functools.wraps(func)
-    async def wrapper(*args, **kwargs) -> Any:
-        # 요청 로깅
-        request = None
-        for arg in args:
-            if hasattr(arg, 'thread_id'):
-                request = arg
-                break
-
-        if request:
-            logger.info(f"Processing {func.__name__} request for thread_id: {request.thread_id}")
-        else:
-            logger.info(f"Processing {func.__name__} request")
-
-        # 함수 실행
-        result = await func(*args, **kwargs)
-
-        # 응답 로깅
-        if request:
-            logger.info(f"Completed {func.__name__} for thread_id: {request.thread_id}")
-        else:
-            logger.info(f"Completed {func.__name__}")
-
-        return result
-
-    return wrapper
-
-
-def validate_request(func: Callable) -> Callable:
-    """요청 데이터 검증 데코레이터"""
-
-    @functools.wraps(func)
-    async def wrapper(*args, **kwargs) -> Any:
-        # 요청 객체 찾기
-        request = None
-        for arg in args:
-            if hasattr(arg, 'thread_id') and hasattr(arg, 'user_id'):
-                request = arg
-                break
-
-        if request:
-            # 공통 검증 수행
-            from .validators import validate_thread_id, validate_user_id, validate_service_id
-
-            validate_thread_id(request.thread_id)
-            validate_user_id(request.user_id)
-            validate_service_id(request.service_id.value)
-
-        return await func(*args, **kwargs)
-
-    return wrapper
-
-
-def handle_gateway_integration(func):
-    """API Gateway 통합 처리 데코레이터"""
-    @functools.wraps(func)
-    async def wrapper(*args, **kwargs):
-        # 1. args에서 찾기
-        for arg in args:
-            if isinstance(arg, Request):
-                request = arg
-                logger.info(f"Found Request in args: {type(arg)}")
-            elif isinstance(arg, Response):
-                response = arg
-                logger.info(f"Found Response in args: {type(arg)}")
-
-        # 2. kwargs에서 찾기 (FastAPI dependency injection 경우)
-        for key, value in kwargs.items():
-            if isinstance(value, Request):
-                request = value
-                logger.info(f"Found Request in kwargs[{key}]: {type(value)}")
-            elif isinstance(value, Response):
-                response = value
-                logger.info(f"Found Response in kwargs[{key}]: {type(value)}")
-
-        if not request:
-            logger.error("No Request object found!")
-            logger.error(f"  Args: {[type(arg) for arg in args]}")
-            logger.error(f"  Kwargs: {[(k, type(v)) for k, v in kwargs.items()]}")
-
-        gateway_info = None
-        if request:
-            logger.info("Starting Gateway header extraction...")
-            from .gateway.schemas.gateway_middleware import GatewayProcessor
-            try:
-                gateway_info = await GatewayProcessor.extract_gateway_header(request)
-                logger.info(f"Gateway header extracted successfully: {gateway_info}")
-            except ValueError as e:
-                logger.error(f"Gateway validation failed: {e}")
-                # ValueError를 그대로 전파하여 handle_exceptions에서 처리하도록 함
-                raise
-            except Exception as e:
-                logger.error(f"Unexpected error during Gateway extraction: {e}")
-                import traceback
-                logger.error(traceback.format_exc())
-                raise
-        else:
-            logger.warning("⚠No request object found, skipping Gateway extraction")
-
-        # 원본 함수 실행
-        logger.info("📞 Calling original function...")
-        result = await func(*args, **kwargs)
-        logger.info("Original function completed")
-
-        # 응답 헤더에 Gateway 정보 설정
-        if response and gateway_info:
-            logger.info("Setting response headers...")
-            from .gateway.schemas.gateway_middleware import GatewayProcessor
-            GatewayProcessor.set_response_headers(response, gateway_info)
-            logger.info("Response headers set")
-        else:
-            logger.warning(f"Skipping response headers - Response: {bool(response)}, Gateway: {bool(gateway_info)}")
-
-        logger.info("GATEWAY DECORATOR FINISHED")
-        return result
-
-    return wrapper
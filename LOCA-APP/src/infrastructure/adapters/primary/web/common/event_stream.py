@@ -0,0 +1,29 @@
+"""
+웹 어댑터 공통 SSE 응답
+
+text/event-stream 프레임 인코딩과 스트리밍 응답 클래스를 제공합니다.
+"""
+
+from typing import Any, Dict, Optional
+
+from fastapi.responses import StreamingResponse
+
+# 프록시 / 게이트웨이가 이벤트를 모아 보내지 않도록 버퍼링 비활성화
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",
+}
+
+
+def format_event(event: str, data: str) -> bytes:
+    """SSE 프레임 인코딩 (data는 한 줄 JSON 문자열)"""
+    return f"event: {event}\ndata: {data}\n\n".encode("utf-8")
+
+
+class EventStreamResponse(StreamingResponse):
+    """SSE 스트리밍 응답"""
+
+    media_type = "text/event-stream"
+
+    def __init__(self, content: Any, headers: Optional[Dict[str, str]] = None, **kwargs):
+        super().__init__(content, headers={**SSE_HEADERS, **(headers or {})}, **kwargs)
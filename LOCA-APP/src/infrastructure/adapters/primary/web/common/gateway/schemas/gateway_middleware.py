@@ -1,5 +1,5 @@
 from fastapi import Request, Response
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, List, Tuple
 import json
 import asyncio
 
@@ -9,6 +9,20 @@ from configuration.settings.app_settings import get_settings
 
 logger = get_logger()
 
+# Gateway 공통(COMM) 필드
+GATEWAY_FIELDS = ("GUID", "SRC_SYS_CD", "STC_BIZ_CDD", "GRAM_PRG_NO", "GRAN_NO", "TSMT")
+
+# ASGI 원시 헤더 이름(소문자 바이트) -> 필드명
+_RAW_HEADER_FIELDS = {field.lower().encode("latin-1"): field for field in GATEWAY_FIELDS}
+
+# GatewayMiddleware가 검증한 헤더를 저장하는 request.state 키
+GATEWAY_STATE_KEY = "gateway_header"
+
+
+def get_gateway_header(request: Request) -> Optional[GatewayHeader]:
+    """GatewayMiddleware가 파싱해 둔 Gateway 헤더 (미들웨어 적용 경로가 아니면 None)"""
+    return getattr(request.state, GATEWAY_STATE_KEY, None)
+
 
 class GatewayProcessor:
     """설정 기반 API Gateway 요청/응답 처리기"""
@@ -36,18 +50,19 @@ class GatewayProcessor:
                 if (settings.gateway.body_mode and
                         not cls._has_required_fields(gateway_data, settings)):
                     body_data = await cls._extract_from_body(request, settings)
-                    if body_data:
-                        gateway_data.update({k: v for k, v in body_data.items()
-                                             if k not in gateway_data or not gateway_data[k]})
+                    cls.merge_body_data(gateway_data, body_data)
 
         except asyncio.TimeoutError:
             logger.warning(f"Gateway info extraction timeout after {settings.gateway.extraction_timeout}s")
         except Exception as e:
             logger.error(f"Failed to extract gateway info: {e}")
 
-        # ✅ 3. 최종 필수 필드 검증 (더 강력하게)
-        logger.debug(f"Final gateway_data before validation: {gateway_data}")
+        return cls.build_gateway_header(gateway_data, settings)
 
+    @classmethod
+    def build_gateway_header(cls, gateway_data: Dict[str, str], settings) -> GatewayHeader:
+        """추출한 필드 검증 후 GatewayHeader 생성 (필수 필드 누락 시 ValueError)"""
+        # ✅ 3. 최종 필수 필드 검증 (더 강력하게, 요청마다 실행되므로 성공 경로에서는 로그를 남기지 않음)
         if not cls._validate_required_fields(gateway_data, settings):
             missing_fields = []
             required_fields = ["GUID", "SRC_SYS_CD", "STC_BIZ_CDD", "GRAM_PRG_NO", "GRAN_NO", "TSMT"]
@@ -65,6 +80,39 @@ class GatewayProcessor:
         # 4. 검증 통과 후 GatewayHeader 생성
         return cls._create_gateway_header(gateway_data, settings)
 
+    @staticmethod
+    def extract_from_raw_headers(raw_headers: Iterable[Tuple[bytes, bytes]]) -> Dict[str, str]:
+        """ASGI scope 헤더(소문자 바이트 목록)에서 Gateway 정보 추출 (Request 객체 생성 없이 한 번 순회)"""
+        extracted: Dict[str, str] = {}
+        for name, value in raw_headers:
+            field = _RAW_HEADER_FIELDS.get(name)
+            # 중복 헤더는 첫 값 사용 (Request.headers.get과 동일)
+            if field is not None and field not in extracted:
+                extracted[field] = value.decode("latin-1")
+        for field in GATEWAY_FIELDS:
+            extracted.setdefault(field, "")
+        return extracted
+
+    @staticmethod
+    def parse_body_comm(body: bytes, settings) -> Optional[Dict[str, Any]]:
+        """요청 바디 JSON의 COMM 필드 추출"""
+        if not body or len(body) > settings.gateway.max_body_size:
+            return None
+        try:
+            data = json.loads(body)
+            comm = data.get('COMM', {}) if isinstance(data, dict) else {}
+            return comm if isinstance(comm, dict) else None
+        except Exception as e:
+            logger.warning(f"Failed to parse gateway info from body: {e}")
+            return None
+
+    @staticmethod
+    def merge_body_data(gateway_data: Dict[str, str], body_data: Optional[Dict[str, Any]]) -> None:
+        """바디 값으로 비어 있는 헤더 값 보충"""
+        if body_data:
+            gateway_data.update({k: v for k, v in body_data.items()
+                                 if k not in gateway_data or not gateway_data[k]})
+
     @staticmethod
     def _extract_from_headers(request: Request) -> Dict[str, str]:
         """HTTP 헤더에서 Gateway 정보 추출"""
@@ -75,19 +123,15 @@ class GatewayProcessor:
         logger.debug(f"Header extraction result: {extracted}")
         return extracted
 
-    @staticmethod
-    async def _extract_from_body(request: Request, settings) -> Optional[Dict[str, Any]]:
+    @classmethod
+    async def _extract_from_body(cls, request: Request, settings) -> Optional[Dict[str, Any]]:
         """요청 바디에서 Gateway 정보 추출"""
         try:
             body = await request.body()
-            if not body or len(body) > settings.gateway.max_body_size:
-                return None
-
-            data = json.loads(body)
-            return data.get('COMM', {})
         except Exception as e:
             logger.warning(f"Failed to parse gateway info from body: {e}")
             return None
+        return cls.parse_body_comm(body, settings)
 
     @staticmethod
     def _has_required_fields(data: Dict[str, str], settings) -> bool:
@@ -126,7 +170,6 @@ class GatewayProcessor:
                 logger.error(f"Missing required field: {field}, value: '{value}'")
                 return False
 
-        logger.debug("All required fields present")
         return True
 
     @classmethod
@@ -165,6 +208,15 @@ class GatewayProcessor:
             tsmt=""
         )
 
+    @staticmethod
+    def response_header_items(header: GatewayHeader) -> List[Tuple[bytes, bytes]]:
+        """ASGI http.response.start에 추가할 원시 응답 헤더 (값이 있는 필드만)"""
+        return [
+            (key.lower().encode("latin-1"), str(value).encode("latin-1"))
+            for key, value in header.to_header_dict().items()
+            if value
+        ]
+
     @classmethod
     def set_response_headers(cls, response: Response, header: GatewayHeader):
         """응답 헤더에 Gateway 정보 설정"""
@@ -1,14 +1,46 @@
 """
 웹 어댑터 공통 응답 빌더
 
-표준화된 응답을 빌드하는 헬퍼 함수들을 제공합니다.
+표준화된 응답을 빌드하는 헬퍼 함수들과 빠른 JSON 응답 경로를 제공합니다.
 """
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+
 from infrastructure.adapters.primary.web.common.schemas.base_schemas import ErrorResponse
 
 
+@lru_cache(maxsize=None)
+def _type_adapter(tp: type) -> TypeAdapter:
+    """타입별 TypeAdapter (생성 비용이 크므로 프로세스당 한 번만 생성)"""
+    return TypeAdapter(tp)
+
+
+def encode_json(content: Any) -> bytes:
+    """JSON 바이트 직렬화 (pydantic-core 직렬화기 사용, 중간 dict / json.dumps 생략)
+
+    모델은 클래스 정의 시 생성된 직렬화기를, 그 외 값은 캐시된 TypeAdapter를 사용합니다.
+    """
+    if isinstance(content, BaseModel):
+        return content.__pydantic_serializer__.to_json(content)
+    return _type_adapter(type(content)).dump_json(content)
+
+
+class FastJSONResponse(JSONResponse):
+    """이미 검증된 응답 모델을 바로 직렬화하는 JSON 응답
+
+    엔드포인트가 Response를 반환하면 FastAPI는 response_model 재검증 / 직렬화를 건너뜁니다
+    (response_model은 OpenAPI 문서용으로만 사용).
+    """
+
+    def render(self, content: Any) -> bytes:
+        return encode_json(content)
+
+
 class ResponseBuilder:
     """공통 응답 빌드 헬퍼 클래스"""
     @staticmethod
@@ -30,6 +62,15 @@ class ResponseBuilder:
 
         return meta_data
 
+    @staticmethod
+    def json_response(
+            content: Any,
+            status_code: int = 200,
+            headers: Optional[Dict[str, str]] = None
+    ) -> FastJSONResponse:
+        """검증된 응답 모델(또는 JSON 직렬화 가능한 값)을 JSON 응답으로 변환"""
+        return FastJSONResponse(content, status_code=status_code, headers=headers)
+
     @staticmethod
     def build_error_response(
             error_code: str,
@@ -8,6 +8,9 @@ import re
 from typing import Optional
 from infrastructure.adapters.primary.web.common.schemas.base_schemas import ServiceId
 
+_THREAD_ID_PATTERN = re.compile(r'[a-zA-Z0-9_-]+')
+_USER_ID_PATTERN = re.compile(r'[a-zA-Z0-9_]+')
+
 
 def validate_thread_id(thread_id: str) -> str:
     """Thread ID 검증"""
@@ -18,7 +21,7 @@ def validate_thread_id(thread_id: str) -> str:
         raise ValueError("thread_id는 50자를 초과할 수 없습니다.")
 
     # 영문, 숫자, 언더스코어, 하이픈만 허용
-    if not re.match(r'^[a-zA-Z0-9_-]+$', thread_id):
+    if not _THREAD_ID_PATTERN.fullmatch(thread_id):
         raise ValueError("thread_id는 영문, 숫자, 언더스코어, 하이픈만 포함할 수 있습니다.")
 
     return thread_id
@@ -33,7 +36,7 @@ def validate_user_id(user_id: str) -> str:
         raise ValueError("user_id는 20자를 초과할 수 없습니다.")
 
     # 영문, 숫자, 언더스코어만 허용
-    if not re.match(r'^[a-zA-Z0-9_]+$', user_id):
+    if not _USER_ID_PATTERN.fullmatch(user_id):
         raise ValueError("user_id는 영문, 숫자, 언더스코어만 포함할 수 있습니다.")
 
     return user_id
@@ -71,4 +74,12 @@ def validate_message_id(message_id: Optional[int]) -> Optional[int]:
     if message_id < 1:
         raise ValueError("message_id는 1 이상이어야 합니다.")
 
-    return message_id
\ No newline at end of file
+    return message_id
+
+
+# 엔드포인트 파이프라인이 요청 본문 필드에 적용하는 검증기
+# (service_id는 ServiceId Enum으로 Pydantic이 이미 검증하므로 제외)
+REQUEST_FIELD_VALIDATORS = {
+    "thread_id": validate_thread_id,
+    "user_id": validate_user_id,
+}
@@ -1,11 +1,13 @@
 from fastapi import APIRouter, HTTPException, status, Request, Response
-from typing import List
+from typing import List, Optional
 
+from configuration.di_container import get_container
 from configuration.factories.logger_factory import get_logger
 from .schemas.request_schema import SuggestionRequest
 from .schemas.response_schema import SuggestionResponse
-from ..common.decorators import handle_exceptions, log_request_response, validate_request, handle_gateway_integration
+from ..common.decorators import endpoint_pipeline
 from ..common.response_builders import ResponseBuilder
+from .suggestion_generator import generate_suggestion_list
 
 logger = get_logger()
 
@@ -21,10 +23,7 @@ suggestion_router = APIRouter(
     summary="연관질문 생성",
     description="사용자의 질문과 대화 컨텍스트를 바탕으로 연관질문을 생성합니다."
 )
-@handle_exceptions
-@log_request_response
-@validate_request
-@handle_gateway_integration
+@endpoint_pipeline
 async def generate_suggestions(
         request_body: SuggestionRequest,
         request: Request,
@@ -33,7 +32,10 @@ async def generate_suggestions(
     try:
         logger.info(f"Generating suggestions for thread_id: {request_body.thread_id}, message_id: {request_body.message_id}")
 
-        dummy_suggestions = _generate_dummy_suggestions()
+        # 답변 직후 선계산된 결과 우선 사용 (진행 중이면 완료까지 대기)
+        suggestions = await _precomputed_suggestions(request_body)
+        if suggestions is None:
+            suggestions = await generate_suggestion_list(request_body.service_id.value)
 
         meta_data = ResponseBuilder.build_success_meta(
             thread_id=request_body.thread_id,
@@ -44,12 +46,12 @@ async def generate_suggestions(
         response = SuggestionResponse(
             meta=meta_data,
             data={
-                "suggestions": dummy_suggestions
+                "suggestions": suggestions
             }
         )
 
-        logger.info(f"Generated {len(dummy_suggestions)} suggestions for thread_id: {request_body.thread_id}")
-        return response
+        logger.info(f"Generated {len(suggestions)} suggestions for thread_id: {request_body.thread_id}")
+        return ResponseBuilder.json_response(response)
 
     except Exception as e:
         logger.error(f"Failed to generate suggestions: {e}")
@@ -63,13 +65,9 @@ async def generate_suggestions(
         )
 
 
-def _generate_dummy_suggestions() -> List[str]:
-    # 사용자 입력에 따른 더미 연관질문 생성
-    base_suggestions = [
-        "다른 혜택도 있나요?",
-        "신청 방법을 알려주세요",
-        "자세한 조건이 궁금합니다",
-        "언제까지 이용할 수 있나요?"
-    ]
-
-    return base_suggestions
+async def _precomputed_suggestions(request: SuggestionRequest) -> Optional[List[str]]:
+    """선계산 저장소 조회 (비활성화 / 미적중이면 None)"""
+    suggestion_store = get_container().suggestion_store()
+    if suggestion_store is None:
+        return None
+    return await suggestion_store.get(request.thread_id, request.message_id)
@@ -0,0 +1,24 @@
+"""
+연관질문 생성
+
+/chat/suggestions 요청 처리와 답변 직후 선계산(chat 컨트롤러)에서 함께 사용합니다.
+"""
+
+from typing import List, Optional
+
+
+async def generate_suggestion_list(
+        service_id: str,
+        user_input: Optional[str] = None,
+        answer: Optional[str] = None
+) -> List[str]:
+    """질문 / 답변 컨텍스트 기반 연관질문 생성 (현재는 더미 구현 - 추후 LLM 호출로 대체 예정)"""
+    # 사용자 입력에 따른 더미 연관질문 생성
+    base_suggestions = [
+        "다른 혜택도 있나요?",
+        "신청 방법을 알려주세요",
+        "자세한 조건이 궁금합니다",
+        "언제까지 이용할 수 있나요?"
+    ]
+
+    return base_suggestions
@@ -4,10 +4,11 @@ import json
 import uuid
 from typing import Optional, Dict, Any
 
+from configuration.di_container import get_container
 from configuration.factories.logger_factory import get_logger
-from infrastructure.adapters.primary.web.common.decorators import handle_exceptions, log_request_response, \
-    validate_request
+from infrastructure.adapters.primary.web.common.decorators import endpoint_pipeline
 from infrastructure.adapters.primary.web.common.schemas.base_schemas import ErrorResponse
+from infrastructure.adapters.primary.web.common.response_builders import ResponseBuilder
 from infrastructure.adapters.primary.web.upload.schemas.request_schema import UploadRequest, UploadOperation
 from infrastructure.adapters.primary.web.upload.schemas.response_schema import UploadResponse, UploadData, \
     UploadResponseMeta
@@ -30,9 +31,7 @@ upload_router = APIRouter(
                     response_model=UploadResponse,
                     summary="LOCA앱 Elasticsearch 문서 업로드",
                     description="Elasticsearch 인덱스에 문서를 적재/수정/삭제합니다.")
-@handle_exceptions
-@log_request_response
-@validate_request
+@endpoint_pipeline
 async def upload_document(
         file: Optional[UploadFile] = File(None, description="적재 파일"),
         request: UploadRequest = Form(...)
@@ -71,8 +70,11 @@ async def upload_document(
             file_info=file_info
         )
 
+        # 인덱스 문서가 변경되었으므로 해당 인덱스 기반 캐시 답변 무효화
+        _invalidate_answer_cache(request.index_name)
+
         logger.info(f"Upload processing completed for index: {request.index_name}, document_id: {response_data.data.document_id}")
-        return response_data
+        return ResponseBuilder.json_response(response_data)
 
     except ValueError as e:
         logger.error(f"Validation error: {e}")
@@ -96,6 +98,13 @@ async def upload_document(
         )
 
 
+def _invalidate_answer_cache(index_name: str) -> None:
+    """의미 기반 답변 캐시에서 변경된 인덱스의 답변 제거"""
+    answer_cache = get_container().answer_cache()
+    if answer_cache:
+        answer_cache.invalidate_index(index_name)
+
+
 async def _process_upload_dummy(
         file: Optional[UploadFile],
         request: UploadRequest,
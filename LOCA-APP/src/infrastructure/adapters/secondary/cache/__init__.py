@@ -0,0 +1,7 @@
+from .semantic_answer_cache import InMemorySemanticAnswerCache
+from .suggestion_store import InMemorySuggestionStore
+
+__all__ = [
+    "InMemorySemanticAnswerCache",
+    "InMemorySuggestionStore"
+]
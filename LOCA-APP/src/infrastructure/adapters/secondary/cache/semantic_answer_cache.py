@@ -0,0 +1,169 @@
+"""
+인메모리 의미 기반 답변 캐시
+
+service_id별로 정규화된 임베딩 행렬(float32 또는 int8)을 유지하고
+코사인 유사도 top-1이 임계값 이상이면 이전 답변을 반환합니다.
+"""
+
+import time
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from application.ports.secondary.answer_cache_port import AnswerCachePort, AnswerCacheHit, CachedAnswer
+from configuration.factories.logger_factory import get_logger
+
+logger = get_logger()
+
+_INT8_SCALE = 127.0
+
+
+class _ServicePartition:
+    """서비스 하나의 임베딩 행렬과 답변 목록"""
+
+    def __init__(self, dimension: int, quantize: bool, initial_capacity: int = 64):
+        self.dimension = dimension
+        self.quantize = quantize
+        self.matrix = np.zeros((initial_capacity, dimension), dtype=np.int8 if quantize else np.float32)
+        self.expires_at = np.zeros(initial_capacity, dtype=np.float64)
+        self.answers: List[CachedAnswer] = []
+
+    @property
+    def size(self) -> int:
+        return len(self.answers)
+
+    def add(self, vector: np.ndarray, answer: CachedAnswer, expires_at: float) -> None:
+        if self.size == self.matrix.shape[0]:
+            self._grow()
+        row = self.size
+        self.matrix[row] = self._encode(vector)
+        self.expires_at[row] = expires_at
+        self.answers.append(answer)
+
+    def remove(self, row: int) -> None:
+        """마지막 행과 교체 후 제거 (O(1))"""
+        last = self.size - 1
+        if row != last:
+            self.matrix[row] = self.matrix[last]
+            self.expires_at[row] = self.expires_at[last]
+            self.answers[row] = self.answers[last]
+        self.answers.pop()
+
+    def top1(self, vector: np.ndarray, now: float) -> Optional[tuple]:
+        n = self.size
+        if n == 0:
+            return None
+        scores = self.matrix[:n] @ vector
+        if self.quantize:
+            scores = scores / _INT8_SCALE
+        scores[self.expires_at[:n] <= now] = -np.inf
+        row = int(np.argmax(scores))
+        return row, float(scores[row])
+
+    def oldest_row(self) -> int:
+        return int(np.argmin(self.expires_at[:self.size]))
+
+    def _encode(self, vector: np.ndarray) -> np.ndarray:
+        if self.quantize:
+            return np.clip(np.rint(vector * _INT8_SCALE), -127, 127).astype(np.int8)
+        return vector
+
+    def _grow(self) -> None:
+        capacity = self.matrix.shape[0] * 2
+        matrix = np.zeros((capacity, self.dimension), dtype=self.matrix.dtype)
+        matrix[:self.size] = self.matrix[:self.size]
+        expires_at = np.zeros(capacity, dtype=np.float64)
+        expires_at[:self.size] = self.expires_at[:self.size]
+        self.matrix = matrix
+        self.expires_at = expires_at
+
+
+class InMemorySemanticAnswerCache(AnswerCachePort):
+    """service_id 파티션 기반 인메모리 의미 캐시"""
+
+    def __init__(
+            self,
+            similarity_threshold: float = 0.92,
+            max_entries_per_service: int = 5000,
+            ttl_seconds: float = 3600.0,
+            quantize_int8: bool = False
+    ):
+        self._threshold = similarity_threshold
+        self._max_entries = max_entries_per_service
+        self._ttl = ttl_seconds
+        self._quantize = quantize_int8
+        self._partitions: Dict[str, _ServicePartition] = {}
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "invalidations": 0}
+
+    def lookup(self, service_id: str, query_embedding: Sequence[float]) -> Optional[AnswerCacheHit]:
+        partition = self._partitions.get(service_id)
+        if partition is None:
+            self._stats["misses"] += 1
+            return None
+
+        result = partition.top1(self._normalize(query_embedding, partition.dimension), time.time())
+        if result is None or result[1] < self._threshold:
+            self._stats["misses"] += 1
+            return None
+
+        row, similarity = result
+        self._stats["hits"] += 1
+        return AnswerCacheHit(answer=partition.answers[row], similarity=similarity)
+
+    def store(self, service_id: str, query_embedding: Sequence[float], answer: CachedAnswer) -> None:
+        vector = self._normalize(query_embedding)
+        partition = self._partitions.get(service_id)
+        if partition is None:
+            partition = _ServicePartition(vector.shape[0], self._quantize)
+            self._partitions[service_id] = partition
+        elif partition.dimension != vector.shape[0]:
+            raise ValueError(
+                f"Embedding dimension mismatch for {service_id}: "
+                f"expected {partition.dimension}, got {vector.shape[0]}"
+            )
+
+        if partition.size >= self._max_entries:
+            partition.remove(partition.oldest_row())
+
+        partition.add(vector, answer, time.time() + self._ttl)
+        self._stats["stores"] += 1
+
+    def invalidate_index(self, index_name: str) -> int:
+        removed = 0
+        for partition in self._partitions.values():
+            # 역순으로 제거해야 교체된 행을 다시 검사하지 않음
+            for row in range(partition.size - 1, -1, -1):
+                index_names = partition.answers[row].index_names
+                # 출처 인덱스를 알 수 없는 답변은 보수적으로 함께 제거
+                if not index_names or index_name in index_names:
+                    partition.remove(row)
+                    removed += 1
+
+        self._stats["invalidations"] += removed
+        logger.info(f"Semantic answer cache invalidated for index '{index_name}': {removed} entries")
+        return removed
+
+    def invalidate_all(self) -> int:
+        removed = sum(partition.size for partition in self._partitions.values())
+        self._partitions.clear()
+        self._stats["invalidations"] += removed
+        return removed
+
+    def stats(self) -> Dict[str, int]:
+        """캐시 통계 (서비스별 항목 수 포함)"""
+        return {
+            **self._stats,
+            "entries": {service_id: p.size for service_id, p in self._partitions.items()}
+        }
+
+    @staticmethod
+    def _normalize(embedding: Sequence[float], dimension: Optional[int] = None) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        if vector.ndim != 1:
+            raise ValueError("Embedding must be a 1-D vector")
+        if dimension is not None and vector.shape[0] != dimension:
+            raise ValueError(f"Embedding dimension mismatch: expected {dimension}, got {vector.shape[0]}")
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            raise ValueError("Embedding must not be a zero vector")
+        return vector / norm
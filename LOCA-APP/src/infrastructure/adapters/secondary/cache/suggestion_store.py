@@ -0,0 +1,106 @@
+"""
+인메모리 연관질문 선계산 저장소
+
+(thread_id, message_id)별 생성 태스크를 보관합니다. 항목 수(max_entries)와 보관 시간(ttl_seconds)으로
+크기를 제한하며, 프로세스 단위이므로 다른 워커로 간 요청은 선계산 결과 없이 직접 생성합니다.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Coroutine, Dict, List, Optional, Tuple
+
+from application.ports.secondary.suggestion_store_port import SuggestionStorePort
+from configuration.factories.logger_factory import get_logger
+
+logger = get_logger()
+
+_Key = Tuple[str, int]
+
+
+class InMemorySuggestionStore(SuggestionStorePort):
+    """TTL / 최대 항목 수 제한 연관질문 태스크 저장소"""
+
+    def __init__(self, max_entries: int = 10_000, ttl_seconds: float = 300.0):
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        # 키 -> (만료 시각, 생성 태스크), 삽입 순서 = 만료 순서 (TTL 고정)
+        self._entries: "OrderedDict[_Key, Tuple[float, asyncio.Task]]" = OrderedDict()
+        self._scheduled = 0
+        self._hits = 0
+        self._inflight_hits = 0
+        self._misses = 0
+        self._failures = 0
+        self._evictions = 0
+
+    def schedule(self, thread_id: str, message_id: int, generation: Coroutine[Any, Any, List[str]]) -> None:
+        key = (thread_id, message_id)
+        now = time.monotonic()
+        self._purge_expired(now)
+
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            previous[1].cancel()
+
+        task = asyncio.create_task(generation)
+        task.add_done_callback(self._on_done)
+        self._entries[key] = (now + self._ttl_seconds, task)
+        self._scheduled += 1
+
+        while len(self._entries) > self._max_entries:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            evicted.cancel()
+            self._evictions += 1
+
+    async def get(self, thread_id: str, message_id: int) -> Optional[List[str]]:
+        entry = self._entries.get((thread_id, message_id))
+        if entry is None or entry[0] <= time.monotonic():
+            self._misses += 1
+            return None
+
+        task = entry[1]
+        if task.done():
+            self._hits += 1
+        else:
+            self._inflight_hits += 1
+        try:
+            # 요청이 취소되어도 다른 요청이 결과를 쓸 수 있도록 생성 태스크는 유지
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if task.cancelled():
+                return None
+            raise
+        except Exception:
+            return None
+
+    def _on_done(self, task: asyncio.Task) -> None:
+        # 결과를 조회하지 않은 태스크의 예외가 "never retrieved" 경고로 남지 않도록 여기서 확인
+        if not task.cancelled() and task.exception() is not None:
+            self._failures += 1
+            logger.warning(f"Suggestion precomputation failed: {task.exception()}")
+
+    def _purge_expired(self, now: float) -> None:
+        while self._entries:
+            key, (expires_at, task) = next(iter(self._entries.items()))
+            if expires_at > now:
+                break
+            del self._entries[key]
+            task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self._max_entries,
+            "ttl_seconds": self._ttl_seconds,
+            "scheduled": self._scheduled,
+            "hits": self._hits,
+            "inflight_hits": self._inflight_hits,
+            "misses": self._misses,
+            "failures": self._failures,
+            "evictions": self._evictions
+        }
+
+    def close(self) -> None:
+        for _, task in self._entries.values():
+            task.cancel()
+        self._entries.clear()
@@ -0,0 +1,7 @@
+from .in_memory_message_sequence import InMemoryMessageSequence
+from .sqlite_message_sequence import SqliteMessageSequence
+
+__all__ = [
+    "InMemoryMessageSequence",
+    "SqliteMessageSequence"
+]
@@ -0,0 +1,41 @@
+"""
+인메모리 메시지 ID 시퀀스
+
+프로세스 안에서만 유효합니다 (단일 워커 / 개발 환경용).
+추적 스레드 수가 max_threads를 넘으면 가장 오래 사용하지 않은 스레드부터 제거합니다.
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict
+
+from application.ports.secondary.message_sequence_port import MessageSequencePort
+
+
+class InMemoryMessageSequence(MessageSequencePort):
+    """LRU로 크기가 제한된 스레드별 카운터
+
+    제거된 스레드에 다시 요청이 오면 1부터 다시 발급하므로,
+    max_threads는 대화가 이어질 수 있는 스레드 수보다 충분히 크게 잡아야 합니다.
+    """
+
+    def __init__(self, max_threads: int = 100_000):
+        self._max_threads = max_threads
+        self._counters: "OrderedDict[str, int]" = OrderedDict()
+        self._evictions = 0
+
+    async def next_id(self, thread_id: str) -> int:
+        # 이벤트 루프 스레드에서만 호출되고 await가 없으므로 잠금 불필요
+        value = self._counters.pop(thread_id, 0) + 1
+        self._counters[thread_id] = value
+        if len(self._counters) > self._max_threads:
+            self._counters.popitem(last=False)
+            self._evictions += 1
+        return value
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": "memory",
+            "threads": len(self._counters),
+            "max_threads": self._max_threads,
+            "evictions": self._evictions
+        }
@@ -0,0 +1,118 @@
+"""
+SQLite(WAL) 기반 메시지 ID 시퀀스
+
+같은 호스트의 여러 uvicorn 워커가 하나의 SQLite 파일을 공유해 중복 없는 message_id를 발급합니다.
+block_size > 1이면 스레드별로 ID 구간을 미리 예약해 두고 프로세스 안에서 소진하므로
+대부분의 발급이 공유 저장소를 거치지 않습니다.
+"""
+
+import asyncio
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List
+
+from application.ports.secondary.message_sequence_port import MessageSequencePort
+from configuration.factories.logger_factory import get_logger
+
+logger = get_logger()
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS message_sequence (
+    thread_id TEXT PRIMARY KEY,
+    last_id INTEGER NOT NULL
+) WITHOUT ROWID
+"""
+
+# 단일 문장(autocommit)으로 예약 구간을 원자적으로 증가시키고 새 상한을 반환
+_RESERVE = """
+INSERT INTO message_sequence (thread_id, last_id) VALUES (?, ?)
+ON CONFLICT (thread_id) DO UPDATE SET last_id = last_id + excluded.last_id
+RETURNING last_id
+"""
+
+
+class SqliteMessageSequence(MessageSequencePort):
+    """SQLite(WAL) 공유 카운터 + 프로세스별 구간 예약
+
+    - block_size=1: 매 발급마다 공유 저장소 접근, 스레드 안에서 발급 순서 = ID 순서
+    - block_size>1: 워커마다 별도 구간을 소진하므로 같은 스레드의 요청이 여러 워커로 분산되면
+      ID가 발급 순서와 다를 수 있음 (중복은 없음, 사용하지 않은 구간은 건너뜀)
+    - synchronous=NORMAL: 전원 장애 시 마지막 커밋이 유실될 수 있음 (프로세스 장애에는 안전)
+    """
+
+    def __init__(
+            self,
+            path: str,
+            block_size: int = 1,
+            max_cached_threads: int = 100_000,
+            busy_timeout: float = 5.0
+    ):
+        if block_size < 1:
+            raise ValueError("block_size must be >= 1")
+        self._path = path
+        self._block_size = block_size
+        self._max_cached_threads = max_cached_threads
+        # 스레드별 예약 구간 [다음 ID, 상한]
+        self._blocks: "OrderedDict[str, List[int]]" = OrderedDict()
+        self._refills: Dict[str, asyncio.Task] = {}
+        self._reservations = 0
+        self._issued = 0
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=busy_timeout, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_CREATE_TABLE)
+        # 연결 하나를 실행기 스레드들이 공유하므로 직렬화
+        self._conn_lock = threading.Lock()
+        logger.info(f"SQLite message sequence opened: {path} (block_size={block_size})")
+
+    async def next_id(self, thread_id: str) -> int:
+        self._issued += 1
+        while True:
+            block = self._blocks.get(thread_id)
+            if block is not None and block[0] <= block[1]:
+                self._blocks.move_to_end(thread_id)
+                value = block[0]
+                block[0] += 1
+                return value
+
+            # 같은 스레드의 동시 요청은 진행 중인 예약 하나를 함께 기다림 (구간 낭비 방지)
+            refill = self._refills.get(thread_id)
+            if refill is None:
+                refill = self._refills[thread_id] = asyncio.create_task(self._refill(thread_id))
+            await asyncio.shield(refill)
+
+    async def _refill(self, thread_id: str) -> None:
+        """새 구간 예약 (잠금 대기(busy_timeout)가 이벤트 루프를 막지 않도록 실행기 스레드에서 수행)"""
+        try:
+            upper = await asyncio.to_thread(self._reserve, thread_id, self._block_size)
+            self._blocks[thread_id] = [upper - self._block_size + 1, upper]
+            self._blocks.move_to_end(thread_id)
+            if len(self._blocks) > self._max_cached_threads:
+                self._blocks.popitem(last=False)
+        finally:
+            self._refills.pop(thread_id, None)
+
+    def _reserve(self, thread_id: str, count: int) -> int:
+        """공유 저장소에서 count개 구간 예약 후 새 상한 반환"""
+        with self._conn_lock:
+            upper = self._conn.execute(_RESERVE, (thread_id, count)).fetchone()[0]
+            self._reservations += 1
+        return upper
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": "sqlite",
+            "path": self._path,
+            "block_size": self._block_size,
+            "cached_threads": len(self._blocks),
+            "issued": self._issued,
+            "reservations": self._reservations
+        }
+
+    def close(self) -> None:
+        with self._conn_lock:
+            self._conn.close()
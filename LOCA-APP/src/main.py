@@ -5,7 +5,7 @@ from typing import AsyncGenerator
 import uvicorn
 from fastapi import FastAPI
 
-from configuration.di_container import init_container, cleanup_container
+from configuration.di_container import init_container, startup_container, cleanup_container
 from configuration.settings.app_settings import get_settings
 from configuration.settings.constants import UvicornConfig
 from configuration.factories.logger_factory import get_logger, configure_logging
@@ -42,6 +42,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         init_container(settings)
         logger.info("DI Container initialized")
 
+        # 외부 리소스 초기화 (LLM 커넥션 풀)
+        await startup_container()
+        logger.info("DI Container resources opened")
+
         # 애플리케이션 상태를 factories.state에 저장
         app.state.context = context
         app.state.settings = settings
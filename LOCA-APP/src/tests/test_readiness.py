@@ -0,0 +1,92 @@
+# tests/test_readiness.py
+"""
+DIContainer 워밍업 / 준비 상태 테스트
+
+LOCA-APP/src 에서 실행:
+    python -m pytest tests
+"""
+
+import asyncio
+from types import SimpleNamespace
+from typing import List
+
+from configuration.di_container import DIContainer
+from configuration.settings.app_settings import AppSettings
+from configuration.settings.outbound.llm_settings import LLMSettings
+from configuration.settings.outbound.message_sequence_settings import MessageSequenceSettings
+from configuration.settings.outbound.semantic_cache_settings import SemanticCacheSettings
+
+
+class _FakeLLMClient:
+    """warm_up 결과를 차례로 돌려주는 LLM 클라이언트 (Exception이면 발생)"""
+
+    def __init__(self, outcomes: List):
+        self.outcomes = outcomes
+        self.calls = 0
+
+    async def warm_up(self, connections: int, probe: bool):
+        outcome = self.outcomes[min(self.calls, len(self.outcomes) - 1)]
+        self.calls += 1
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    async def aclose_all(self) -> None:
+        pass
+
+
+def _report(errors: List[str]):
+    return SimpleNamespace(errors=errors, to_dict=lambda: {"errors": errors})
+
+
+def _container(client: _FakeLLMClient, **llm_settings) -> DIContainer:
+    settings = AppSettings(
+        llm=LLMSettings(_env_file=None, warmup_retry_interval=0.01, **llm_settings),
+        semantic_cache=SemanticCacheSettings(_env_file=None),
+        message_sequence=MessageSequenceSettings(_env_file=None)
+    )
+    container = DIContainer(settings)
+    container._instances["llm_client"] = client
+    return container
+
+
+async def _start(container: DIContainer) -> None:
+    # 커넥션 풀 생성(open)은 건너뛰고 워밍업만 시작
+    container._warmup_task = asyncio.create_task(container._warm_up())
+
+
+def test_failed_warm_up_keeps_the_app_not_ready_until_a_retry_succeeds():
+    async def scenario():
+        client = _FakeLLMClient([RuntimeError("unreachable"), _report(["connect: refused"]), _report([])])
+        container = _container(client)
+        await _start(container)
+
+        while container.readiness()["warmup"]["status"] == "pending":
+            await asyncio.sleep(0)
+        first = (container.is_ready, container.readiness()["warmup"]["status"])
+
+        await asyncio.wait_for(container._warmup_task, timeout=1.0)
+        return first, container.is_ready, container.readiness()["warmup"], client.calls
+
+    first, ready, warmup, calls = asyncio.run(scenario())
+    assert first == (False, "failed")
+    assert ready
+    assert warmup["status"] == "completed"
+    assert warmup["attempt"] == calls == 3
+
+
+def test_timed_out_warm_up_is_not_ready():
+    async def scenario():
+        class _SlowClient(_FakeLLMClient):
+            async def warm_up(self, connections: int, probe: bool):
+                self.calls += 1
+                await asyncio.sleep(10)
+
+        container = _container(_SlowClient([]), warmup_timeout=0.01)
+        await _start(container)
+        await asyncio.sleep(0.05)
+        result = (container.is_ready, container.readiness()["warmup"]["status"])
+        await container.shutdown()
+        return result
+
+    assert asyncio.run(scenario()) == (False, "timeout")
@@ -0,0 +1,66 @@
+# tests/test_settings.py
+"""
+하위 설정의 환경 변수 적재 테스트
+
+LOCA-APP/src 에서 실행:
+    python -m pytest tests
+"""
+
+from configuration.di_container import DIContainer
+from configuration.settings.app_settings import AppSettings
+from configuration.settings.outbound.llm_settings import LLMSettings
+from configuration.settings.outbound.message_sequence_settings import MessageSequenceSettings
+from configuration.settings.outbound.semantic_cache_settings import SemanticCacheSettings
+from configuration.settings.outbound.suggestion_precompute_settings import SuggestionPrecomputeSettings
+from infrastructure.adapters.secondary.sequence.sqlite_message_sequence import SqliteMessageSequence
+
+
+def test_llm_settings_load_from_prefixed_environment(monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDER", "vllm")
+    monkeypatch.setenv("LLM_WARMUP_ENABLED", "false")
+    monkeypatch.setenv("LLM_WARMUP_RETRY_INTERVAL", "2.5")
+
+    settings = LLMSettings(_env_file=None)
+
+    assert settings.provider == "vllm"
+    assert settings.warmup_enabled is False
+    assert settings.warmup_retry_interval == 2.5
+
+
+def test_message_sequence_backend_loads_from_environment(monkeypatch, tmp_path):
+    monkeypatch.setenv("MESSAGE_SEQUENCE_BACKEND", "sqlite")
+    monkeypatch.setenv("MESSAGE_SEQUENCE_SQLITE_PATH", str(tmp_path / "sequence.db"))
+    monkeypatch.setenv("MESSAGE_SEQUENCE_BLOCK_SIZE", "8")
+
+    settings = MessageSequenceSettings(_env_file=None)
+    assert (settings.backend, settings.block_size) == ("sqlite", 8)
+
+    container = DIContainer(AppSettings(message_sequence=settings))
+    sequence = container.message_sequence()
+    try:
+        assert isinstance(sequence, SqliteMessageSequence)
+    finally:
+        sequence.close()
+
+
+def test_semantic_cache_settings_load_from_environment(monkeypatch):
+    monkeypatch.setenv("SEMANTIC_CACHE_ENABLED", "true")
+    monkeypatch.setenv("SEMANTIC_CACHE_SIMILARITY_THRESHOLD", "0.95")
+    monkeypatch.setenv("SEMANTIC_CACHE_TTL_SECONDS", "60")
+
+    settings = SemanticCacheSettings(_env_file=None)
+    assert (settings.enabled, settings.similarity_threshold, settings.ttl_seconds) == (True, 0.95, 60.0)
+
+    container = DIContainer(AppSettings(semantic_cache=settings))
+    assert container.answer_cache() is not None
+
+
+def test_suggestion_precompute_settings_load_from_environment(monkeypatch):
+    monkeypatch.setenv("SUGGESTION_PRECOMPUTE_ENABLED", "true")
+    monkeypatch.setenv("SUGGESTION_PRECOMPUTE_MAX_ENTRIES", "100")
+
+    settings = SuggestionPrecomputeSettings(_env_file=None)
+    assert (settings.enabled, settings.max_entries) == (True, 100)
+
+    container = DIContainer(AppSettings(suggestion_precompute=settings))
+    assert container.suggestion_store() is not None
@@ -0,0 +1,98 @@
+# benchmark/__main__.py
+"""
+LLM 클라이언트 오프라인 벤치마크
+
+openrouter/src 에서 실행:
+    python -m benchmark                                   # 전체 시나리오
+    python -m benchmark --scenarios openrouter-stream --concurrency 64 --requests 1000
+    python -m benchmark --ttft 0.2 --token-rate 50 --error-rate 0.05 --error-status 429
+    python -m benchmark --save-baseline main              # benchmark/baselines/main.json 저장
+    python -m benchmark --compare main --tolerance 0.1    # 기준선 대비 10% 이상 악화 시 종료 코드 1
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from typing import List
+
+from .baseline import compare, load_baseline, save_baseline
+from .mock_server import MockServerConfig, MockServerProcess
+from .runner import BenchmarkConfig, BenchmarkRunner, ScenarioResult
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="LLM 클라이언트 오프라인 벤치마크 (모의 SSE 서버 사용)")
+    parser.add_argument("--scenarios", nargs="+", default=list(BenchmarkRunner.SCENARIOS),
+                        choices=BenchmarkRunner.SCENARIOS)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--batch-size", type=int, default=8, help="vllm-batch 시나리오의 배치당 대화 수")
+    # 모의 서버 설정
+    parser.add_argument("--ttft", type=float, default=0.05, help="첫 토큰 지연(초)")
+    parser.add_argument("--token-rate", type=float, default=200.0, help="초당 토큰 수")
+    parser.add_argument("--tokens", type=int, default=64, help="응답 토큰 수")
+    parser.add_argument("--latency", type=float, default=0.0, help="응답 헤더 전 고정 지연(초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="오류 주입 비율 (0~1)")
+    parser.add_argument("--error-status", type=int, default=503, help="주입할 오류 상태 코드")
+    parser.add_argument("--seed", type=int, default=None)
+    # 기준선
+    parser.add_argument("--save-baseline", metavar="NAME")
+    parser.add_argument("--compare", metavar="NAME")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="회귀 판정 허용 비율")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    return parser.parse_args()
+
+
+def _print_results(results: List[ScenarioResult]) -> None:
+    columns = ("scenario", "requests", "errors", "throughput_rps", "tokens_per_s", "ttft_p50_ms",
+               "ttft_p99_ms", "itl_p50_ms", "itl_p99_ms", "cpu_ms_per_token", "memory_kib_per_stream")
+    print(" | ".join(columns))
+    for result in results:
+        row = result.to_dict()
+        print(" | ".join("-" if row[c] is None else str(row[c]) for c in columns))
+
+
+def main() -> int:
+    args = _parse_args()
+    server_config = MockServerConfig(
+        ttft=args.ttft,
+        token_rate=args.token_rate,
+        completion_tokens=args.tokens,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        seed=args.seed
+    )
+    bench_config = BenchmarkConfig(concurrency=args.concurrency, requests=args.requests, batch_size=args.batch_size)
+
+    with MockServerProcess(server_config) as server:
+        runner = BenchmarkRunner(server.base_url, bench_config)
+        results = asyncio.run(runner.run(args.scenarios))
+
+    if args.json:
+        print(json.dumps([r.to_dict() for r in results], ensure_ascii=False, indent=2))
+    else:
+        _print_results(results)
+
+    metadata = {"server": server_config.to_dict(), "load": bench_config.to_dict()}
+    if args.save_baseline:
+        path = save_baseline(args.save_baseline, results, metadata)
+        print(f"**기준선 저장**: {path}")
+
+    if args.compare:
+        rows = compare(results, load_baseline(args.compare), args.tolerance)
+        regressions = [row for row in rows if row["regression"]]
+        print(f"\n=== **기준선 비교 ({args.compare})** ===")
+        for row in rows:
+            mark = "❌" if row["regression"] else "✅"
+            print(f"{mark} {row['scenario']} {row['metric']}: "
+                  f"{row['baseline']} -> {row['current']} ({row['change_pct']:+.1f}%)")
+        if regressions:
+            print(f"**회귀 {len(regressions)}건** (허용 {args.tolerance:.0%})")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+# benchmark/baseline.py
+"""벤치마크 기준선 저장 / 비교 (회귀 검출)"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .runner import ScenarioResult
+
+BASELINE_DIR = Path(__file__).parent / "baselines"
+
+# 지표별 개선 방향 (True: 클수록 좋음)
+_HIGHER_IS_BETTER = {
+    "throughput_rps": True,
+    "tokens_per_s": True,
+    "ttft_p50_ms": False,
+    "ttft_p99_ms": False,
+    "itl_p50_ms": False,
+    "itl_p99_ms": False,
+    "e2e_p50_ms": False,
+    "e2e_p99_ms": False,
+    "cpu_ms_per_token": False,
+    "memory_kib_per_stream": False,
+}
+
+
+def save_baseline(name: str, results: List[ScenarioResult], metadata: Dict[str, Any]) -> Path:
+    BASELINE_DIR.mkdir(parents=True, exist_ok=True)
+    path = BASELINE_DIR / f"{name}.json"
+    path.write_text(json.dumps({
+        "name": name,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        **metadata,
+        "results": {result.scenario: result.to_dict() for result in results}
+    }, ensure_ascii=False, indent=2), encoding="utf-8")
+    return path
+
+
+def load_baseline(name: str) -> Dict[str, Any]:
+    path = BASELINE_DIR / f"{name}.json"
+    if not path.exists():
+        raise FileNotFoundError(f"기준선 파일이 없습니다: {path}")
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def compare(
+        results: List[ScenarioResult],
+        baseline: Dict[str, Any],
+        tolerance: float = 0.10
+) -> List[Dict[str, Any]]:
+    """기준선 대비 변화율 계산 (tolerance보다 나빠지면 regression=True)"""
+    rows = []
+    for result in results:
+        previous = baseline.get("results", {}).get(result.scenario)
+        if previous is None:
+            continue
+        current = result.to_dict()
+        for metric, higher_is_better in _HIGHER_IS_BETTER.items():
+            before: Optional[float] = previous.get(metric)
+            after: Optional[float] = current.get(metric)
+            if not before or after is None:
+                continue
+            change = (after - before) / before
+            worse = -change if higher_is_better else change
+            rows.append({
+                "scenario": result.scenario,
+                "metric": metric,
+                "baseline": before,
+                "current": after,
+                "change_pct": round(change * 100, 1),
+                "regression": worse > tolerance
+            })
+    return rows
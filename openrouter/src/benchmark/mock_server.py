@@ -0,0 +1,299 @@
+# benchmark/mock_server.py
+"""
+로컬 LLM 모의 서버 (OpenAI / Anthropic / DashScope 형식)
+
+외부 의존성 없이 asyncio로 HTTP/1.1(keep-alive, chunked SSE)을 처리합니다.
+TTFT, 토큰 생성 속도, 고정 지연, 오류 비율을 설정할 수 있으며
+벤치마크 측정에 서버 CPU가 섞이지 않도록 별도 프로세스로 실행합니다.
+"""
+
+import asyncio
+import json
+import multiprocessing
+import random
+import time
+import uuid
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, List, Optional, Tuple
+
+OPENAI_PATH = "/v1/chat/completions"
+ANTHROPIC_PATH = "/v1/messages"
+DASHSCOPE_PATH = "/api/v1/services/aigc/text-generation/generation"
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 429: "Too Many Requests",
+            500: "Internal Server Error", 502: "Bad Gateway", 503: "Service Unavailable"}
+
+
+@dataclass
+class MockServerConfig:
+    """모의 서버 동작 설정 (시간 단위: 초)"""
+    ttft: float = 0.05                 # 스트림 첫 토큰까지 지연
+    token_rate: float = 200.0          # 초당 생성 토큰 수
+    completion_tokens: int = 64        # 응답 토큰 수
+    latency: float = 0.0               # 응답 헤더 전 고정 지연
+    error_rate: float = 0.0            # 오류 응답 비율 (0~1)
+    error_status: int = 503            # 주입할 오류 상태 코드
+    retry_after: Optional[float] = None  # 429 응답의 Retry-After(초)
+    seed: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class MockLLMServer:
+    """OpenAI / Anthropic / DashScope 와이어 형식을 흉내내는 SSE 서버"""
+
+    def __init__(self, config: MockServerConfig):
+        self.config = config
+        self._random = random.Random(config.seed)
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        async with self._server:
+            await self._server.serve_forever()
+
+    # ---------- HTTP 처리 ----------
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+                path, body = request
+                await self._route(path, body, writer)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _read_request(reader: asyncio.StreamReader) -> Optional[Tuple[str, Dict[str, Any]]]:
+        request_line = await reader.readline()
+        if not request_line:
+            return None
+        _, path, _ = request_line.decode("latin-1").split(" ", 2)
+
+        content_length = 0
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            if name.strip().lower() == "content-length":
+                content_length = int(value.strip())
+
+        raw = await reader.readexactly(content_length) if content_length else b"{}"
+        return path.split("?", 1)[0], json.loads(raw or b"{}")
+
+    async def _route(self, path: str, body: Dict[str, Any], writer: asyncio.StreamWriter) -> None:
+        if path == OPENAI_PATH:
+            wire_format = "openai"
+            stream = bool(body.get("stream"))
+        elif path == ANTHROPIC_PATH:
+            wire_format = "anthropic"
+            stream = bool(body.get("stream"))
+        elif path == DASHSCOPE_PATH:
+            wire_format = "dashscope"
+            stream = bool(body.get("parameters", {}).get("incremental_output"))
+        else:
+            await self._write_json(writer, 404, {"error": {"message": f"unknown path {path}"}})
+            return
+
+        if self.config.latency:
+            await asyncio.sleep(self.config.latency)
+
+        if self.config.error_rate and self._random.random() < self.config.error_rate:
+            headers = {}
+            if self.config.error_status == 429 and self.config.retry_after is not None:
+                headers["Retry-After"] = str(self.config.retry_after)
+            await self._write_json(writer, self.config.error_status, {"error": {"message": "injected error"}}, headers)
+            return
+
+        model = body.get("model", "mock-model")
+        tokens = [f"tok{i} " for i in range(self.config.completion_tokens)]
+        if stream:
+            await self._write_stream(writer, wire_format, model, tokens)
+        else:
+            await asyncio.sleep(self.config.ttft + len(tokens) / self.config.token_rate)
+            await self._write_json(writer, 200, self._completion_body(wire_format, model, "".join(tokens)))
+
+    @staticmethod
+    async def _write_json(
+            writer: asyncio.StreamWriter,
+            status: int,
+            body: Dict[str, Any],
+            headers: Optional[Dict[str, str]] = None
+    ) -> None:
+        payload = json.dumps(body).encode("utf-8")
+        head = [f"HTTP/1.1 {status} {_REASONS.get(status, 'Error')}",
+                "Content-Type: application/json",
+                f"Content-Length: {len(payload)}"]
+        head += [f"{name}: {value}" for name, value in (headers or {}).items()]
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + payload)
+        await writer.drain()
+
+    async def _write_stream(
+            self,
+            writer: asyncio.StreamWriter,
+            wire_format: str,
+            model: str,
+            tokens: List[str]
+    ) -> None:
+        writer.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: text/event-stream\r\n"
+            b"Cache-Control: no-cache\r\n"
+            b"Transfer-Encoding: chunked\r\n\r\n"
+        )
+        await writer.drain()
+
+        events = self._stream_events(wire_format, model, tokens)
+        # events: (토큰 순번 또는 None, 바이트) - 토큰 이벤트는 생성 속도에 맞춰 전송
+        started = time.perf_counter()
+        pending = bytearray()
+        for token_index, data in events:
+            if token_index is not None:
+                due = started + self.config.ttft + token_index / self.config.token_rate
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    if pending:
+                        self._write_chunk(writer, pending)
+                        pending.clear()
+                        await writer.drain()
+                    await asyncio.sleep(delay)
+            pending += data
+        if pending:
+            self._write_chunk(writer, pending)
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+    @staticmethod
+    def _write_chunk(writer: asyncio.StreamWriter, data: bytes) -> None:
+        writer.write(f"{len(data):x}\r\n".encode("latin-1") + bytes(data) + b"\r\n")
+
+    # ---------- 형식별 본문 ----------
+
+    @staticmethod
+    def _stream_events(wire_format: str, model: str, tokens: List[str]) -> List[Tuple[Optional[int], bytes]]:
+        prompt_tokens = 16
+        completion_tokens = len(tokens)
+        events: List[Tuple[Optional[int], bytes]] = []
+
+        if wire_format == "openai":
+            chunk_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+            for index, token in enumerate(tokens):
+                data = {"id": chunk_id, "object": "chat.completion.chunk", "model": model,
+                        "choices": [{"index": 0, "delta": {"content": token}, "finish_reason": None}]}
+                events.append((index, b"data: " + json.dumps(data).encode() + b"\n\n"))
+            final = {"id": chunk_id, "object": "chat.completion.chunk", "model": model,
+                     "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+                     "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                               "total_tokens": prompt_tokens + completion_tokens}}
+            events.append((None, b"data: " + json.dumps(final).encode() + b"\n\n"))
+            events.append((None, b"data: [DONE]\n\n"))
+
+        elif wire_format == "anthropic":
+            def sse(event: str, data: Dict[str, Any]) -> bytes:
+                return f"event: {event}\ndata: ".encode() + json.dumps(data).encode() + b"\n\n"
+
+            events.append((None, sse("message_start", {
+                "type": "message_start",
+                "message": {"id": f"msg_{uuid.uuid4().hex[:12]}", "type": "message", "role": "assistant",
+                            "model": model, "content": [],
+                            "usage": {"input_tokens": prompt_tokens, "output_tokens": 1}}})))
+            events.append((None, sse("content_block_start", {
+                "type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""}})))
+            for index, token in enumerate(tokens):
+                events.append((index, sse("content_block_delta", {
+                    "type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": token}})))
+            events.append((None, sse("content_block_stop", {"type": "content_block_stop", "index": 0})))
+            events.append((None, sse("message_delta", {
+                "type": "message_delta", "delta": {"stop_reason": "end_turn"},
+                "usage": {"output_tokens": completion_tokens}})))
+            events.append((None, sse("message_stop", {"type": "message_stop"})))
+
+        else:  # dashscope (incremental_output=true)
+            request_id = uuid.uuid4().hex
+            for index, token in enumerate(tokens):
+                last = index == len(tokens) - 1
+                data = {"output": {"choices": [{"message": {"role": "assistant", "content": token},
+                                                "finish_reason": "stop" if last else "null"}]},
+                        "usage": {"input_tokens": prompt_tokens, "output_tokens": index + 1,
+                                  "total_tokens": prompt_tokens + index + 1},
+                        "request_id": request_id}
+                events.append((index, f"id:{index + 1}\nevent:result\n:HTTP_STATUS/200\ndata:".encode()
+                               + json.dumps(data).encode() + b"\n\n"))
+        return events
+
+    @staticmethod
+    def _completion_body(wire_format: str, model: str, text: str) -> Dict[str, Any]:
+        prompt_tokens = 16
+        completion_tokens = len(text.split())
+        if wire_format == "openai":
+            return {"id": f"chatcmpl-{uuid.uuid4().hex[:12]}", "object": "chat.completion", "model": model,
+                    "choices": [{"index": 0, "message": {"role": "assistant", "content": text},
+                                 "finish_reason": "stop"}],
+                    "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                              "total_tokens": prompt_tokens + completion_tokens}}
+        if wire_format == "anthropic":
+            return {"id": f"msg_{uuid.uuid4().hex[:12]}", "type": "message", "role": "assistant", "model": model,
+                    "content": [{"type": "text", "text": text}], "stop_reason": "end_turn",
+                    "usage": {"input_tokens": prompt_tokens, "output_tokens": completion_tokens}}
+        return {"output": {"choices": [{"message": {"role": "assistant", "content": text},
+                                        "finish_reason": "stop"}]},
+                "usage": {"input_tokens": prompt_tokens, "output_tokens": completion_tokens,
+                          "total_tokens": prompt_tokens + completion_tokens},
+                "request_id": uuid.uuid4().hex}
+
+
+# ========================================
+# 별도 프로세스 실행
+# ========================================
+
+def _serve(config: MockServerConfig, port_queue: "multiprocessing.Queue") -> None:
+    async def main() -> None:
+        server = MockLLMServer(config)
+        port_queue.put(await server.start())
+        await server.serve_forever()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
+
+
+class MockServerProcess:
+    """모의 서버를 별도 프로세스로 실행 (with 문 지원)"""
+
+    def __init__(self, config: MockServerConfig):
+        self.config = config
+        self.port: Optional[int] = None
+        self._process: Optional[multiprocessing.Process] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def start(self) -> "MockServerProcess":
+        port_queue: multiprocessing.Queue = multiprocessing.Queue()
+        self._process = multiprocessing.Process(target=_serve, args=(self.config, port_queue), daemon=True)
+        self._process.start()
+        self.port = port_queue.get(timeout=10)
+        return self
+
+    def stop(self) -> None:
+        if self._process is not None and self._process.is_alive():
+            self._process.terminate()
+            self._process.join(timeout=5)
+        self._process = None
+
+    def __enter__(self) -> "MockServerProcess":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -0,0 +1,287 @@
+# benchmark/runner.py
+"""
+LLM 클라이언트 벤치마크 실행기
+
+모의 서버를 대상으로 OpenRouterClient / ClaudeClient / QwenClient / MultiModelManager를
+지정한 동시성으로 호출하고 처리량, TTFT/ITL 백분위수, 토큰당 CPU, 스트림당 메모리를 측정합니다.
+"""
+
+import asyncio
+import gc
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from client.base_client import BaseLLMClient
+from client.claude.claude_client import ClaudeClient
+from client.openrouter.multi_model_manager import MultiModelManager
+from client.openrouter.openrouter_client import OpenRouterClient
+from client.qwen.qwen_client import QwenClient
+from client.vllm.vllm_client import VLLMClient
+from settings import Settings
+
+
+@dataclass
+class BenchmarkConfig:
+    """벤치마크 부하 설정"""
+    concurrency: int = 16
+    requests: int = 200
+    max_tokens: int = 256
+    multi_models: List[str] = field(default_factory=lambda: ["bench-a", "bench-b", "bench-c"])
+    batch_size: int = 8
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class ScenarioResult:
+    """시나리오 측정 결과 (지연: ms, 메모리: KiB)"""
+    scenario: str
+    requests: int
+    errors: int
+    wall_time_s: float
+    throughput_rps: float
+    tokens_per_s: float
+    ttft_p50_ms: Optional[float]
+    ttft_p90_ms: Optional[float]
+    ttft_p99_ms: Optional[float]
+    itl_p50_ms: Optional[float]
+    itl_p99_ms: Optional[float]
+    e2e_p50_ms: float
+    e2e_p99_ms: float
+    cpu_ms_per_token: Optional[float]
+    memory_kib_per_stream: Optional[float]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class _Sample:
+    """요청 하나의 클라이언트 측 측정값"""
+    tokens: int = 0
+    ttft: Optional[float] = None
+    itls: List[float] = field(default_factory=list)
+    e2e: float = 0.0
+    error: bool = False
+
+
+def _percentile(values: List[float], q: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+def _ms(value: Optional[float]) -> Optional[float]:
+    return round(value * 1000, 3) if value is not None else None
+
+
+class BenchmarkRunner:
+    """시나리오별 부하 생성 및 측정"""
+
+    SCENARIOS = (
+        "openrouter-stream",
+        "openrouter-completion",
+        "claude-stream",
+        "qwen-stream",
+        "multi-model-stream",
+        "vllm-batch",
+    )
+
+    def __init__(self, base_url: str, config: BenchmarkConfig):
+        self.base_url = base_url
+        self.config = config
+        fan_out = max(len(config.multi_models), config.batch_size)
+        self.settings = Settings(
+            openrouter_api_key="sk-or-v1-benchmark",
+            openai_api_key="benchmark",
+            claude_api_key="benchmark",
+            qwen_api_key="benchmark",
+            vllm_base_url=f"{base_url}/v1",
+            max_tokens=config.max_tokens,
+            pool_max_connections=max(100, config.concurrency * fan_out),
+            pool_max_keepalive_connections=max(20, config.concurrency * fan_out),
+            rate_limit_max_concurrency=max(64, config.concurrency * fan_out),
+            vllm_batch_concurrency=config.batch_size,
+            # 오류 주입 시 서킷이 열리거나 재시도되면 측정이 왜곡되므로 비활성화
+            circuit_breaker_enabled=False,
+            retry_max_attempts=0,
+            response_cache_enabled=False
+        )
+
+    async def run(self, scenarios: Optional[List[str]] = None) -> List[ScenarioResult]:
+        results = []
+        for name in scenarios or self.SCENARIOS:
+            results.append(await self.run_scenario(name))
+            await BaseLLMClient.aclose_all()
+        return results
+
+    async def run_scenario(self, name: str) -> ScenarioResult:
+        request_fn = self._request_factory(name)
+        streams_per_request = {
+            "multi-model-stream": len(self.config.multi_models),
+            "vllm-batch": self.config.batch_size
+        }.get(name, 1)
+
+        # 워밍업 (커넥션 풀 생성)
+        await asyncio.gather(*[request_fn(-(i + 1)) for i in range(min(4, self.config.concurrency))])
+
+        gc.collect()
+        cpu_started = time.process_time()
+        wall_started = time.perf_counter()
+        samples = await self._drive(request_fn, self.config.requests)
+        wall_time = time.perf_counter() - wall_started
+        cpu_time = time.process_time() - cpu_started
+
+        memory = await self._measure_memory(request_fn)
+
+        ok = [s for s in samples if not s.error]
+        tokens = sum(s.tokens for s in ok)
+        itls = [itl for s in ok for itl in s.itls]
+        ttfts = [s.ttft for s in ok if s.ttft is not None]
+        e2e = [s.e2e for s in ok] or [0.0]
+
+        return ScenarioResult(
+            scenario=name,
+            requests=len(samples),
+            errors=len(samples) - len(ok),
+            wall_time_s=round(wall_time, 3),
+            throughput_rps=round(len(ok) / wall_time, 2),
+            tokens_per_s=round(tokens / wall_time, 1),
+            ttft_p50_ms=_ms(_percentile(ttfts, 0.5)),
+            ttft_p90_ms=_ms(_percentile(ttfts, 0.9)),
+            ttft_p99_ms=_ms(_percentile(ttfts, 0.99)),
+            itl_p50_ms=_ms(_percentile(itls, 0.5)),
+            itl_p99_ms=_ms(_percentile(itls, 0.99)),
+            e2e_p50_ms=_ms(_percentile(e2e, 0.5)),
+            e2e_p99_ms=_ms(_percentile(e2e, 0.99)),
+            cpu_ms_per_token=round(cpu_time * 1000 / tokens, 4) if tokens else None,
+            memory_kib_per_stream=round(memory / 1024 / streams_per_request, 1) if memory else None
+        )
+
+    async def _drive(
+            self,
+            request_fn: Callable[[int], Awaitable[List[_Sample]]],
+            total: int
+    ) -> List[_Sample]:
+        """동시성 제한 안에서 total개 요청 실행"""
+        semaphore = asyncio.Semaphore(self.config.concurrency)
+        samples: List[_Sample] = []
+
+        async def worker(index: int) -> None:
+            async with semaphore:
+                samples.extend(await request_fn(index))
+
+        await asyncio.gather(*[worker(i) for i in range(total)])
+        return samples
+
+    async def _measure_memory(self, request_fn: Callable[[int], Awaitable[List[_Sample]]]) -> int:
+        """동시 스트림 한 묶음 실행 중 최대 할당량 (tracemalloc, 요청당 바이트)"""
+        gc.collect()
+        tracemalloc.start()
+        try:
+            baseline = tracemalloc.get_traced_memory()[0]
+            await asyncio.gather(*[request_fn(10_000_000 + i) for i in range(self.config.concurrency)])
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        return max(0, peak - baseline) // self.config.concurrency
+
+    # ---------- 시나리오 ----------
+
+    def _request_factory(self, name: str) -> Callable[[int], Awaitable[List[_Sample]]]:
+        if name == "openrouter-stream":
+            client = OpenRouterClient(self.settings)
+            client.base_url = f"{self.base_url}/v1"
+            return lambda i: self._stream_request(client, "bench-openrouter", i)
+        if name == "openrouter-completion":
+            client = OpenRouterClient(self.settings)
+            client.base_url = f"{self.base_url}/v1"
+            return lambda i: self._completion_request(client, "bench-openrouter", i)
+        if name == "claude-stream":
+            client = ClaudeClient(self.settings)
+            client.base_url = f"{self.base_url}/v1"
+            return lambda i: self._stream_request(client, "bench-claude", i)
+        if name == "qwen-stream":
+            client = QwenClient(self.settings)
+            client.base_url = f"{self.base_url}/api/v1"
+            return lambda i: self._stream_request(client, "bench-qwen", i)
+        if name == "multi-model-stream":
+            manager = MultiModelManager(self.settings)
+            manager.client.base_url = f"{self.base_url}/v1"
+            return lambda i: self._multi_model_request(manager, i)
+        if name == "vllm-batch":
+            client = VLLMClient(self.settings)
+            return lambda i: self._batch_request(client, "bench-vllm", i)
+        raise ValueError(f"알 수 없는 시나리오: {name} (가능: {', '.join(self.SCENARIOS)})")
+
+    @staticmethod
+    def _messages(index: int) -> List[Dict[str, str]]:
+        # 요청마다 다른 프롬프트 (중복 제거 / 캐시 영향 배제)
+        return [{"role": "user", "content": f"benchmark request #{index}"}]
+
+    async def _stream_request(self, client: BaseLLMClient, model: str, index: int) -> List[_Sample]:
+        sample = _Sample()
+        started = time.perf_counter()
+        last = None
+        try:
+            stream = await client.chat_completion(self._messages(index), model=model, stream=True)
+            async for chunk in stream:
+                if not chunk.content:
+                    continue
+                now = time.perf_counter()
+                if sample.ttft is None:
+                    sample.ttft = now - started
+                else:
+                    sample.itls.append(now - last)
+                last = now
+                sample.tokens += 1
+        except Exception:
+            sample.error = True
+        sample.e2e = time.perf_counter() - started
+        return [sample]
+
+    async def _completion_request(self, client: BaseLLMClient, model: str, index: int) -> List[_Sample]:
+        sample = _Sample()
+        started = time.perf_counter()
+        try:
+            response = await client.chat_completion(self._messages(index), model=model)
+            sample.tokens = int(response.usage.get("completion_tokens") or 0)
+        except Exception:
+            sample.error = True
+        sample.e2e = time.perf_counter() - started
+        return [sample]
+
+    async def _batch_request(self, client: VLLMClient, model: str, index: int) -> List[_Sample]:
+        """batch_size개 대화를 batch_completion 한 번으로 전송 (항목별 E2E = 배치 완료 시간)"""
+        batch = [self._messages(index * self.config.batch_size + i) for i in range(self.config.batch_size)]
+        started = time.perf_counter()
+        results = await client.batch_completion(batch, model=model)
+        elapsed = time.perf_counter() - started
+        samples = []
+        for result in results:
+            if isinstance(result, Exception):
+                samples.append(_Sample(e2e=elapsed, error=True))
+            else:
+                samples.append(_Sample(tokens=int(result.usage.get("completion_tokens") or 0), e2e=elapsed))
+        return samples
+
+    async def _multi_model_request(self, manager: MultiModelManager, index: int) -> List[_Sample]:
+        samples: Dict[str, _Sample] = {name: _Sample() for name in self.config.multi_models}
+        started = time.perf_counter()
+        async with manager.stream_multiple_models(self.config.multi_models, self._messages(index)) as stream:
+            async for model_name, delta, finish_reason, timing in stream:
+                sample = samples[model_name]
+                if finish_reason in ("error", "cancelled"):
+                    sample.error = True
+                elif delta:
+                    sample.tokens += 1
+                    if timing.itl is not None:
+                        sample.itls.append(timing.itl)
+                if finish_reason:
+                    sample.ttft = timing.ttft
+                    sample.e2e = time.perf_counter() - started
+        return list(samples.values())
@@ -1,14 +1,249 @@
 # clients/base_client.py
+import importlib.util
+from contextlib import aclosing, nullcontext
+from contextvars import ContextVar
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, AsyncIterator, Union
+from dataclasses import dataclass, asdict, field
+from typing import List, Dict, Any, Optional, AsyncIterator, Union, ClassVar, Callable
+import asyncio
 import httpx
 import json
+import time
+
+from .circuit_breaker import CircuitBreaker
+from .completion_types import Completion, StreamDelta
+from .errors import LLMAPIError, LLMTimeoutError, parse_retry_after
+from .metrics import LLMMetrics, RequestMetrics, RequestTimer
+from .rate_limiter import ProviderRateLimiter, RetryPolicy
+from .response_cache import ResponseCache
+from .single_flight import SingleFlight
+from .timeouts import PhaseTimeouts, guard_stream, with_deadline
+from .token_budget import DEFAULT_CONTEXT_LIMITS, BudgetResult, TokenBudget, model_family
+
+try:
+    import orjson
+    _fast_json_loads: Callable[[bytes], Any] = orjson.loads
+except ImportError:
+    _fast_json_loads = json.loads
+
+
+# 현재 요청의 타이머 (공유 커넥션 풀의 이벤트 훅에서 참조)
+_current_timer: ContextVar[Optional[RequestTimer]] = ContextVar("llm_request_timer", default=None)
+
+
+async def _trace_request(request: httpx.Request) -> None:
+    timer = _current_timer.get()
+    if timer is not None:
+        request.extensions["trace"] = timer.trace
+
+
+async def _trace_response(response: httpx.Response) -> None:
+    timer = _current_timer.get()
+    if timer is not None:
+        timer.on_response_headers()
+
+
+class SSEEvent:
+    """디코딩된 Server-Sent Event 하나 (data는 바이트 그대로 보관)"""
+    __slots__ = ("event", "data", "id", "_loads")
+
+    def __init__(self, event: Optional[str], data: bytes, id: Optional[str], loads: Callable[[bytes], Any]):
+        self.event = event
+        self.data = data
+        self.id = id
+        self._loads = loads
+
+    @property
+    def is_done(self) -> bool:
+        """OpenAI 계열 스트림 종료 표시([DONE]) 여부"""
+        return self.data == b"[DONE]"
+
+    def json(self) -> Any:
+        """data 필드를 JSON으로 디코딩"""
+        return self._loads(self.data)
+
+    def __repr__(self) -> str:
+        return f"SSEEvent(event={self.event!r}, data={self.data[:80]!r}, id={self.id!r})"
+
+
+class SSEDecoder:
+    """바이트 단위 증분 SSE 디코더
+
+    aiter_raw() 청크를 재사용 버퍼에 누적하고 완성된 라인만 처리합니다.
+    여러 줄의 data 필드, event/id 필드, 주석(keep-alive) 라인을 지원합니다.
+    라인 구분자는 LF, CRLF, CR을 지원합니다 (청크 경계에서 나뉜 CRLF 포함).
+    """
+
+    def __init__(self, json_loads: Optional[Callable[[bytes], Any]] = None):
+        self._buffer = bytearray()
+        self._data: List[bytes] = []
+        self._event: Optional[str] = None
+        self._last_id: Optional[str] = None
+        self._loads = json_loads or _fast_json_loads
+        # 직전 청크가 CR로 끝남 -> 다음 청크의 첫 LF는 같은 CRLF 구분자
+        self._skip_lf = False
+
+    def feed(self, chunk: bytes) -> List[SSEEvent]:
+        """청크를 추가하고 완성된 이벤트 목록 반환"""
+        buffer = self._buffer
+        buffer += chunk
+        events: List[SSEEvent] = []
+        start = 0
+        if self._skip_lf and buffer[:1] == b"\n":
+            start = 1
+        self._skip_lf = False
+
+        # 버퍼에 남은 부분은 CR을 포함하지 않으므로 새 청크에 CR이 없으면 LF만 탐색 (대부분의 제공자)
+        if b"\r" not in chunk:
+            while True:
+                end = buffer.find(b"\n", start)
+                if end < 0:
+                    break
+                event = self._process_line(bytes(buffer[start:end]))
+                if event is not None:
+                    events.append(event)
+                start = end + 1
+        else:
+            while True:
+                end = buffer.find(b"\n", start)
+                cr = buffer.find(b"\r", start, end if end >= 0 else len(buffer))
+                if cr >= 0:
+                    # CR 또는 CRLF (CR이 버퍼 끝이면 다음 청크의 첫 LF를 건너뜀)
+                    line_end = cr
+                    if cr + 1 < len(buffer):
+                        next_start = cr + 2 if buffer[cr + 1] == 0x0A else cr + 1
+                    else:
+                        next_start = cr + 1
+                        self._skip_lf = True
+                elif end >= 0:
+                    line_end = end
+                    next_start = end + 1
+                else:
+                    break
+                event = self._process_line(bytes(buffer[start:line_end]))
+                if event is not None:
+                    events.append(event)
+                start = next_start
+
+        if start:
+            del buffer[:start]
+        return events
+
+    def flush(self) -> List[SSEEvent]:
+        """스트림 종료 시 남은 버퍼 처리 (마지막 빈 줄이 없는 경우)"""
+        events: List[SSEEvent] = []
+        if self._buffer:
+            event = self._process_line(bytes(self._buffer))
+            self._buffer.clear()
+            if event is not None:
+                events.append(event)
+        event = self._dispatch()
+        if event is not None:
+            events.append(event)
+        return events
+
+    def _process_line(self, line: bytes) -> Optional[SSEEvent]:
+        if not line:
+            return self._dispatch()
+        if line[0] == 0x3A:  # ":" 주석 (keep-alive)
+            return None
+
+        field, sep, value = line.partition(b":")
+        if sep and value[:1] == b" ":
+            value = value[1:]
+
+        if field == b"data":
+            self._data.append(value)
+        elif field == b"event":
+            self._event = value.decode("utf-8")
+        elif field == b"id":
+            self._last_id = value.decode("utf-8")
+        # retry 및 알 수 없는 필드는 무시
+        return None
+
+    def _dispatch(self) -> Optional[SSEEvent]:
+        if not self._data:
+            self._event = None
+            return None
+        data = self._data[0] if len(self._data) == 1 else b"\n".join(self._data)
+        event = SSEEvent(self._event, data, self._last_id, self._loads)
+        self._data = []
+        self._event = None
+        return event
+
+
+@dataclass
+class PoolStats:
+    """제공자별 커넥션 풀 상태 스냅샷"""
+    provider: str
+    in_use: int
+    idle: int
+    waiting: int
+    max_connections: Optional[int]
+    max_keepalive_connections: Optional[int]
+    http2: bool
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class WarmUpReport:
+    """워밍업 결과 (시간 단위: 초)"""
+    provider: str
+    connections: int = 0
+    connect_seconds: float = 0.0
+    resources_seconds: float = 0.0
+    probe_ok: Optional[bool] = None
+    probe_seconds: Optional[float] = None
+    errors: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
 
 
 class BaseLLMClient(ABC):
+    # 제공자 이름 (에러 메시지, 커넥션 풀 키로 사용)
+    provider_name: str = "LLM"
+
+    # 스트림 JSON 디코더 (orjson 설치 시 orjson.loads 사용, 교체 가능)
+    json_loads: ClassVar[Callable[[bytes], Any]] = staticmethod(_fast_json_loads)
+
+    # 제공자별 공유 커넥션 풀 (프로세스 단위로 재사용)
+    _http_clients: ClassVar[Dict[str, httpx.AsyncClient]] = {}
+    _pool_limits: ClassVar[Dict[str, httpx.Limits]] = {}
+
+    # 정확 일치 응답 캐시 (프로세스 단위, 설정에서 활성화)
+    _response_cache: ClassVar[Optional[ResponseCache]] = None
+
+    # 동일 요청 동시 호출 중복 제거 (프로세스 단위)
+    _single_flight: ClassVar[Optional[SingleFlight]] = None
+
+    # 제공자/모델별 요청 제한기 (프로세스 단위)
+    _rate_limiters: ClassVar[Dict[str, ProviderRateLimiter]] = {}
+
+    # 모델별 서킷 브레이커 (프로세스 단위)
+    _circuit_breakers: ClassVar[Dict[str, CircuitBreaker]] = {}
+
+    # 제공자/모델별 지연 / 토큰 지표 (프로세스 단위, 풀 종료 후에도 유지)
+    _metrics: ClassVar[LLMMetrics] = LLMMetrics()
+
+    # 프롬프트 토큰 예산 (메시지별 토큰 수 캐시 포함, 프로세스 단위)
+    _token_budget: ClassVar[Optional[TokenBudget]] = None
+
+    # system 역할 메시지를 messages 안에 둘 수 있는지 (False면 토큰 예산 요약을 payload["system"]에 추가)
+    system_in_messages: ClassVar[bool] = True
+
+    # 제공자/모델별 단계 타임아웃 (설정에서 한 번만 계산)
+    _phase_timeouts: ClassVar[Dict[str, PhaseTimeouts]] = {}
+
+    # "제공자:모델:단계"별 타임아웃 발생 수 (프로세스 단위, 풀 종료 후에도 유지)
+    _timeout_counts: ClassVar[Dict[str, int]] = {}
+
     def __init__(self, settings):
         self.settings = settings
-        self.timeout = 30.0
+        # 모델 목록 조회 등 부가 요청용 (채팅 요청은 _upstream_timeout 사용)
+        self.timeout = httpx.Timeout(settings.timeout, connect=settings.connect_timeout)
 
     @abstractmethod
     async def chat_completion(
@@ -19,32 +254,750 @@ class BaseLLMClient(ABC):
             temperature: Optional[float] = None,
             stream: bool = False,
             **kwargs
-    ) -> Union[Dict[str, Any], AsyncIterator[Dict[str, Any]]]:
+    ) -> Union[Completion, AsyncIterator[StreamDelta]]:
         pass
 
     @abstractmethod
     async def get_available_models(self) -> List[Dict[str, Any]]:
         pass
 
+    # ========================================
+    # 커넥션 풀 관리
+    # ========================================
+
+    @property
+    def pool_key(self) -> str:
+        """커넥션 풀 식별 키 (제공자 단위)"""
+        return self.provider_name.lower()
+
+    async def open(self) -> None:
+        """커넥션 풀 생성 (앱 시작 시 호출)"""
+        self._get_http_client()
+
+    async def warm_up(
+            self,
+            connections: int = 2,
+            probe: bool = False,
+            probe_model: Optional[str] = None
+    ) -> WarmUpReport:
+        """첫 요청 지연 제거 (앱 시작 시 호출)
+
+        풀 / 캐시 / 요청 제한 구성 요소를 만들고, connections개 커넥션을 미리 연결(TCP + TLS)해 keep-alive로 유지합니다.
+        제공자별 부가 자원(_warm_up_resources)을 적재하고, probe=True면 1토큰 완료 요청으로 전체 경로를 확인합니다.
+        """
+        report = WarmUpReport(self.provider_name)
+        client = self._get_http_client()
+        self._get_response_cache()
+        self._get_single_flight()
+        self._get_token_budget()
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*[self._preconnect(client) for _ in range(connections)], return_exceptions=True)
+        report.connect_seconds = round(time.perf_counter() - started, 4)
+        report.connections = sum(1 for result in results if not isinstance(result, BaseException))
+        report.errors += [f"connect: {result}" for result in results if isinstance(result, BaseException)][:1]
+
+        started = time.perf_counter()
+        try:
+            await self._warm_up_resources()
+        except Exception as e:
+            report.errors.append(f"resources: {e}")
+        report.resources_seconds = round(time.perf_counter() - started, 4)
+
+        if probe:
+            started = time.perf_counter()
+            try:
+                await self.chat_completion([{"role": "user", "content": "ping"}], model=probe_model, max_tokens=1)
+                report.probe_ok = True
+            except Exception as e:
+                report.probe_ok = False
+                report.errors.append(f"probe: {e}")
+            report.probe_seconds = round(time.perf_counter() - started, 4)
+        return report
+
+    async def _preconnect(self, client: httpx.AsyncClient) -> None:
+        """HEAD 요청으로 커넥션 생성 (응답 상태와 무관하게 커넥션은 풀에 남음)"""
+        await client.request("HEAD", self.base_url, headers=self.headers, timeout=self.timeout)
+
+    async def _warm_up_resources(self) -> None:
+        """제공자별 부가 자원 적재 (하위 클래스에서 재정의, 예: 모델 카탈로그)"""
+        return None
+
+    @classmethod
+    async def _aclose_shared_resources(cls) -> None:
+        """제공자별 공유 부가 자원 정리 (하위 클래스에서 재정의, 예: 모델 카탈로그 갱신 작업)"""
+        return None
+
+    @classmethod
+    async def aclose_all(cls) -> None:
+        """모든 공유 커넥션 풀 / 제공자별 공유 자원 종료 (앱 종료 시 호출, 어느 클래스로 호출해도 동일)"""
+        # 커넥션 풀을 닫기 전에 풀을 사용하는 백그라운드 작업부터 중지
+        for provider_cls in _provider_classes():
+            if "_aclose_shared_resources" in vars(provider_cls):
+                await provider_cls._aclose_shared_resources()
+
+        clients = list(BaseLLMClient._http_clients.values())
+        BaseLLMClient._http_clients.clear()
+        BaseLLMClient._pool_limits.clear()
+        for client in clients:
+            if not client.is_closed:
+                await client.aclose()
+
+        if BaseLLMClient._response_cache is not None:
+            BaseLLMClient._response_cache.close()
+            BaseLLMClient._response_cache = None
+
+        BaseLLMClient._rate_limiters.clear()
+        BaseLLMClient._circuit_breakers.clear()
+        BaseLLMClient._phase_timeouts.clear()
+        BaseLLMClient._single_flight = None
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """공유 커넥션 풀 반환 (없으면 생성)"""
+        client = BaseLLMClient._http_clients.get(self.pool_key)
+        if client is None or client.is_closed:
+            limits = self._build_pool_limits()
+            client = httpx.AsyncClient(
+                limits=limits,
+                http2=self._http2_enabled(),
+                timeout=self.timeout,
+                event_hooks={"request": [_trace_request], "response": [_trace_response]}
+            )
+            BaseLLMClient._http_clients[self.pool_key] = client
+            BaseLLMClient._pool_limits[self.pool_key] = limits
+        return client
+
+    def _build_pool_limits(self) -> httpx.Limits:
+        """설정 기반 풀 한도 (제공자별 설정이 기본값을 덮어씀)"""
+        limits = {
+            "max_connections": self.settings.pool_max_connections,
+            "max_keepalive_connections": self.settings.pool_max_keepalive_connections,
+            "keepalive_expiry": self.settings.pool_keepalive_expiry,
+        }
+        limits.update(self.settings.provider_pool_limits.get(self.pool_key, {}))
+        return httpx.Limits(
+            max_connections=int(limits["max_connections"]),
+            max_keepalive_connections=int(limits["max_keepalive_connections"]),
+            keepalive_expiry=float(limits["keepalive_expiry"])
+        )
+
+    def _http2_enabled(self) -> bool:
+        """HTTP/2 사용 여부 (h2 패키지가 없으면 HTTP/1.1로 동작)"""
+        return self.settings.http2 and importlib.util.find_spec("h2") is not None
+
+    def pool_stats(self) -> PoolStats:
+        """커넥션 풀 상태 조회 (in-use / idle / waiting)"""
+        client = BaseLLMClient._http_clients.get(self.pool_key)
+        return BaseLLMClient._collect_pool_stats(self.pool_key, client)
+
+    @classmethod
+    def all_pool_stats(cls) -> Dict[str, Dict[str, Any]]:
+        """모든 공유 커넥션 풀 상태 조회"""
+        return {
+            key: BaseLLMClient._collect_pool_stats(key, client).to_dict()
+            for key, client in BaseLLMClient._http_clients.items()
+        }
+
+    @staticmethod
+    def _collect_pool_stats(key: str, client: Optional[httpx.AsyncClient]) -> PoolStats:
+        limits = BaseLLMClient._pool_limits.get(key)
+        in_use = idle = waiting = 0
+        http2 = False
+
+        if client is not None and not client.is_closed:
+            # httpcore 커넥션 풀 내부 상태 (버전에 따라 없을 수 있음)
+            pool = getattr(client._transport, "_pool", None)
+            http2 = bool(getattr(pool, "_http2", False))
+            for connection in list(getattr(pool, "connections", [])):
+                if connection.is_idle():
+                    idle += 1
+                else:
+                    in_use += 1
+            waiting = sum(
+                1 for pool_request in list(getattr(pool, "_requests", []))
+                if getattr(pool_request, "is_queued", lambda: False)()
+            )
+
+        return PoolStats(
+            provider=key,
+            in_use=in_use,
+            idle=idle,
+            waiting=waiting,
+            max_connections=limits.max_connections if limits else None,
+            max_keepalive_connections=limits.max_keepalive_connections if limits else None,
+            http2=http2
+        )
+
+    # ========================================
+    # 요청 실행 (응답 캐시)
+    # ========================================
+
+    async def _dispatch(
+            self,
+            payload: Dict[str, Any],
+            stream: bool
+    ) -> Union[Completion, AsyncIterator[StreamDelta]]:
+        """공통 처리(토큰 예산, 응답 캐시, 중복 제거, 요청 제한, 재시도) 후 _regular_completion / _stream_completion 호출"""
+        self._apply_token_budget(payload)
+
+        cache = self._get_response_cache()
+        flights = self._get_single_flight()
+        key = None
+        if cache is not None or flights is not None:
+            key = ResponseCache.make_key(self.pool_key, self._cache_identity(payload))
+
+        if cache is not None:
+            cached = await cache.get(key)
+            if cached is not None:
+                completion = Completion.from_dict(cached)
+                return self._replay_stream(completion) if stream else completion
+
+        if stream:
+            if flights is None:
+                return self._upstream_stream(payload, cache, key)
+            return flights.stream(key, lambda: self._upstream_stream(payload, cache, key), self.provider_name)
+
+        if flights is None:
+            return await self._upstream_completion(payload, cache, key)
+        return await flights.call(key, lambda: self._upstream_completion(payload, cache, key))
+
+    async def _upstream_completion(
+            self,
+            payload: Dict[str, Any],
+            cache: Optional[ResponseCache],
+            key: Optional[str]
+    ) -> Completion:
+        response = await self._limited_completion(payload)
+        if cache is not None:
+            await cache.set(key, response.to_dict())
+        return response
+
+    def _upstream_stream(
+            self,
+            payload: Dict[str, Any],
+            cache: Optional[ResponseCache],
+            key: Optional[str]
+    ) -> AsyncIterator[StreamDelta]:
+        chunks = self._limited_stream(payload)
+        if cache is None:
+            return chunks
+        return self._record_stream(cache, key, chunks, payload)
+
+    def _get_single_flight(self) -> Optional[SingleFlight]:
+        """설정에서 활성화된 경우 공유 중복 제거기 반환"""
+        if not self.settings.single_flight_enabled:
+            return None
+        if BaseLLMClient._single_flight is None:
+            BaseLLMClient._single_flight = SingleFlight()
+        return BaseLLMClient._single_flight
+
+    @classmethod
+    def single_flight_stats(cls) -> Dict[str, Any]:
+        """중복 제거 통계 (실제 업스트림 호출 수 / 공유된 호출 수)"""
+        flights = BaseLLMClient._single_flight
+        return flights.stats().to_dict() if flights else {}
+
+    def _get_response_cache(self) -> Optional[ResponseCache]:
+        """설정에서 활성화된 경우 공유 응답 캐시 반환"""
+        if not self.settings.response_cache_enabled:
+            return None
+        if BaseLLMClient._response_cache is None:
+            BaseLLMClient._response_cache = ResponseCache(
+                max_entries=self.settings.response_cache_max_entries,
+                ttl=self.settings.response_cache_ttl,
+                disk_path=self.settings.response_cache_disk_path
+            )
+        return BaseLLMClient._response_cache
+
+    @classmethod
+    def response_cache_stats(cls) -> Dict[str, Any]:
+        """응답 캐시 통계 (hit / miss / eviction)"""
+        cache = BaseLLMClient._response_cache
+        return cache.stats().to_dict() if cache else {}
+
+    def _cache_identity(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """캐시 키 대상 페이로드 (스트림 여부는 제외해 일반/스트림 요청이 캐시를 공유)"""
+        return {key: value for key, value in payload.items() if key != "stream"}
+
+    async def _record_stream(
+            self,
+            cache: ResponseCache,
+            key: str,
+            chunks: AsyncIterator[StreamDelta],
+            payload: Dict[str, Any]
+    ) -> AsyncIterator[StreamDelta]:
+        """스트림을 그대로 전달하면서 정상 종료된 응답만 캐시에 저장"""
+        content_parts: List[str] = []
+        finish_reason = None
+        usage: Dict[str, Any] = {}
+
+        async for chunk in chunks:
+            if chunk.content:
+                content_parts.append(chunk.content)
+            finish_reason = chunk.finish_reason or finish_reason
+            if chunk.usage:
+                usage = chunk.usage
+            yield chunk
+
+        if finish_reason:
+            completion = Completion("".join(content_parts), finish_reason, usage, payload.get("model"))
+            await cache.set(key, completion.to_dict())
+
+    async def _replay_stream(self, response: Completion) -> AsyncIterator[StreamDelta]:
+        """캐시된 완료 응답을 스트림 청크 형식으로 재생"""
+        for delta in response.to_stream():
+            yield delta
+
+    # ========================================
+    # 토큰 예산
+    # ========================================
+
+    def _get_token_budget(self) -> Optional[TokenBudget]:
+        """설정에서 활성화된 경우 공유 토큰 예산 관리자 반환"""
+        if not self.settings.token_budget_enabled:
+            return None
+        if BaseLLMClient._token_budget is None:
+            BaseLLMClient._token_budget = TokenBudget(
+                strategy=self.settings.token_budget_strategy,
+                summary_tokens=self.settings.token_budget_summary_tokens
+            )
+        return BaseLLMClient._token_budget
+
+    def _apply_token_budget(self, payload: Dict[str, Any]) -> Optional[BudgetResult]:
+        """컨텍스트 길이(최대 출력 토큰 제외)와 지연 예산에 맞게 payload의 대화 기록 정리"""
+        budgeter = self._get_token_budget()
+        if budgeter is None:
+            return None
+        container = payload if "messages" in payload else payload.get("input", {})
+        messages = container.get("messages")
+        if not messages:
+            return None
+
+        model = payload.get("model")
+        max_tokens = payload.get("max_tokens") or payload.get("parameters", {}).get("max_tokens") or 0
+        budget = self._context_limit(model) - int(max_tokens)
+        if self.settings.token_budget_max_prompt_tokens:
+            budget = min(budget, self.settings.token_budget_max_prompt_tokens)
+
+        # Claude는 system 프롬프트가 messages 밖에 있음
+        fixed_tokens = 0
+        if payload.get("system"):
+            fixed_tokens = budgeter.count_message({"content": payload["system"]}, budgeter.estimator(model))
+
+        result = budgeter.fit(messages, model, budget, fixed_tokens, summary_in_messages=self.system_in_messages)
+        if result.changed:
+            container["messages"] = result.messages
+            if result.summary and not self.system_in_messages:
+                self._add_system_summary(payload, result.summary)
+        return result
+
+    @staticmethod
+    def _add_system_summary(payload: Dict[str, Any], summary: str) -> None:
+        """토큰 예산 요약을 messages 밖 system 프롬프트 끝에 추가 (system_in_messages=False인 제공자용)
+
+        캐시 중단점이 지정된 system 블록 뒤에 붙이므로 캐시된 접두어는 유지됩니다.
+        """
+        system = payload.get("system")
+        if not system:
+            payload["system"] = summary
+        elif isinstance(system, str):
+            payload["system"] = f"{system}\n\n{summary}"
+        else:
+            payload["system"] = [*system, {"type": "text", "text": summary}]
+
+    def _context_limit(self, model: Optional[str]) -> int:
+        """모델 컨텍스트 길이 (설정의 모델 -> 제공자 조회 값 -> 설정의 계열 -> 계열 기본값 순)"""
+        limits = self.settings.token_budget_context_limits
+        if model and model in limits:
+            return int(limits[model])
+        known = self._model_context_length(model)
+        if known:
+            return known
+        family = model_family(model)
+        return int(limits.get(family, DEFAULT_CONTEXT_LIMITS.get(family, DEFAULT_CONTEXT_LIMITS["default"])))
+
+    def _model_context_length(self, model: Optional[str]) -> Optional[int]:
+        """제공자가 알려주는 모델 컨텍스트 길이 (하위 클래스에서 재정의, 네트워크 호출 없이 반환)"""
+        return None
+
+    @classmethod
+    def token_budget_stats(cls) -> Dict[str, Any]:
+        """토큰 예산 통계 (정리된 호출 수 / 절약한 토큰 수)"""
+        budgeter = BaseLLMClient._token_budget
+        return budgeter.stats().to_dict() if budgeter else {}
+
+    # ========================================
+    # 요청 제한 / 재시도
+    # ========================================
+
+    async def _limited_completion(self, payload: Dict[str, Any]) -> Completion:
+        """요청 제한 슬롯 안에서 호출하고 재시도 가능한 오류는 백오프 후 재시도"""
+        limiter = self._get_rate_limiter(payload)
+        breaker = self._get_circuit_breaker(payload)
+        policy = self._retry_policy()
+        estimated = self._estimate_tokens(payload)
+        timer = self._start_timer(payload, stream=False)
+        timeouts = self._get_phase_timeouts(payload)
+        deadline = self._total_deadline(timeouts)
+        response: Optional[Completion] = None
+        error: Optional[BaseException] = None
+        attempt = 0
+
+        try:
+            while True:
+                timer_token = _current_timer.set(timer) if timer else None
+                try:
+                    if breaker:
+                        # 서킷이 열려 있으면 대기열에 들어가기 전에 즉시 실패
+                        breaker.check()
+                    async with limiter.slot(estimated) as queue_wait:
+                        if timer:
+                            timer.on_attempt(queue_wait)
+                        with breaker.guard() if breaker else nullcontext():
+                            response = await with_deadline(
+                                self._regular_completion(payload), timeouts, deadline, self.provider_name
+                            )
+                except Exception as e:
+                    self._count_timeout(payload, e)
+                    delay = policy.next_delay(e, attempt)
+                    if delay is None or not self._retry_fits(deadline, delay):
+                        raise
+                else:
+                    limiter.record_usage(estimated, self._usage_tokens(response.usage))
+                    return response
+                finally:
+                    if timer_token is not None:
+                        _current_timer.reset(timer_token)
+
+                # 대기는 슬롯 밖에서 (다른 요청의 동시성 한도를 점유하지 않음)
+                limiter.record_retry()
+                attempt += 1
+                await asyncio.sleep(delay)
+
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            if timer:
+                self._record_metrics(timer, response.usage if response else None, error)
+
+    async def _limited_stream(self, payload: Dict[str, Any]) -> AsyncIterator[StreamDelta]:
+        """스트림 버전: 첫 청크 전송 전에 발생한 오류만 재시도"""
+        limiter = self._get_rate_limiter(payload)
+        breaker = self._get_circuit_breaker(payload)
+        policy = self._retry_policy()
+        estimated = self._estimate_tokens(payload)
+        timer = self._start_timer(payload, stream=True)
+        timeouts = self._get_phase_timeouts(payload)
+        deadline = self._total_deadline(timeouts)
+        usage: Optional[Dict[str, Any]] = None
+        error: Optional[BaseException] = None
+        attempt = 0
+
+        try:
+            while True:
+                started = False
+                usage = None
+                timer_token = _current_timer.set(timer) if timer else None
+                try:
+                    if breaker:
+                        breaker.check()
+                    async with limiter.slot(estimated) as queue_wait:
+                        if timer:
+                            timer.on_attempt(queue_wait)
+                        with breaker.guard() if breaker else nullcontext() as outcome:
+                            guarded = guard_stream(
+                                self._stream_completion(payload), timeouts, deadline, self.provider_name
+                            )
+                            async with aclosing(guarded) as chunks:
+                                async for chunk in chunks:
+                                    if not started:
+                                        started = True
+                                        if outcome:
+                                            outcome.mark_first_token()
+                                        # 응답 헤더 수신 후에는 호출자 컨텍스트로 타이머가 새지 않도록 해제
+                                        if timer_token is not None:
+                                            _current_timer.reset(timer_token)
+                                            timer_token = None
+                                    if chunk.usage:
+                                        usage = chunk.usage
+                                    if timer and chunk.content:
+                                        timer.on_token()
+                                    yield chunk
+                except Exception as e:
+                    self._count_timeout(payload, e)
+                    # 첫 청크 전 오류(ttft 초과 포함)만 재시도, 중간에 멈춘 스트림은 호출자(폴백 / 헤지)가 처리
+                    delay = None if started else policy.next_delay(e, attempt)
+                    if delay is None or not self._retry_fits(deadline, delay):
+                        raise
+                else:
+                    limiter.record_usage(estimated, self._usage_tokens(usage))
+                    return
+                finally:
+                    if timer_token is not None:
+                        _current_timer.reset(timer_token)
+
+                limiter.record_retry()
+                attempt += 1
+                await asyncio.sleep(delay)
+
+        except GeneratorExit:
+            # 소비자가 스트림을 먼저 닫은 경우 (정상 종료로 기록)
+            raise
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            if timer:
+                self._record_metrics(timer, usage, error)
+
+    def _get_rate_limiter(self, payload: Dict[str, Any]) -> ProviderRateLimiter:
+        """제공자/모델별 제한기 반환 (설정은 "제공자:모델" -> "제공자" 순으로 적용)"""
+        key = f"{self.pool_key}:{payload.get('model', '')}"
+        limiter = BaseLLMClient._rate_limiters.get(key)
+        if limiter is None:
+            config: Dict[str, float] = {"max_concurrency": self.settings.rate_limit_max_concurrency}
+            config.update(self.settings.rate_limits.get(self.pool_key, {}))
+            config.update(self.settings.rate_limits.get(key, {}))
+            limiter = ProviderRateLimiter(
+                key,
+                requests_per_minute=config.get("requests_per_minute"),
+                tokens_per_minute=config.get("tokens_per_minute"),
+                max_concurrency=int(config["max_concurrency"]),
+                min_concurrency=int(config.get("min_concurrency", 1))
+            )
+            BaseLLMClient._rate_limiters[key] = limiter
+        return limiter
+
+    def _get_circuit_breaker(self, payload: Dict[str, Any]) -> Optional[CircuitBreaker]:
+        """모델별 서킷 브레이커 반환 (비활성화 시 None)"""
+        if not self.settings.circuit_breaker_enabled:
+            return None
+        key = f"{self.pool_key}:{payload.get('model', '')}"
+        breaker = BaseLLMClient._circuit_breakers.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                key,
+                self.provider_name,
+                window_seconds=self.settings.circuit_window_seconds,
+                min_calls=self.settings.circuit_min_calls,
+                failure_rate_threshold=self.settings.circuit_failure_rate_threshold,
+                slow_call_seconds=self.settings.circuit_slow_call_seconds,
+                slow_call_rate_threshold=self.settings.circuit_slow_call_rate_threshold,
+                open_seconds=self.settings.circuit_open_seconds,
+                half_open_probes=self.settings.circuit_half_open_probes
+            )
+            BaseLLMClient._circuit_breakers[key] = breaker
+        return breaker
+
+    @classmethod
+    def circuit_breaker_stats(cls) -> Dict[str, Dict[str, Any]]:
+        """모델별 서킷 상태 조회"""
+        return {
+            key: breaker.stats().to_dict()
+            for key, breaker in BaseLLMClient._circuit_breakers.items()
+        }
+
+    def _retry_policy(self) -> RetryPolicy:
+        return RetryPolicy(
+            max_attempts=self.settings.retry_max_attempts,
+            base_delay=self.settings.retry_base_delay,
+            max_delay=self.settings.retry_max_delay
+        )
+
+    @classmethod
+    def rate_limiter_stats(cls) -> Dict[str, Dict[str, Any]]:
+        """제한기 상태 조회 (대기 시간 / 업스트림 시간 / 429 횟수 / 동시성 한도)"""
+        return {
+            key: limiter.stats().to_dict()
+            for key, limiter in BaseLLMClient._rate_limiters.items()
+        }
+
+    @staticmethod
+    def _estimate_tokens(payload: Dict[str, Any]) -> int:
+        """TPM 버킷 차감용 토큰 추정 (문자 4개당 1토큰 + 최대 출력 토큰)"""
+        messages = payload.get("messages") or payload.get("input", {}).get("messages") or []
+        chars = sum(len(str(message.get("content", ""))) for message in messages)
+        chars += len(str(payload.get("system", "")))
+        max_tokens = payload.get("max_tokens") or payload.get("parameters", {}).get("max_tokens") or 0
+        return chars // 4 + int(max_tokens)
+
+    @staticmethod
+    def _usage_tokens(usage: Optional[Dict[str, Any]]) -> Optional[int]:
+        """제공자별 usage에서 총 토큰 수 추출"""
+        if not usage:
+            return None
+        if usage.get("total_tokens") is not None:
+            return int(usage["total_tokens"])
+        prompt = usage.get("prompt_tokens", usage.get("input_tokens", 0)) or 0
+        completion = usage.get("completion_tokens", usage.get("output_tokens", 0)) or 0
+        return int(prompt) + int(completion)
+
+    # ========================================
+    # 단계별 타임아웃
+    # ========================================
+
+    def _get_phase_timeouts(self, payload: Dict[str, Any]) -> PhaseTimeouts:
+        """제공자/모델별 단계 타임아웃 (설정은 "제공자:모델" -> "제공자" -> 기본값 순으로 적용)"""
+        key = f"{self.pool_key}:{payload.get('model', '')}"
+        timeouts = BaseLLMClient._phase_timeouts.get(key)
+        if timeouts is None:
+            config: Dict[str, Optional[float]] = {
+                "connect": self.settings.connect_timeout,
+                "ttft": self.settings.ttft_timeout or self.settings.timeout,
+                "idle": self.settings.idle_timeout or self.settings.timeout,
+                "total": self.settings.total_timeout,
+            }
+            config.update(self.settings.phase_timeouts.get(self.pool_key, {}))
+            config.update(self.settings.phase_timeouts.get(key, {}))
+            timeouts = BaseLLMClient._phase_timeouts[key] = PhaseTimeouts(**config)
+        return timeouts
+
+    def _upstream_timeout(self, payload: Dict[str, Any]) -> httpx.Timeout:
+        """채팅 요청용 httpx 타임아웃 (연결 단계만, 읽기 단계는 청크 데드라인으로 관리)"""
+        return self._get_phase_timeouts(payload).httpx_timeout()
+
+    @staticmethod
+    def _total_deadline(timeouts: PhaseTimeouts) -> Optional[float]:
+        if timeouts.total is None:
+            return None
+        return asyncio.get_running_loop().time() + timeouts.total
+
+    @staticmethod
+    def _retry_fits(deadline: Optional[float], delay: float) -> bool:
+        """재시도 대기 후에도 전체 한도가 남는지"""
+        return deadline is None or asyncio.get_running_loop().time() + delay < deadline
+
+    def _count_timeout(self, payload: Dict[str, Any], error: BaseException) -> None:
+        if isinstance(error, LLMTimeoutError):
+            phase = error.phase
+        elif isinstance(error, (httpx.ConnectTimeout, httpx.PoolTimeout)):
+            phase = "connect"
+        else:
+            return
+        key = f"{self.pool_key}:{payload.get('model', '')}:{phase}"
+        BaseLLMClient._timeout_counts[key] = BaseLLMClient._timeout_counts.get(key, 0) + 1
+
+    @classmethod
+    def timeout_stats(cls) -> Dict[str, Any]:
+        """단계 타임아웃 설정과 발생 수 ("제공자:모델:단계" -> 횟수)"""
+        return {
+            "limits": {key: timeouts.to_dict() for key, timeouts in BaseLLMClient._phase_timeouts.items()},
+            "counts": dict(BaseLLMClient._timeout_counts)
+        }
+
+    # ========================================
+    # 지연 / 토큰 지표
+    # ========================================
+
+    def _start_timer(self, payload: Dict[str, Any], stream: bool) -> Optional[RequestTimer]:
+        if not self.settings.metrics_enabled:
+            return None
+        return RequestTimer(self.pool_key, str(payload.get("model", "")), stream)
+
+    def _record_metrics(
+            self,
+            timer: RequestTimer,
+            usage: Optional[Dict[str, Any]],
+            error: Optional[BaseException]
+    ) -> None:
+        BaseLLMClient._metrics.record(timer, timer.finish(usage, error))
+
+    @classmethod
+    def add_metrics_callback(cls, callback: Callable[[RequestMetrics], None]) -> None:
+        """호출별 측정값(RequestMetrics) 수신 콜백 등록"""
+        BaseLLMClient._metrics.add_callback(callback)
+
+    @classmethod
+    def remove_metrics_callback(cls, callback: Callable[[RequestMetrics], None]) -> None:
+        BaseLLMClient._metrics.remove_callback(callback)
+
+    @classmethod
+    def metrics_snapshot(cls) -> Dict[str, Dict[str, Any]]:
+        """제공자:모델별 지연 히스토그램 요약 (queue_wait / connect / ttft / itl / duration)과 토큰 수"""
+        return BaseLLMClient._metrics.snapshot()
+
+    @classmethod
+    def metrics_prometheus(cls) -> str:
+        """지표를 Prometheus 텍스트 형식으로 반환"""
+        return BaseLLMClient._metrics.to_prometheus()
+
+    # ========================================
+    # 공통 응답 처리
+    # ========================================
+
     def _handle_error(self, response: httpx.Response, provider: str):
-        """공통 에러 처리"""
-        if response.status_code == 401:
-            raise Exception(f"{provider}: 인증 실패 - API 키를 확인하세요")
-        elif response.status_code == 402:
-            raise Exception(f"{provider}: 크레딧이 부족합니다")
-        elif response.status_code == 429:
-            raise Exception(f"{provider}: 요청 한도 초과")
+        """공통 에러 처리 (상태 코드와 Retry-After를 담은 LLMAPIError 발생)"""
+        status_code = response.status_code
+        retry_after = parse_retry_after(response.headers.get("retry-after"))
+        if status_code == 401:
+            message = f"{provider}: 인증 실패 - API 키를 확인하세요"
+        elif status_code == 402:
+            message = f"{provider}: 크레딧이 부족합니다"
+        elif status_code == 429:
+            message = f"{provider}: 요청 한도 초과"
         else:
-            raise Exception(f"{provider}: API 호출 실패 ({response.status_code}) - {response.text}")
-
-    def _parse_sse_line(self, line: str) -> Optional[Dict[str, Any]]:
-        """Server-Sent Events 라인 파싱"""
-        if line.startswith("data: "):
-            data = line[6:]  # "data: " 제거
-            if data.strip() == "[DONE]":
-                return None
-            try:
-                return json.loads(data)
-            except json.JSONDecodeError:
-                return None
-        return None
\ No newline at end of file
+            message = f"{provider}: API 호출 실패 ({status_code}) - {response.text}"
+        raise LLMAPIError(message, provider, status_code=status_code, retry_after=retry_after)
+
+    # ========================================
+    # 스트림 처리
+    # ========================================
+
+    async def _stream_sse(self, url: str, payload: Dict[str, Any]) -> AsyncIterator[StreamDelta]:
+        """SSE 스트림 요청 후 제공자별 매핑(_map_stream_event)을 거쳐 청크 반환"""
+        client = self._get_http_client()
+        async with client.stream(
+                "POST",
+                url,
+                headers=self.headers,
+                json=payload,
+                timeout=self._upstream_timeout(payload)
+        ) as response:
+
+            if response.status_code != 200:
+                await response.aread()
+                self._handle_error(response, self.provider_name)
+
+            async for chunk in self._iter_stream_events(response):
+                yield chunk
+
+    async def _iter_stream_events(self, response: httpx.Response) -> AsyncIterator[StreamDelta]:
+        """응답 바이트를 SSE 이벤트로 디코딩하고 청크로 변환"""
+        decoder = SSEDecoder(self.json_loads)
+        # 압축 응답이 아니면 디코딩 단계 없이 원시 바이트 사용
+        if "content-encoding" in response.headers:
+            byte_stream = response.aiter_bytes()
+        else:
+            byte_stream = response.aiter_raw()
+
+        async for raw in byte_stream:
+            for event in decoder.feed(raw):
+                chunk = self._map_stream_event(event)
+                if chunk is not None:
+                    yield chunk
+
+        for event in decoder.flush():
+            chunk = self._map_stream_event(event)
+            if chunk is not None:
+                yield chunk
+
+    def _map_stream_event(self, event: SSEEvent) -> Optional[StreamDelta]:
+        """SSE 이벤트 -> StreamDelta 변환 (기본: OpenAI 호환 스트림)"""
+        if event.is_done:
+            return None
+        try:
+            return StreamDelta.from_openai(event.json())
+        except ValueError:
+            return None
+
+
+def _provider_classes() -> List[type]:
+    """BaseLLMClient의 모든 하위 클래스 (정의된 제공자 클라이언트)"""
+    classes: List[type] = []
+    pending = list(BaseLLMClient.__subclasses__())
+    while pending:
+        provider_cls = pending.pop()
+        classes.append(provider_cls)
+        pending.extend(provider_cls.__subclasses__())
+    return classes
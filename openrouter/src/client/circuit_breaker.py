@@ -0,0 +1,234 @@
+# clients/circuit_breaker.py
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, Iterator, Optional, Tuple
+
+from .errors import LLMAPIError
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(LLMAPIError):
+    """서킷이 열려 있어 호출하지 않고 즉시 실패"""
+
+    def __init__(self, key: str, provider: str, retry_after: Optional[float] = None):
+        super().__init__(f"{key}: 서킷 열림 - 호출 차단됨", provider, retry_after=retry_after)
+        self.key = key
+
+
+def counts_as_failure(error: BaseException) -> bool:
+    """모델 상태 판단에 반영할 오류인지 (인증/요청 오류 등 4xx는 제외)"""
+    if isinstance(error, CircuitOpenError):
+        return False
+    if isinstance(error, LLMAPIError):
+        return error.status_code is None or error.is_retryable
+    # 네트워크 오류(httpx.TransportError), 응답 형식 오류 등
+    return True
+
+
+class CallOutcome:
+    """호출 하나의 지연 측정 (스트림은 첫 토큰까지의 시간)"""
+    __slots__ = ("started_at", "first_token_at", "_clock")
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self.started_at = clock()
+        self.first_token_at: Optional[float] = None
+
+    def mark_first_token(self) -> None:
+        if self.first_token_at is None:
+            self.first_token_at = self._clock()
+
+    def latency(self) -> float:
+        end = self.first_token_at if self.first_token_at is not None else self._clock()
+        return end - self.started_at
+
+
+@dataclass
+class CircuitBreakerStats:
+    """서킷 상태 스냅샷"""
+    key: str
+    state: str
+    calls: int
+    failure_rate: float
+    slow_call_rate: float
+    opened: int
+    rejected: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class CircuitBreaker:
+    """모델 단위 서킷 브레이커 (구간 내 오류율 / 지연 호출 비율 기반)
+
+    CLOSED: 최근 window_seconds 동안의 호출이 min_calls 이상이고 오류율 또는 지연 호출 비율이
+            임계값 이상이면 OPEN
+    OPEN: open_seconds 동안 즉시 실패, 이후 HALF_OPEN
+    HALF_OPEN: half_open_probes개의 시험 호출만 허용, 모두 성공하면 CLOSED, 하나라도 실패하면 OPEN
+
+    clock: 시각 조회 함수 (테스트에서 가짜 시계로 교체)
+    """
+
+    def __init__(
+            self,
+            key: str,
+            provider: str,
+            window_seconds: float = 60.0,
+            min_calls: int = 10,
+            failure_rate_threshold: float = 0.5,
+            slow_call_seconds: float = 10.0,
+            slow_call_rate_threshold: float = 0.8,
+            open_seconds: float = 30.0,
+            half_open_probes: int = 1,
+            clock: Callable[[], float] = time.monotonic
+    ):
+        self.key = key
+        self.provider = provider
+        self.window_seconds = window_seconds
+        self.min_calls = min_calls
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.open_seconds = open_seconds
+        self.half_open_probes = half_open_probes
+        self._clock = clock
+
+        self.state = CircuitState.CLOSED
+        # (시각, 실패 여부, 지연 여부)
+        self._calls: Deque[Tuple[float, bool, bool]] = deque()
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        self._opened_count = 0
+        self._rejected_count = 0
+
+    def check(self) -> None:
+        """호출 가능 여부만 확인 (열려 있으면 CircuitOpenError)"""
+        if self.state == CircuitState.OPEN and not self._open_elapsed():
+            self._reject()
+        if self.state == CircuitState.HALF_OPEN and self._probes_in_flight >= self.half_open_probes:
+            self._reject()
+
+    @contextmanager
+    def guard(self) -> Iterator[CallOutcome]:
+        """호출 구간 감시 (결과를 구간 통계에 반영)"""
+        probe = self._acquire()
+        outcome = CallOutcome(self._clock)
+        try:
+            yield outcome
+        except Exception as e:
+            if counts_as_failure(e):
+                self._on_failure(probe)
+            else:
+                self._on_abandon(probe)
+            raise
+        except BaseException:
+            # 취소 / 스트림 조기 종료: 첫 토큰을 받았으면 정상 응답으로 간주
+            if outcome.first_token_at is not None:
+                self._on_success(probe, outcome.latency())
+            else:
+                self._on_abandon(probe)
+            raise
+        else:
+            self._on_success(probe, outcome.latency())
+
+    def stats(self) -> CircuitBreakerStats:
+        self._evict(self._clock())
+        calls = len(self._calls)
+        failures = sum(1 for _, failed, _ in self._calls if failed)
+        slow = sum(1 for _, _, is_slow in self._calls if is_slow)
+        return CircuitBreakerStats(
+            key=self.key,
+            state=self.state.value,
+            calls=calls,
+            failure_rate=round(failures / calls, 4) if calls else 0.0,
+            slow_call_rate=round(slow / calls, 4) if calls else 0.0,
+            opened=self._opened_count,
+            rejected=self._rejected_count
+        )
+
+    # ---------- 상태 전이 ----------
+
+    def _acquire(self) -> bool:
+        """호출 허용 (HALF_OPEN 시험 호출이면 True)"""
+        if self.state == CircuitState.OPEN:
+            if not self._open_elapsed():
+                self._reject()
+            self.state = CircuitState.HALF_OPEN
+            self._probes_in_flight = 0
+            self._probe_successes = 0
+
+        if self.state == CircuitState.HALF_OPEN:
+            if self._probes_in_flight >= self.half_open_probes:
+                self._reject()
+            self._probes_in_flight += 1
+            return True
+        return False
+
+    def _on_success(self, probe: bool, latency: float) -> None:
+        slow = latency >= self.slow_call_seconds
+        if probe:
+            self._probes_in_flight -= 1
+            if slow:
+                self._open()
+                return
+            self._probe_successes += 1
+            if self._probe_successes >= self.half_open_probes:
+                self.state = CircuitState.CLOSED
+                self._calls.clear()
+            return
+        self._record(False, slow)
+
+    def _on_failure(self, probe: bool) -> None:
+        if probe:
+            self._probes_in_flight -= 1
+            self._open()
+            return
+        self._record(True, False)
+
+    def _on_abandon(self, probe: bool) -> None:
+        if probe:
+            self._probes_in_flight -= 1
+
+    def _record(self, failed: bool, slow: bool) -> None:
+        if self.state != CircuitState.CLOSED:
+            return
+        now = self._clock()
+        self._calls.append((now, failed, slow))
+        self._evict(now)
+
+        calls = len(self._calls)
+        if calls < self.min_calls:
+            return
+        failures = sum(1 for _, is_failed, _ in self._calls if is_failed)
+        slow_calls = sum(1 for _, _, is_slow in self._calls if is_slow)
+        if (failures / calls >= self.failure_rate_threshold
+                or slow_calls / calls >= self.slow_call_rate_threshold):
+            self._open()
+
+    def _open(self) -> None:
+        self.state = CircuitState.OPEN
+        self._opened_at = self._clock()
+        self._opened_count += 1
+        self._calls.clear()
+
+    def _open_elapsed(self) -> bool:
+        return self._clock() - self._opened_at >= self.open_seconds
+
+    def _reject(self) -> None:
+        self._rejected_count += 1
+        remaining = max(0.0, self.open_seconds - (self._clock() - self._opened_at))
+        raise CircuitOpenError(self.key, self.provider, retry_after=remaining)
+
+    def _evict(self, now: float) -> None:
+        cutoff = now - self.window_seconds
+        while self._calls and self._calls[0][0] < cutoff:
+            self._calls.popleft()
@@ -1,12 +1,16 @@
 # clients/claude_client.py
-import json
-
-from openrouter.src.client.base_client import BaseLLMClient
-import httpx
+from ..base_client import BaseLLMClient, SSEEvent
+from ..completion_types import Completion, StreamDelta
+from ..errors import LLMAPIError
 from typing import AsyncIterator, Union, List, Dict, Any, Optional
 
 
 class ClaudeClient(BaseLLMClient):
+    provider_name = "Claude"
+
+    # Messages API는 system 역할 메시지를 받지 않음 (system 프롬프트는 payload["system"])
+    system_in_messages = False
+
     def __init__(self, settings):
         super().__init__(settings)
         self.base_url = "https://api.anthropic.com/v1"
@@ -16,6 +20,9 @@ class ClaudeClient(BaseLLMClient):
             "anthropic-version": "2023-06-01"
         }
 
+    # 요청당 최대 캐시 중단점 수 (Anthropic 제한)
+    MAX_CACHE_BREAKPOINTS = 4
+
     async def chat_completion(
             self,
             messages: List[Dict[str, str]],
@@ -24,8 +31,15 @@ class ClaudeClient(BaseLLMClient):
             temperature: Optional[float] = None,
             stream: bool = False,
             **kwargs
-    ) -> Union[Dict[str, Any], AsyncIterator[Dict[str, Any]]]:
-        """Claude Messages API 호출 (Stream 지원)"""
+    ) -> Union[Completion, AsyncIterator[StreamDelta]]:
+        """Claude Messages API 호출 (Stream 지원)
+
+        프롬프트 캐시 (settings.claude_prompt_cache_enabled 또는 cache_prompt=True):
+            - system 프롬프트와 tools 스키마 끝에 캐시 중단점 지정
+            - {"role": "user", "content": "...", "cache": True}처럼 표시한 메시지(재사용 검색 문서 등)도
+              중단점으로 지정 (요청당 최대 4개, 최근 메시지 우선)
+        """
+        cache_prompt = kwargs.get("cache_prompt", self.settings.claude_prompt_cache_enabled)
 
         # Claude는 system 메시지를 별도로 처리
         system_message = None
@@ -48,86 +62,138 @@ class ClaudeClient(BaseLLMClient):
             payload["system"] = system_message
         if temperature is not None:
             payload["temperature"] = temperature or self.settings.temperature
+        if kwargs.get("tools"):
+            payload["tools"] = list(kwargs["tools"])
+
+        self._apply_cache_breakpoints(payload, cache_prompt)
+        return await self._dispatch(payload, stream)
+
+    def _apply_cache_breakpoints(self, payload: Dict[str, Any], enabled: bool) -> None:
+        """고정 접두어(tools -> system -> 표시된 메시지)에 cache_control 지정, 표시용 cache 키는 제거"""
+        marked = [i for i, msg in enumerate(payload["messages"]) if msg.get("cache")]
+        if marked:
+            payload["messages"] = [
+                {k: v for k, v in msg.items() if k != "cache"} if "cache" in msg else msg
+                for msg in payload["messages"]
+            ]
+        if not enabled:
+            return
+
+        cache_control = {"type": "ephemeral"}
+        if self.settings.claude_prompt_cache_ttl != "5m":
+            cache_control["ttl"] = self.settings.claude_prompt_cache_ttl
+        remaining = self.MAX_CACHE_BREAKPOINTS
+
+        if payload.get("tools"):
+            payload["tools"][-1] = {**payload["tools"][-1], "cache_control": cache_control}
+            remaining -= 1
+
+        if payload.get("system"):
+            payload["system"] = self._with_cache_control(payload["system"], cache_control)
+            remaining -= 1
+
+        for index in marked[-remaining:] if remaining > 0 else []:
+            message = payload["messages"][index]
+            payload["messages"][index] = {
+                **message,
+                "content": self._with_cache_control(message["content"], cache_control)
+            }
+
+    @staticmethod
+    def _with_cache_control(content: Any, cache_control: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """문자열 / 콘텐츠 블록 목록의 마지막 블록에 cache_control 지정"""
+        if isinstance(content, str):
+            return [{"type": "text", "text": content, "cache_control": cache_control}]
+        blocks = list(content)
+        blocks[-1] = {**blocks[-1], "cache_control": cache_control}
+        return blocks
+
+    @staticmethod
+    def _normalize_usage(usage: Dict[str, Any]) -> Dict[str, Any]:
+        """Claude usage를 OpenAI 형식으로 정규화 (원본 필드 유지, 캐시 읽기/쓰기 토큰 포함)
+
+        Claude의 input_tokens는 캐시되지 않은 입력만 세므로 prompt_tokens는 캐시 토큰을 합산합니다.
+        """
+        if not usage:
+            return {}
+        cache_read = int(usage.get("cache_read_input_tokens") or 0)
+        cache_write = int(usage.get("cache_creation_input_tokens") or 0)
+        prompt_tokens = int(usage.get("input_tokens") or 0) + cache_read + cache_write
+        completion_tokens = int(usage.get("output_tokens") or 0)
+        return {
+            **usage,
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+            "cache_read_tokens": cache_read,
+            "cache_write_tokens": cache_write,
+            "prompt_tokens_details": {"cached_tokens": cache_read}
+        }
 
-        if stream:
-            return self._stream_completion(payload)
-        else:
-            return await self._regular_completion(payload)
-
-    async def _regular_completion(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+    async def _regular_completion(self, payload: Dict[str, Any]) -> Completion:
         """일반 완료 요청"""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/messages",
-                headers=self.headers,
-                json=payload,
-                timeout=self.timeout
+        client = self._get_http_client()
+        response = await client.post(
+            f"{self.base_url}/messages",
+            headers=self.headers,
+            json=payload,
+            timeout=self._upstream_timeout(payload)
+        )
+
+        if response.status_code == 200:
+            # Claude 응답을 공통 형식으로 변환
+            claude_response = response.json()
+            return Completion(
+                content=claude_response["content"][0]["text"],
+                finish_reason=claude_response["stop_reason"],
+                usage=self._normalize_usage(claude_response.get("usage", {})),
+                model=claude_response["model"]
             )
-
-            if response.status_code == 200:
-                # Claude 응답을 OpenAI 형식으로 변환
-                claude_response = response.json()
-                return {
-                    "choices": [{
-                        "message": {
-                            "role": "assistant",
-                            "content": claude_response["content"][0]["text"]
-                        },
-                        "finish_reason": claude_response["stop_reason"]
-                    }],
-                    "usage": claude_response.get("usage", {}),
-                    "model": claude_response["model"]
-                }
-            else:
-                self._handle_error(response, "Claude")
-
-    async def _stream_completion(self, payload: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
-        """스트림 완료 요청"""
-        async with httpx.AsyncClient() as client:
-            async with client.stream(
-                    "POST",
-                    f"{self.base_url}/messages",
-                    headers=self.headers,
-                    json=payload,
-                    timeout=self.timeout
-            ) as response:
-
-                if response.status_code != 200:
-                    self._handle_error(response, "Claude")
-
-                async for line in response.aiter_lines():
-                    if line.strip():
-                        parsed_data = self._parse_claude_stream(line)
-                        if parsed_data:
-                            yield parsed_data
-
-    def _parse_claude_stream(self, line: str) -> Optional[Dict[str, Any]]:
-        """Claude 스트림 데이터 파싱"""
-        if line.startswith("data: "):
-            data = line[6:]
-            try:
-                claude_data = json.loads(data)
-
-                # Claude 스트림을 OpenAI 형식으로 변환
-                if claude_data.get("type") == "content_block_delta":
-                    return {
-                        "choices": [{
-                            "delta": {
-                                "content": claude_data["delta"]["text"]
-                            },
-                            "finish_reason": None
-                        }]
-                    }
-                elif claude_data.get("type") == "message_stop":
-                    return {
-                        "choices": [{
-                            "delta": {},
-                            "finish_reason": "stop"
-                        }]
-                    }
-                return None
-            except json.JSONDecodeError:
+        else:
+            self._handle_error(response, "Claude")
+
+    async def _stream_completion(self, payload: Dict[str, Any]) -> AsyncIterator[StreamDelta]:
+        """스트림 완료 요청 (message_start / message_delta의 usage를 합쳐 마지막 청크에 포함)"""
+        usage: Dict[str, Any] = {}
+        async for chunk in self._stream_sse(f"{self.base_url}/messages", payload):
+            if chunk.content is None and chunk.finish_reason is None:
+                usage.update(chunk.usage)
+                continue
+            if chunk.finish_reason and usage:
+                chunk.usage = self._normalize_usage(usage)
+            yield chunk
+
+    def _map_stream_event(self, event: SSEEvent) -> Optional[StreamDelta]:
+        """Claude 스트림 이벤트를 StreamDelta로 변환"""
+        try:
+            claude_data = event.json()
+        except ValueError:
+            return None
+
+        event_type = event.event or claude_data.get("type")
+
+        if event_type == "content_block_delta":
+            text = claude_data["delta"].get("text")
+            if text is None:
                 return None
+            return StreamDelta(text)
+        elif event_type == "message_start":
+            # 입력 / 캐시 토큰 (_stream_completion에서 합산)
+            return StreamDelta(usage=claude_data.get("message", {}).get("usage") or {})
+        elif event_type == "message_delta":
+            # 누적 출력 토큰
+            return StreamDelta(usage=claude_data.get("usage") or {})
+        elif event_type == "message_stop":
+            return StreamDelta(finish_reason="stop")
+        elif event_type == "error":
+            error = claude_data.get("error", {})
+            # overloaded_error는 HTTP 529와 동일하게 재시도 대상으로 처리
+            status_code = 529 if error.get("type") == "overloaded_error" else None
+            raise LLMAPIError(
+                f"Claude: 스트림 오류 - {error.get('message', claude_data)}",
+                "Claude",
+                status_code=status_code
+            )
         return None
 
     async def get_available_models(self) -> List[Dict[str, Any]]:
@@ -1,11 +1,12 @@
 # clients/client_factory.py
 from enum import Enum
-from typing import Dict, Type
+from typing import Dict, Type, List
 from .base_client import BaseLLMClient
-from openrouter.src.client.openai.openai_client import OpenAIClient
-from openrouter.src.client.claude.claude_client import ClaudeClient
-from openrouter.src.client.qwen.qwen_client import QwenClient
-from openrouter.src.client.openrouter.openrouter_client import OpenRouterClient
+from .openai.openai_client import OpenAIClient
+from .claude.claude_client import ClaudeClient
+from .qwen.qwen_client import QwenClient
+from .openrouter.openrouter_client import OpenRouterClient
+from .vllm.vllm_client import VLLMClient
 
 
 class ModelProvider(Enum):
@@ -13,6 +14,7 @@ class ModelProvider(Enum):
     CLAUDE = "claude"
     QWEN = "qwen"
     OPENROUTER = "openrouter"
+    VLLM = "vllm"
 
 
 class LLMClientFactory:
@@ -21,6 +23,7 @@ class LLMClientFactory:
         ModelProvider.CLAUDE: ClaudeClient,
         ModelProvider.QWEN: QwenClient,
         ModelProvider.OPENROUTER: OpenRouterClient,
+        ModelProvider.VLLM: VLLMClient,
     }
 
     @classmethod
@@ -0,0 +1,171 @@
+# clients/completion_types.py
+import copy
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
+
+
+class StreamDelta:
+    """스트림 청크 하나 (토큰당 dict 중첩 생성 없이 슬롯만 사용)
+
+    content: 증분 텍스트 (없으면 None)
+    finish_reason: 마지막 청크에서만 설정
+    usage: 토큰 사용량 (제공자가 보내는 청크에서만 설정)
+
+    기존 {"choices": [{"delta": {...}, "finish_reason": ...}]} 형식이 필요하면 to_dict() 사용
+    """
+    __slots__ = ("content", "finish_reason", "usage", "model")
+
+    def __init__(
+            self,
+            content: Optional[str] = None,
+            finish_reason: Optional[str] = None,
+            usage: Optional[Dict[str, Any]] = None,
+            model: Optional[str] = None
+    ):
+        self.content = content
+        self.finish_reason = finish_reason
+        self.usage = usage
+        self.model = model
+
+    @classmethod
+    def from_openai(cls, data: Dict[str, Any]) -> "StreamDelta":
+        """OpenAI 호환 스트림 청크 변환 (choices가 없는 usage 전용 청크 포함)"""
+        content = finish_reason = None
+        choices = data.get("choices")
+        if choices:
+            choice = choices[0]
+            content = (choice.get("delta") or {}).get("content")
+            finish_reason = choice.get("finish_reason")
+        return cls(content, finish_reason, data.get("usage"), data.get("model"))
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "StreamDelta":
+        return cls.from_openai(data)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """기존 OpenAI 형식 청크"""
+        chunk: Dict[str, Any] = {
+            "choices": [{
+                "delta": {"content": self.content} if self.content is not None else {},
+                "finish_reason": self.finish_reason
+            }]
+        }
+        if self.usage is not None:
+            chunk["usage"] = self.usage
+        if self.model is not None:
+            chunk["model"] = self.model
+        return chunk
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "StreamDelta":
+        return StreamDelta(self.content, self.finish_reason, copy.deepcopy(self.usage, memo), self.model)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, StreamDelta):
+            return NotImplemented
+        return (self.content, self.finish_reason, self.usage, self.model) == \
+            (other.content, other.finish_reason, other.usage, other.model)
+
+    def __repr__(self) -> str:
+        return f"StreamDelta(content={self.content!r}, finish_reason={self.finish_reason!r})"
+
+
+class Completion:
+    """완료 응답 (모든 제공자 공통 형식)
+
+    raw: OpenAI 호환 제공자의 원본 응답 (to_dict()에서 그대로 반환, 변환 제공자는 None)
+    """
+    __slots__ = ("content", "finish_reason", "usage", "model", "role", "raw")
+
+    def __init__(
+            self,
+            content: Optional[str],
+            finish_reason: Optional[str] = None,
+            usage: Optional[Dict[str, Any]] = None,
+            model: Optional[str] = None,
+            role: str = "assistant",
+            raw: Optional[Dict[str, Any]] = None
+    ):
+        self.content = content
+        self.finish_reason = finish_reason
+        self.usage = usage or {}
+        self.model = model
+        self.role = role
+        self.raw = raw
+
+    @classmethod
+    def from_openai(cls, data: Dict[str, Any], keep_raw: bool = True) -> "Completion":
+        """OpenAI 호환 응답 변환"""
+        choice = (data.get("choices") or [{}])[0]
+        message = choice.get("message") or {}
+        return cls(
+            content=message.get("content"),
+            finish_reason=choice.get("finish_reason"),
+            usage=data.get("usage") or {},
+            model=data.get("model"),
+            role=message.get("role") or "assistant",
+            raw=data if keep_raw else None
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Completion":
+        """to_dict() 결과 복원 (응답 캐시 저장 형식)"""
+        return cls.from_openai(data, keep_raw=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """기존 OpenAI 형식 응답"""
+        if self.raw is not None:
+            return self.raw
+        return {
+            "choices": [{
+                "message": {
+                    "role": self.role,
+                    "content": self.content
+                },
+                "finish_reason": self.finish_reason
+            }],
+            "usage": self.usage,
+            "model": self.model
+        }
+
+    def to_stream(self) -> List[StreamDelta]:
+        """스트림 청크로 재생 (캐시 응답을 스트림 요청에 반환할 때 사용)"""
+        deltas = [StreamDelta(self.content)] if self.content else []
+        deltas.append(StreamDelta(None, self.finish_reason or "stop", self.usage, self.model))
+        return deltas
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "Completion":
+        return Completion(
+            self.content,
+            self.finish_reason,
+            copy.deepcopy(self.usage, memo),
+            self.model,
+            self.role,
+            copy.deepcopy(self.raw, memo)
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Completion):
+            return NotImplemented
+        return (self.content, self.finish_reason, self.usage, self.model, self.role) == \
+            (other.content, other.finish_reason, other.usage, other.model, other.role)
+
+    def __repr__(self) -> str:
+        return f"Completion(model={self.model!r}, finish_reason={self.finish_reason!r}, content={self.content!r})"
+
+
+def legacy_dicts(
+        result: Union[Completion, AsyncIterator[StreamDelta]]
+) -> Union[Dict[str, Any], AsyncIterator[Dict[str, Any]]]:
+    """기존 OpenAI 형식 dict로 변환하는 호환 래퍼 (선택 사용, 토큰마다 dict를 생성하므로 이전 코드 이행용)
+
+        response = legacy_dicts(await client.chat_completion(messages))
+        async for chunk in legacy_dicts(await client.chat_completion(messages, stream=True)):
+            chunk["choices"][0]["delta"].get("content")
+    """
+    if isinstance(result, Completion):
+        return result.to_dict()
+    return _legacy_stream(result)
+
+
+async def _legacy_stream(chunks: AsyncIterator[StreamDelta]) -> AsyncIterator[Dict[str, Any]]:
+    async for chunk in chunks:
+        yield chunk.to_dict()
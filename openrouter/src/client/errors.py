@@ -0,0 +1,68 @@
+# clients/errors.py
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Optional
+
+# 재시도 가능한 HTTP 상태 코드 (5xx는 모두 재시도 대상)
+RETRYABLE_STATUS_CODES = {408, 409, 425, 429}
+
+
+class LLMAPIError(Exception):
+    """LLM 제공자 API 호출 실패 (상태 코드와 Retry-After 정보 포함)"""
+
+    def __init__(
+            self,
+            message: str,
+            provider: str,
+            status_code: Optional[int] = None,
+            retry_after: Optional[float] = None
+    ):
+        super().__init__(message)
+        self.provider = provider
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+    @property
+    def is_rate_limited(self) -> bool:
+        return self.status_code == 429
+
+    @property
+    def is_retryable(self) -> bool:
+        if self.status_code is None:
+            return False
+        return self.status_code in RETRYABLE_STATUS_CODES or self.status_code >= 500
+
+
+class LLMTimeoutError(LLMAPIError):
+    """단계별 대기 한도 초과 (phase: connect / ttft / idle / total)
+
+    전체 한도(total) 외에는 재시도 / 폴백 / 헤지 대상입니다.
+    """
+
+    def __init__(self, provider: str, phase: str, seconds: Optional[float] = None):
+        limit = f" ({seconds:g}초)" if seconds is not None else ""
+        super().__init__(f"{provider}: {phase} 대기 시간 초과{limit}", provider)
+        self.phase = phase
+        self.seconds = seconds
+
+    @property
+    def is_retryable(self) -> bool:
+        return self.phase != "total"
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 초 단위로 변환"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
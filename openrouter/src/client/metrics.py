@@ -0,0 +1,307 @@
+# clients/metrics.py
+import bisect
+import math
+import time
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+def _log_bounds(lowest: float, highest: float, steps_per_doubling: int) -> List[float]:
+    """로그 간격 버킷 경계 (상대 오차 약 2^(1/steps) - 1)"""
+    ratio = 2 ** (1.0 / steps_per_doubling)
+    count = int(math.ceil(math.log(highest / lowest, ratio))) + 1
+    return [lowest * ratio ** i for i in range(count)]
+
+
+# 0.1ms ~ 1000s, 약 9% 정밀도 (초 단위 지연 측정용)
+_LATENCY_BOUNDS = _log_bounds(0.0001, 1000.0, 8)
+
+
+class StreamingHistogram:
+    """고정 로그 버킷 스트리밍 히스토그램 (HDR 방식, 관측당 O(log n), 메모리 고정)"""
+    __slots__ = ("_bounds", "_counts", "count", "sum", "min", "max")
+
+    def __init__(self, bounds: Optional[List[float]] = None):
+        self._bounds = bounds or _LATENCY_BOUNDS
+        self._counts = [0] * (len(self._bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self._counts[bisect.bisect_left(self._bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, q: float) -> Optional[float]:
+        """q 분위수 (0~1, 버킷 상한 기준, 실제 최소/최대 범위로 보정)"""
+        if not self.count:
+            return None
+        target = max(1, int(math.ceil(q * self.count)))
+        cumulative = 0
+        for index, bucket_count in enumerate(self._counts):
+            cumulative += bucket_count
+            if cumulative >= target:
+                if index == 0:
+                    return self.min
+                upper = self._bounds[index] if index < len(self._bounds) else self.max
+                return min(max(upper, self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.sum / self.count if self.count else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        if not self.count:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "mean": round(self.mean, 6),
+            "min": round(self.min, 6),
+            "p50": round(self.percentile(0.5), 6),
+            "p90": round(self.percentile(0.9), 6),
+            "p99": round(self.percentile(0.99), 6),
+            "max": round(self.max, 6)
+        }
+
+
+@dataclass
+class RequestMetrics:
+    """LLM 호출 하나의 측정 결과 (시간 단위: 초)
+
+    queue_wait: 요청 제한기 대기 시간
+    connect: 새 커넥션 생성 시간 (TCP + TLS, 풀 재사용 시 0)
+    time_to_headers: 요청 시작부터 응답 헤더 수신까지
+    ttft: 요청 시작부터 첫 토큰까지 (스트림만)
+    mean_itl / p99_itl: 토큰 간 지연 (스트림만)
+    duration: 요청 시작부터 완료까지 (E2E)
+    """
+    provider: str
+    model: str
+    stream: bool
+    success: bool
+    attempts: int
+    queue_wait: float
+    connect: float
+    time_to_headers: Optional[float]
+    ttft: Optional[float]
+    mean_itl: Optional[float]
+    p99_itl: Optional[float]
+    duration: float
+    prompt_tokens: Optional[int]
+    completion_tokens: Optional[int]
+    error: Optional[str] = None
+    cache_read_tokens: Optional[int] = None
+    cache_write_tokens: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class RequestTimer:
+    """호출 하나의 구간별 시각 기록 (httpx 이벤트 훅 / httpcore trace에서 갱신)"""
+    __slots__ = (
+        "provider", "model", "stream", "started_at", "attempts", "queue_wait", "connect",
+        "headers_at", "first_token_at", "last_token_at", "itls", "_connect_started"
+    )
+
+    def __init__(self, provider: str, model: str, stream: bool):
+        self.provider = provider
+        self.model = model
+        self.stream = stream
+        self.started_at = time.perf_counter()
+        self.attempts = 0
+        self.queue_wait = 0.0
+        self.connect = 0.0
+        self.headers_at: Optional[float] = None
+        self.first_token_at: Optional[float] = None
+        self.last_token_at: Optional[float] = None
+        self.itls: List[float] = []
+        self._connect_started: Optional[float] = None
+
+    def on_attempt(self, queue_wait: float) -> None:
+        self.attempts += 1
+        self.queue_wait += queue_wait
+        # 재시도 시 토큰 측정은 마지막 시도 기준
+        self.first_token_at = self.last_token_at = None
+        self.itls = []
+
+    async def trace(self, event_name: str, info: Dict[str, Any]) -> None:
+        """httpcore trace 확장 (커넥션 생성 구간만 측정)"""
+        if event_name.endswith(("connect_tcp.started", "start_tls.started")):
+            self._connect_started = time.perf_counter()
+        elif event_name.endswith(("connect_tcp.complete", "start_tls.complete")) and self._connect_started:
+            self.connect += time.perf_counter() - self._connect_started
+            self._connect_started = None
+
+    def on_response_headers(self) -> None:
+        self.headers_at = time.perf_counter()
+
+    def on_token(self) -> None:
+        now = time.perf_counter()
+        if self.first_token_at is None:
+            self.first_token_at = now
+        else:
+            self.itls.append(now - self.last_token_at)
+        self.last_token_at = now
+
+    def finish(self, usage: Optional[Dict[str, Any]], error: Optional[BaseException] = None) -> RequestMetrics:
+        now = time.perf_counter()
+        mean_itl = p99_itl = None
+        if self.itls:
+            ordered = sorted(self.itls)
+            mean_itl = sum(ordered) / len(ordered)
+            p99_itl = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+        prompt_tokens, completion_tokens = usage_token_counts(usage)
+        return RequestMetrics(
+            provider=self.provider,
+            model=self.model,
+            stream=self.stream,
+            success=error is None,
+            attempts=self.attempts,
+            queue_wait=self.queue_wait,
+            connect=self.connect,
+            time_to_headers=self.headers_at - self.started_at if self.headers_at else None,
+            ttft=self.first_token_at - self.started_at if self.first_token_at else None,
+            mean_itl=mean_itl,
+            p99_itl=p99_itl,
+            duration=now - self.started_at,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            error=type(error).__name__ if error is not None else None,
+            cache_read_tokens=(usage or {}).get("cache_read_tokens"),
+            cache_write_tokens=(usage or {}).get("cache_write_tokens")
+        )
+
+
+def usage_token_counts(usage: Optional[Dict[str, Any]]) -> Tuple[Optional[int], Optional[int]]:
+    """제공자별 usage에서 (프롬프트, 완료) 토큰 수 추출"""
+    if not usage:
+        return None, None
+    prompt = usage.get("prompt_tokens", usage.get("input_tokens"))
+    completion = usage.get("completion_tokens", usage.get("output_tokens"))
+    return (
+        int(prompt) if prompt is not None else None,
+        int(completion) if completion is not None else None
+    )
+
+
+class _ModelSeries:
+    """제공자/모델 하나의 누적 지표"""
+    __slots__ = ("requests", "errors", "prompt_tokens", "completion_tokens",
+                 "cache_read_tokens", "cache_write_tokens", "histograms")
+
+    HISTOGRAMS = ("queue_wait", "connect", "time_to_headers", "ttft", "itl", "duration")
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.cache_read_tokens = 0
+        self.cache_write_tokens = 0
+        self.histograms = {name: StreamingHistogram() for name in self.HISTOGRAMS}
+
+
+class LLMMetrics:
+    """제공자/모델별 지연 히스토그램과 토큰 카운터 (콜백으로 개별 측정값 전달 가능)"""
+
+    def __init__(self):
+        self._series: Dict[Tuple[str, str], _ModelSeries] = {}
+        self._callbacks: List[Callable[[RequestMetrics], None]] = []
+
+    def add_callback(self, callback: Callable[[RequestMetrics], None]) -> None:
+        """측정값 수신 콜백 등록 (예: 로그, 외부 모니터링 전송)"""
+        self._callbacks.append(callback)
+
+    def remove_callback(self, callback: Callable[[RequestMetrics], None]) -> None:
+        if callback in self._callbacks:
+            self._callbacks.remove(callback)
+
+    def record(self, timer: RequestTimer, metrics: RequestMetrics) -> None:
+        series = self._series.get((metrics.provider, metrics.model))
+        if series is None:
+            series = self._series[(metrics.provider, metrics.model)] = _ModelSeries()
+
+        series.requests += 1
+        if not metrics.success:
+            series.errors += 1
+        series.prompt_tokens += metrics.prompt_tokens or 0
+        series.completion_tokens += metrics.completion_tokens or 0
+        series.cache_read_tokens += metrics.cache_read_tokens or 0
+        series.cache_write_tokens += metrics.cache_write_tokens or 0
+
+        histograms = series.histograms
+        histograms["queue_wait"].observe(metrics.queue_wait)
+        histograms["connect"].observe(metrics.connect)
+        histograms["duration"].observe(metrics.duration)
+        if metrics.time_to_headers is not None:
+            histograms["time_to_headers"].observe(metrics.time_to_headers)
+        if metrics.ttft is not None:
+            histograms["ttft"].observe(metrics.ttft)
+        itl_histogram = histograms["itl"]
+        for itl in timer.itls:
+            itl_histogram.observe(itl)
+
+        for callback in self._callbacks:
+            try:
+                callback(metrics)
+            except Exception:
+                # 콜백 오류가 요청 처리에 영향을 주지 않도록 무시
+                pass
+
+    def reset(self) -> None:
+        self._series.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """제공자:모델별 지표 요약 (JSON 직렬화 가능)"""
+        return {
+            f"{provider}:{model}": {
+                "requests": series.requests,
+                "errors": series.errors,
+                "prompt_tokens": series.prompt_tokens,
+                "completion_tokens": series.completion_tokens,
+                "cache_read_tokens": series.cache_read_tokens,
+                "cache_write_tokens": series.cache_write_tokens,
+                **{name: histogram.to_dict() for name, histogram in series.histograms.items()}
+            }
+            for (provider, model), series in self._series.items()
+        }
+
+    def to_prometheus(self, prefix: str = "llm_client") -> str:
+        """Prometheus 텍스트 형식 (지연은 summary, 요청/토큰은 counter)"""
+        lines: List[str] = []
+        counters = (
+            ("requests_total", "LLM 요청 수", lambda s: s.requests),
+            ("errors_total", "LLM 요청 실패 수", lambda s: s.errors),
+            ("prompt_tokens_total", "프롬프트 토큰 수", lambda s: s.prompt_tokens),
+            ("completion_tokens_total", "완료 토큰 수", lambda s: s.completion_tokens),
+            ("cache_read_tokens_total", "프롬프트 캐시 읽기 토큰 수", lambda s: s.cache_read_tokens),
+            ("cache_write_tokens_total", "프롬프트 캐시 쓰기 토큰 수", lambda s: s.cache_write_tokens),
+        )
+        for name, help_text, getter in counters:
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            for (provider, model), series in self._series.items():
+                lines.append(f'{prefix}_{name}{{provider="{provider}",model="{model}"}} {getter(series)}')
+
+        for metric in _ModelSeries.HISTOGRAMS:
+            name = f"{prefix}_{metric}_seconds"
+            lines.append(f"# HELP {name} {metric} 지연(초)")
+            lines.append(f"# TYPE {name} summary")
+            for (provider, model), series in self._series.items():
+                histogram = series.histograms[metric]
+                labels = f'provider="{provider}",model="{model}"'
+                for quantile in (0.5, 0.9, 0.99):
+                    value = histogram.percentile(quantile)
+                    if value is not None:
+                        lines.append(f'{name}{{{labels},quantile="{quantile}"}} {value:.6f}')
+                lines.append(f"{name}_sum{{{labels}}} {histogram.sum:.6f}")
+                lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
@@ -1,10 +1,12 @@
 # clients/openai_client.py
-from openrouter.src.client.base_client import BaseLLMClient
-import httpx
+from ..base_client import BaseLLMClient
+from ..completion_types import Completion, StreamDelta
 from typing import AsyncIterator, Union, List, Dict, Optional, Any
 
 
 class OpenAIClient(BaseLLMClient):
+    provider_name = "OpenAI"
+
     def __init__(self, settings):
         super().__init__(settings)
         self.base_url = "https://api.openai.com/v1"
@@ -21,7 +23,7 @@ class OpenAIClient(BaseLLMClient):
             temperature: Optional[float] = None,
             stream: bool = False,
             **kwargs
-    ) -> Union[Dict[str, Any], AsyncIterator[Dict[str, Any]]]:
+    ) -> Union[Completion, AsyncIterator[StreamDelta]]:
         """OpenAI Chat Completion API 호출 (Stream 지원)"""
 
         payload = {
@@ -36,58 +38,37 @@ class OpenAIClient(BaseLLMClient):
         if "top_p" in kwargs:
             payload["top_p"] = kwargs["top_p"]
 
-        if stream:
-            return self._stream_completion(payload)
-        else:
-            return await self._regular_completion(payload)
+        return await self._dispatch(payload, stream)
 
-    async def _regular_completion(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+    async def _regular_completion(self, payload: Dict[str, Any]) -> Completion:
         """일반 완료 요청"""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/chat/completions",
-                headers=self.headers,
-                json=payload,
-                timeout=self.timeout
-            )
-
-            if response.status_code == 200:
-                return response.json()
-            else:
-                self._handle_error(response, "OpenAI")
+        client = self._get_http_client()
+        response = await client.post(
+            f"{self.base_url}/chat/completions",
+            headers=self.headers,
+            json=payload,
+            timeout=self._upstream_timeout(payload)
+        )
+
+        if response.status_code == 200:
+            return Completion.from_openai(response.json())
+        else:
+            self._handle_error(response, "OpenAI")
 
-    async def _stream_completion(self, payload: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+    async def _stream_completion(self, payload: Dict[str, Any]) -> AsyncIterator[StreamDelta]:
         """스트림 완료 요청"""
-        async with httpx.AsyncClient() as client:
-            async with client.stream(
-                    "POST",
-                    f"{self.base_url}/chat/completions",
-                    headers=self.headers,
-                    json=payload,
-                    timeout=self.timeout
-            ) as response:
-
-                if response.status_code != 200:
-                    self._handle_error(response, "OpenAI")
-
-                async for line in response.aiter_lines():
-                    if line.strip():
-                        parsed_data = self._parse_sse_line(line)
-                        if parsed_data:
-                            yield parsed_data
-
-
-
+        async for chunk in self._stream_sse(f"{self.base_url}/chat/completions", payload):
+            yield chunk
 
     async def get_available_models(self) -> List[Dict[str, Any]]:
         """OpenAI 모델 목록 조회"""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/models",
-                headers=self.headers
-            )
-
-            if response.status_code == 200:
-                return response.json()["data"]
-            else:
-                self._handle_error(response, "OpenAI")
+        client = self._get_http_client()
+        response = await client.get(
+            f"{self.base_url}/models",
+            headers=self.headers
+        )
+
+        if response.status_code == 200:
+            return response.json()["data"]
+        else:
+            self._handle_error(response, "OpenAI")
@@ -0,0 +1,315 @@
+# clients/openrouter/model_catalog.py
+import asyncio
+import bisect
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+# 조건부 요청 함수: 검증자(ETag / Last-Modified) -> (모델 목록, 새 검증자), 변경 없음(304)이면 None
+ModelFetcher = Callable[[Dict[str, str]], Awaitable[Optional[Tuple[List[Dict[str, Any]], Dict[str, str]]]]]
+
+logger = logging.getLogger(__name__)
+
+
+def _price(pricing: Dict[str, Any], key: str) -> Optional[float]:
+    """OpenRouter 가격 문자열(토큰당 USD) 변환, 가격 정보가 없거나 음수(가변 가격)면 None"""
+    try:
+        value = float(pricing.get(key))
+    except (TypeError, ValueError):
+        return None
+    return value if value >= 0 else None
+
+
+class ModelInfo:
+    """카탈로그 모델 하나 (원본 응답은 raw로 보존)"""
+    __slots__ = ("id", "provider", "name", "context_length", "prompt_price", "completion_price", "raw")
+
+    def __init__(self, raw: Dict[str, Any]):
+        self.raw = raw
+        self.id: str = raw["id"]
+        self.provider: str = self.id.split("/", 1)[0].lower() if "/" in self.id else ""
+        self.name: str = raw.get("name") or self.id
+        context_length = raw.get("context_length") or raw.get("top_provider", {}).get("context_length")
+        self.context_length: int = int(context_length or 0)
+        pricing = raw.get("pricing") or {}
+        self.prompt_price = _price(pricing, "prompt")
+        self.completion_price = _price(pricing, "completion")
+
+    def estimate_cost(self, prompt_tokens: int, completion_tokens: int) -> Optional[float]:
+        """예상 비용(USD), 가격 정보가 없으면 None"""
+        if self.prompt_price is None or self.completion_price is None:
+            return None
+        return prompt_tokens * self.prompt_price + completion_tokens * self.completion_price
+
+    def __repr__(self) -> str:
+        return f"ModelInfo({self.id!r}, context_length={self.context_length})"
+
+
+@dataclass
+class CatalogStats:
+    """모델 카탈로그 상태"""
+    models: int = 0
+    source: str = "empty"              # empty / snapshot / network
+    age_seconds: Optional[float] = None
+    refreshes: int = 0
+    not_modified: int = 0
+    refresh_errors: int = 0
+    last_error: Optional[str] = None
+    unknown_aliases: Optional[Dict[str, str]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class ModelCatalog:
+    """OpenRouter 모델 카탈로그 (메모리 색인 + 디스크 스냅샷 + 백그라운드 조건부 갱신)
+
+    - 제공자 / 컨텍스트 길이 / 가격 색인으로 목록 스캔 없이 조회합니다.
+    - 스냅샷이 있으면 네트워크를 기다리지 않고 시작하며, 오래된 목록은 그대로 제공하면서
+      백그라운드에서 ETag / Last-Modified 조건부 요청으로 갱신합니다 (stale-while-revalidate).
+    """
+
+    def __init__(
+            self,
+            fetch: ModelFetcher,
+            refresh_interval: float = 3600.0,
+            snapshot_path: Optional[str] = None,
+            aliases: Optional[Dict[str, str]] = None
+    ):
+        self._fetch = fetch
+        self.refresh_interval = refresh_interval
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self.aliases = aliases or {}
+
+        self._models: List[ModelInfo] = []
+        self._by_id: Dict[str, ModelInfo] = {}
+        self._by_provider: Dict[str, List[ModelInfo]] = {}
+        self._by_context: List[ModelInfo] = []
+        self._context_keys: List[int] = []
+        self._by_prompt_price: List[ModelInfo] = []
+
+        self._validators: Dict[str, str] = {}
+        self._fetched_at: Optional[float] = None   # time.time() 기준 (스냅샷과 공유)
+        self._loaded = False
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._auto_refresh_task: Optional[asyncio.Task] = None
+        self._stats = CatalogStats()
+
+    # ========================================
+    # 적재 / 갱신
+    # ========================================
+
+    async def ensure_loaded(self) -> "ModelCatalog":
+        """카탈로그 준비 (스냅샷 우선, 없으면 네트워크 조회), 오래된 경우 백그라운드 갱신 예약"""
+        if not self._loaded:
+            if not self._load_snapshot():
+                await self.refresh()
+            self._loaded = True
+        if self.is_stale:
+            self.refresh_in_background()
+        return self
+
+    @property
+    def is_stale(self) -> bool:
+        return self._fetched_at is None or time.time() - self._fetched_at >= self.refresh_interval
+
+    async def refresh(self) -> bool:
+        """조건부 요청으로 갱신 (변경된 경우 True), 진행 중인 갱신이 있으면 공유"""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh())
+        return await asyncio.shield(self._refresh_task)
+
+    def refresh_in_background(self) -> None:
+        """갱신 작업 예약 (오류는 통계에만 기록, 기존 목록 유지)"""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh())
+            self._refresh_task.add_done_callback(_consume_error)
+
+    async def _refresh(self) -> bool:
+        # 메모리에 목록이 없으면 조건부 헤더 없이 요청 (스냅샷 없이 304를 받으면 비어 있게 됨)
+        validators = self._validators if self._models else {}
+        try:
+            result = await self._fetch(validators)
+        except Exception as e:
+            self._stats.refresh_errors += 1
+            self._stats.last_error = str(e)
+            raise
+        self._fetched_at = time.time()
+        if result is None:
+            self._stats.not_modified += 1
+            self._save_snapshot()
+            return False
+
+        models, self._validators = result
+        self._build_index(models)
+        self._stats.refreshes += 1
+        self._stats.source = "network"
+        self._save_snapshot()
+        return True
+
+    def start_auto_refresh(self) -> None:
+        """refresh_interval 주기 갱신 시작 (앱 시작 시 워밍업에서 호출, aclose로 중지)"""
+        if self._auto_refresh_task is None or self._auto_refresh_task.done():
+            self._auto_refresh_task = asyncio.create_task(self._auto_refresh())
+
+    async def _auto_refresh(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.refresh()
+            except Exception:
+                # 다음 주기에 재시도 (통계에 기록됨)
+                pass
+
+    async def aclose(self) -> None:
+        """백그라운드 갱신 중지"""
+        for task in (self._auto_refresh_task, self._refresh_task):
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):
+                    pass
+        self._auto_refresh_task = self._refresh_task = None
+
+    # ========================================
+    # 스냅샷
+    # ========================================
+
+    def _load_snapshot(self) -> bool:
+        if self.snapshot_path is None or not self.snapshot_path.exists():
+            return False
+        try:
+            data = json.loads(self.snapshot_path.read_text(encoding="utf-8"))
+            models = data["models"]
+        except (OSError, ValueError, KeyError) as e:
+            # 손상된 스냅샷은 무시하고 네트워크에서 다시 받음
+            self._stats.last_error = f"snapshot: {e}"
+            return False
+        self._build_index(models)
+        self._validators = data.get("validators") or {}
+        self._fetched_at = data.get("fetched_at")
+        self._stats.source = "snapshot"
+        return True
+
+    def _save_snapshot(self) -> None:
+        if self.snapshot_path is None or not self._models:
+            return
+        try:
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            # 임시 파일에 쓴 뒤 교체 (다른 프로세스가 반쯤 쓴 파일을 읽지 않도록)
+            temp_path = self.snapshot_path.with_name(f"{self.snapshot_path.name}.{os.getpid()}.tmp")
+            temp_path.write_text(json.dumps({
+                "fetched_at": self._fetched_at,
+                "validators": self._validators,
+                "models": [model.raw for model in self._models]
+            }, ensure_ascii=False), encoding="utf-8")
+            os.replace(temp_path, self.snapshot_path)
+        except OSError as e:
+            self._stats.last_error = f"snapshot: {e}"
+
+    # ========================================
+    # 색인
+    # ========================================
+
+    def _build_index(self, raw_models: List[Dict[str, Any]]) -> None:
+        models = [ModelInfo(raw) for raw in raw_models if raw.get("id")]
+        by_provider: Dict[str, List[ModelInfo]] = {}
+        for model in models:
+            by_provider.setdefault(model.provider, []).append(model)
+        by_context = sorted(models, key=lambda m: m.context_length)
+
+        # 색인 전체를 한 번에 교체 (조회 중에 부분 갱신된 상태가 보이지 않도록)
+        self._models = models
+        self._by_id = {model.id: model for model in models}
+        self._by_provider = by_provider
+        self._by_context = by_context
+        self._context_keys = [model.context_length for model in by_context]
+        self._by_prompt_price = sorted(
+            (m for m in models if m.prompt_price is not None),
+            key=lambda m: (m.prompt_price, m.completion_price or 0.0)
+        )
+        self._stats.models = len(models)
+
+        # 카탈로그에 없는 별칭은 요청 시 404가 되므로 적재 시 경고 (목록이 바뀐 경우에만)
+        unknown = self.validate_aliases()
+        if unknown and unknown != self._stats.unknown_aliases:
+            logger.warning(
+                "OpenRouter 모델 카탈로그에 없는 별칭 %d개: %s",
+                len(unknown),
+                ", ".join(f"{alias} -> {model_id}" for alias, model_id in unknown.items())
+            )
+        self._stats.unknown_aliases = unknown
+
+    def validate_aliases(self, aliases: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        """카탈로그에 없는 별칭 -> 모델 ID (예: OpenRouterModels.get_all_models())"""
+        return {
+            alias: model_id
+            for alias, model_id in (aliases if aliases is not None else self.aliases).items()
+            if model_id not in self._by_id
+        }
+
+    # ========================================
+    # 조회
+    # ========================================
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    def __contains__(self, model_id: str) -> bool:
+        return model_id in self._by_id
+
+    def get(self, model_id: str) -> Optional[ModelInfo]:
+        """모델 ID 또는 별칭으로 조회"""
+        return self._by_id.get(model_id) or self._by_id.get(self.aliases.get(model_id, ""))
+
+    def all(self) -> List[ModelInfo]:
+        return list(self._models)
+
+    def providers(self) -> List[str]:
+        return sorted(self._by_provider)
+
+    def by_provider(self, provider: str) -> List[ModelInfo]:
+        """제공자별 모델 (ID 접두어 일치, 없으면 ID 부분 문자열 일치로 대체)"""
+        provider = provider.lower()
+        models = self._by_provider.get(provider)
+        if models is not None:
+            return list(models)
+        return [model for model in self._models if provider in model.id.lower()]
+
+    def with_min_context(self, min_context: int) -> List[ModelInfo]:
+        """컨텍스트 길이가 min_context 이상인 모델 (짧은 순)"""
+        return self._by_context[bisect.bisect_left(self._context_keys, min_context):]
+
+    def cheapest(
+            self,
+            limit: int = 10,
+            provider: Optional[str] = None,
+            min_context: int = 0
+    ) -> List[ModelInfo]:
+        """프롬프트 토큰 가격이 낮은 순 (가격 정보가 없는 모델 제외)"""
+        provider = provider.lower() if provider else None
+        result = []
+        for model in self._by_prompt_price:
+            if provider is not None and model.provider != provider:
+                continue
+            if model.context_length < min_context:
+                continue
+            result.append(model)
+            if len(result) >= limit:
+                break
+        return result
+
+    def stats(self) -> CatalogStats:
+        self._stats.age_seconds = round(time.time() - self._fetched_at, 1) if self._fetched_at else None
+        return CatalogStats(**asdict(self._stats))
+
+
+def _consume_error(task: asyncio.Task) -> None:
+    """백그라운드 갱신 예외 회수 (미확인 예외 경고 방지)"""
+    if not task.cancelled():
+        task.exception()
@@ -1,16 +1,39 @@
-from typing import List, Dict, Any, AsyncIterator, Union
+from collections import deque, Counter
+from typing import List, Dict, Any, AsyncIterator, Union, Optional, Deque
 import asyncio
+import time
 
-from client.openrouter.model_list import OpenRouterModels
-from client.openrouter.openrouter_client import OpenRouterClient
+from ..circuit_breaker import CircuitOpenError, counts_as_failure
+from ..completion_types import Completion, StreamDelta
+from .model_list import OpenRouterModels
+from .multi_model_stream import MultiModelStream
+from .openrouter_client import OpenRouterClient
+
+_STREAM_END = object()
+
+
+class _HedgeContender:
+    """헤지 요청에 참여한 모델 하나의 스트림 상태"""
+
+    def __init__(self, model_name: str, queue_size: int):
+        self.model_name = model_name
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.first_token: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.task: Optional[asyncio.Task] = None
+        self.failed = False
 
 
 class MultiModelManager:
     """여러 모델을 효율적으로 관리하는 매니저"""
 
     def __init__(self, settings):
+        self.settings = settings
         self.client = OpenRouterClient(settings)
         self.models = OpenRouterModels()
+        # 모델별 최근 TTFT 표본 (헤지 지연 계산용)
+        self._ttft_samples: Dict[str, Deque[float]] = {}
+        self._hedge_stats: Counter = Counter()
+        self._fallback_stats: Counter = Counter()
 
     async def chat_with_model(
             self,
@@ -18,7 +41,7 @@ class MultiModelManager:
             messages: List[Dict[str, str]],
             stream: bool = False,
             **kwargs
-    ) -> Union[Dict[str, Any], AsyncIterator[Dict[str, Any]]]:
+    ) -> Union[Completion, AsyncIterator[StreamDelta]]:
         """특정 모델로 채팅"""
 
         all_models = self.models.get_all_models()
@@ -61,58 +84,291 @@ class MultiModelManager:
                 results[model_name] = {"error": str(response)}
             else:
                 results[model_name] = {
-                    "response": response["choices"][0]["message"]["content"],
-                    "usage": response.get("usage", {}),
-                    "model": response.get("model", model_name)
+                    "response": response.content,
+                    "usage": response.usage,
+                    "model": response.model or model_name
                 }
 
         return results
 
-    async def stream_multiple_models(
+    def stream_multiple_models(
             self,
             model_names: List[str],
             messages: List[Dict[str, str]],
+            queue_size: Optional[int] = None,
             **kwargs
-    ):
-        """여러 모델의 스트림 응답을 동시에 처리"""
+    ) -> MultiModelStream:
+        """여러 모델의 스트림을 (model_name, delta, finish_reason, timing) 이벤트로 병합
+
+        async with manager.stream_multiple_models(names, messages) as stream:
+            async for model_name, delta, finish_reason, timing in stream:
+                ...
+        """
+
+        async def open_stream(model_name: str) -> AsyncIterator[StreamDelta]:
+            return await self.chat_with_model(
+                model_name=model_name,
+                messages=messages,
+                stream=True,
+                **kwargs
+            )
+
+        return MultiModelStream(
+            model_names,
+            open_stream,
+            queue_size=queue_size or self.settings.hedge_queue_size,
+            on_ttft=self._record_ttft
+        )
 
-        async def stream_single_model(model_name: str):
+    async def chat_with_fallback(
+            self,
+            messages: List[Dict[str, str]],
+            use: Optional[str] = None,
+            models: Optional[List[str]] = None,
+            stream: bool = False,
+            **kwargs
+    ) -> Union[Completion, AsyncIterator[StreamDelta]]:
+        """폴백 체인 순서대로 채팅 (서킷이 열렸거나 장애인 모델은 다음 모델로 전환)
+
+        체인은 models -> settings.fallback_chains[use] -> settings.preferred_models 순으로 결정됩니다.
+        스트림은 첫 청크를 받기 전에 실패한 경우에만 다음 모델로 전환하며,
+        settings.hedge_enabled면 첫 토큰이 늦을 때 다음 모델을 동시에 요청합니다 (hedge_stream).
+        """
+        chain = self._fallback_chain(use, models)
+        if not chain:
+            raise RuntimeError("폴백 체인에 사용할 모델이 없습니다")
+        if stream:
+            if self.settings.hedge_enabled:
+                return self.hedge_stream(messages, primary_model=chain[0], backup_models=chain[1:], **kwargs)
+            return self._stream_with_fallback(chain, messages, kwargs)
+
+        last_error: Optional[Exception] = None
+        for model_name in chain:
             try:
-                stream_response = await self.chat_with_model(
-                    model_name=model_name,
-                    messages=messages,
-                    stream=True,
-                    **kwargs
-                )
+                response = await self.chat_with_model(model_name, messages, stream=False, **kwargs)
+            except Exception as e:
+                if not self._should_fall_back(e):
+                    raise
+                last_error = e
+                self._record_fallback(model_name, e)
+                continue
+            self._fallback_stats[f"served:{model_name}"] += 1
+            return response
 
-                print(f"\n=== **{model_name} 스트림 시작** ===")
-                content = ""
+        raise last_error or RuntimeError("폴백 체인에 사용할 모델이 없습니다")
 
+    async def _stream_with_fallback(
+            self,
+            chain: List[str],
+            messages: List[Dict[str, str]],
+            kwargs: Dict[str, Any]
+    ) -> AsyncIterator[StreamDelta]:
+        last_error: Optional[Exception] = None
+        for model_name in chain:
+            started = False
+            stream_response = None
+            try:
+                stream_response = await self.chat_with_model(model_name, messages, stream=True, **kwargs)
                 async for chunk in stream_response:
-                    if "choices" in chunk and chunk["choices"]:
-                        delta = chunk["choices"][0].get("delta", {})
-                        if "content" in delta:
-                            chunk_content = delta["content"]
-                            print(f"[{model_name}] {chunk_content}", end="", flush=True)
-                            content += chunk_content
+                    started = True
+                    yield chunk
+            except Exception as e:
+                if started or not self._should_fall_back(e):
+                    raise
+                last_error = e
+                self._record_fallback(model_name, e)
+                continue
+            finally:
+                if stream_response is not None:
+                    await stream_response.aclose()
+            self._fallback_stats[f"served:{model_name}"] += 1
+            return
 
-                        finish_reason = chunk["choices"][0].get("finish_reason")
-                        if finish_reason:
-                            print(f"\n[{model_name}] **완료**: {finish_reason}")
-                            break
+        raise last_error or RuntimeError("폴백 체인에 사용할 모델이 없습니다")
 
-                return model_name, content
+    def fallback_stats(self) -> Dict[str, Any]:
+        """폴백 통계 (모델별 응답 수, 서킷 차단 / 장애로 건너뛴 수)"""
+        return dict(self._fallback_stats)
 
-            except Exception as e:
-                print(f"[{model_name}] **오류**: {e}")
-                return model_name, None
+    def _fallback_chain(self, use: Optional[str], models: Optional[List[str]]) -> List[str]:
+        if models:
+            return list(models)
+        if use and use in self.settings.fallback_chains:
+            return list(self.settings.fallback_chains[use])
+        return list(self.settings.preferred_models)
 
-        # 모든 모델 동시 스트림
-        tasks = [stream_single_model(name) for name in model_names]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        return results
+    @staticmethod
+    def _should_fall_back(error: Exception) -> bool:
+        """서킷 차단 또는 모델 장애(429/5xx/네트워크)면 다음 모델로 전환, 인증/요청 오류는 그대로 발생"""
+        return isinstance(error, CircuitOpenError) or counts_as_failure(error)
+
+    def _record_fallback(self, model_name: str, error: Exception) -> None:
+        reason = "circuit_open" if isinstance(error, CircuitOpenError) else "failed"
+        self._fallback_stats[f"{reason}:{model_name}"] += 1
+
+    async def hedge_stream(
+            self,
+            messages: List[Dict[str, str]],
+            primary_model: Optional[str] = None,
+            backup_models: Optional[List[str]] = None,
+            hedge_delay: Optional[float] = None,
+            **kwargs
+    ) -> AsyncIterator[StreamDelta]:
+        """헤지 스트림 (첫 토큰을 먼저 낸 모델의 스트림 사용)
+
+        primary 모델로 요청하고, 마지막으로 요청한 모델의 지연(p95 TTFT 기반) 안에 첫 토큰이 없거나
+        실패하면 backup_models(기본: settings.preferred_models)의 다음 모델로 추가 요청합니다.
+        첫 토큰을 먼저 받은 스트림이 채택되고 나머지는 취소되어 커넥션이 반환됩니다.
+        """
+        primary_model = primary_model or self.settings.preferred_models[0]
+        if backup_models is None:
+            backup_models = [m for m in self.settings.preferred_models if m != primary_model]
+        backups = list(backup_models)
+
+        contenders: List[_HedgeContender] = []
+        winner: Optional[_HedgeContender] = None
+        last_error: Optional[BaseException] = None
+
+        try:
+            contenders.append(self._start_contender(primary_model, messages, kwargs))
+
+            while winner is None:
+                pending = {c.first_token: c for c in contenders if not c.failed}
+                if not pending:
+                    if not backups:
+                        raise last_error or RuntimeError("헤지 요청에 사용할 모델이 없습니다")
+                    # 진행 중인 요청이 모두 실패하면 즉시 다음 모델로 전환
+                    contenders.append(self._start_contender(backups.pop(0), messages, kwargs))
+                    self._hedge_stats["failovers"] += 1
+                    continue
+
+                delay = None
+                if backups:
+                    # 가장 최근에 시작한 모델이 정상 TTFT 안에 응답하는지 기다림
+                    delay = hedge_delay if hedge_delay is not None else self._hedge_delay(contenders[-1].model_name)
+
+                done, _ = await asyncio.wait(
+                    pending.keys(), timeout=delay, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                if not done:
+                    # 첫 토큰 지연 -> 백업 모델로 헤지
+                    contenders.append(self._start_contender(backups.pop(0), messages, kwargs))
+                    self._hedge_stats["hedges"] += 1
+                    continue
+
+                for future in done:
+                    contender = pending[future]
+                    if future.exception() is None:
+                        winner = contender
+                        break
+                    contender.failed = True
+                    last_error = future.exception()
+
+            self._hedge_stats[f"wins:{winner.model_name}"] += 1
+
+            # 패배한 스트림 취소 (커넥션 반환)
+            await self._cancel_contenders([c for c in contenders if c is not winner])
+
+            while True:
+                item = await winner.queue.get()
+                if item is _STREAM_END:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+
+        finally:
+            await self._cancel_contenders(contenders)
+
+    def hedge_stats(self) -> Dict[str, Any]:
+        """헤지 통계 (헤지 발생 수, 장애 전환 수, 모델별 채택 수, 현재 헤지 지연)"""
+        return {
+            **self._hedge_stats,
+            "delays": {name: self._hedge_delay(name) for name in self._ttft_samples}
+        }
+
+    def _start_contender(
+            self,
+            model_name: str,
+            messages: List[Dict[str, str]],
+            kwargs: Dict[str, Any]
+    ) -> _HedgeContender:
+        contender = _HedgeContender(model_name, self.settings.hedge_queue_size)
+        contender.task = asyncio.create_task(self._run_contender(contender, messages, kwargs))
+        return contender
+
+    async def _run_contender(
+            self,
+            contender: _HedgeContender,
+            messages: List[Dict[str, str]],
+            kwargs: Dict[str, Any]
+    ) -> None:
+        """모델 스트림을 큐로 전달하고 첫 토큰 도착을 알림"""
+        start_time = time.perf_counter()
+        stream_response = None
+        try:
+            stream_response = await self.chat_with_model(
+                model_name=contender.model_name,
+                messages=messages,
+                stream=True,
+                **kwargs
+            )
+            async for chunk in stream_response:
+                if not contender.first_token.done() and self._is_token_chunk(chunk):
+                    self._record_ttft(contender.model_name, time.perf_counter() - start_time)
+                    contender.first_token.set_result(None)
+                await contender.queue.put(chunk)
+
+            if not contender.first_token.done():
+                contender.first_token.set_exception(RuntimeError(f"{contender.model_name}: 빈 스트림"))
+            await contender.queue.put(_STREAM_END)
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if not contender.first_token.done():
+                contender.first_token.set_exception(e)
+            else:
+                await contender.queue.put(e)
+        finally:
+            if stream_response is not None:
+                await stream_response.aclose()
+
+    @staticmethod
+    async def _cancel_contenders(contenders: List[_HedgeContender]) -> None:
+        tasks = [c.task for c in contenders if c.task and not c.task.done()]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        for contender in contenders:
+            # 소비되지 않은 예외 경고 방지
+            if contender.first_token.done() and not contender.first_token.cancelled():
+                contender.first_token.exception()
+            elif not contender.first_token.done():
+                contender.first_token.cancel()
+
+    @staticmethod
+    def _is_token_chunk(chunk: StreamDelta) -> bool:
+        """내용 또는 종료 사유가 있는 청크인지 (role만 있는 첫 청크 제외)"""
+        return bool(chunk.content or chunk.finish_reason)
+
+    def _record_ttft(self, model_name: str, ttft: float) -> None:
+        samples = self._ttft_samples.get(model_name)
+        if samples is None:
+            samples = self._ttft_samples[model_name] = deque(maxlen=self.settings.hedge_sample_window)
+        samples.append(ttft)
+
+    def _hedge_delay(self, model_name: str) -> float:
+        """모델의 p95 TTFT (표본이 부족하면 기본 지연)"""
+        samples = self._ttft_samples.get(model_name)
+        if not samples or len(samples) < self.settings.hedge_min_samples:
+            return self.settings.hedge_default_delay
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
 
     async def get_available_models_by_provider(self, provider: str) -> List[Dict[str, Any]]:
         """제공자별 사용 가능한 모델 조회"""
-        all_models = await self.client.get_available_models()
-        return [model for model in all_models if provider.lower() in model["id"].lower()]
\ No newline at end of file
+        catalog = await self.client.get_model_catalog()
+        return [model.raw for model in catalog.by_provider(provider)]
\ No newline at end of file
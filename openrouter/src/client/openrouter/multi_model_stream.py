@@ -0,0 +1,194 @@
+import asyncio
+import time
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, NamedTuple, Optional
+
+from ..completion_types import StreamDelta
+
+_STREAM_END = object()
+
+
+class StreamTiming(NamedTuple):
+    """모델 스트림 타이밍 (초)
+
+    elapsed: 스트림 시작 후 경과 시간
+    ttft: 첫 토큰까지 시간 (첫 토큰 전이면 None)
+    itl: 직전 토큰과의 간격 (inter-token latency)
+    mean_itl / p99_itl: 종료 이벤트에서만 채워지는 요약값
+    """
+    elapsed: float
+    ttft: Optional[float]
+    itl: Optional[float]
+    mean_itl: Optional[float] = None
+    p99_itl: Optional[float] = None
+
+
+class ModelStreamEvent(NamedTuple):
+    """병합 스트림 이벤트 (model_name, delta, finish_reason, timing)
+
+    finish_reason이 "error"면 delta에 오류 메시지, "cancelled"면 해당 모델만 취소된 것입니다.
+    """
+    model_name: str
+    delta: str
+    finish_reason: Optional[str]
+    timing: StreamTiming
+
+
+class _ModelStream:
+    """모델 하나의 스트림 상태 (모델별 제한 큐로 생산 속도 조절)"""
+
+    def __init__(self, model_name: str, queue_size: int):
+        self.model_name = model_name
+        # 큐 자체는 무제한이고 슬롯 세마포어로 크기를 제한
+        # 항목은 (이벤트, 슬롯 사용 여부), 오류 / 취소 이벤트와 종료 표시는 슬롯 없이 전달
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.slots = asyncio.Semaphore(queue_size)
+        self.task: Optional[asyncio.Task] = None
+        self.getter: Optional[asyncio.Task] = None
+        self.started_at = 0.0
+        self.last_token_at: Optional[float] = None
+        self.ttft: Optional[float] = None
+        self.itls: List[float] = []
+        self.finished = False
+
+    def timing(self, now: float, itl: Optional[float] = None, final: bool = False) -> StreamTiming:
+        mean_itl = p99_itl = None
+        if final and self.itls:
+            ordered = sorted(self.itls)
+            mean_itl = sum(ordered) / len(ordered)
+            p99_itl = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+        return StreamTiming(now - self.started_at, self.ttft, itl, mean_itl, p99_itl)
+
+
+class MultiModelStream:
+    """여러 모델 스트림을 하나의 비동기 반복자로 병합
+
+    async with manager.stream_multiple_models(names, messages) as stream:
+        async for model_name, delta, finish_reason, timing in stream:
+            ...
+
+    모델마다 제한 크기 큐를 두어 소비가 느리면 해당 모델의 읽기만 멈추며,
+    cancel(model_name)으로 개별 모델을 중단할 수 있습니다.
+    """
+
+    def __init__(
+            self,
+            model_names: List[str],
+            open_stream: Callable[[str], Awaitable[AsyncIterator[StreamDelta]]],
+            queue_size: int = 256,
+            on_ttft: Optional[Callable[[str, float], None]] = None
+    ):
+        self._streams: Dict[str, _ModelStream] = {
+            name: _ModelStream(name, queue_size) for name in dict.fromkeys(model_names)
+        }
+        self._open_stream = open_stream
+        self._on_ttft = on_ttft
+        self._started = False
+
+    async def __aenter__(self) -> "MultiModelStream":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def __aiter__(self) -> AsyncIterator[ModelStreamEvent]:
+        return self._merge()
+
+    def cancel(self, model_name: str) -> None:
+        """특정 모델 스트림만 중단 (병합 스트림에 "cancelled" 종료 이벤트 전달)"""
+        stream = self._streams.get(model_name)
+        if stream is None or stream.finished or stream.task is None or stream.task.done():
+            return
+        stream.task.cancel()
+
+    async def aclose(self) -> None:
+        """남은 모델 스트림 모두 취소 (커넥션 반환)"""
+        tasks = []
+        for stream in self._streams.values():
+            for task in (stream.task, stream.getter):
+                if task is not None and not task.done():
+                    task.cancel()
+                    tasks.append(task)
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def timings(self) -> Dict[str, StreamTiming]:
+        """모델별 타이밍 요약 (TTFT / 평균 ITL / p99 ITL)"""
+        now = time.perf_counter()
+        return {name: stream.timing(now, final=True) for name, stream in self._streams.items()}
+
+    async def _merge(self) -> AsyncIterator[ModelStreamEvent]:
+        if self._started:
+            raise RuntimeError("MultiModelStream은 한 번만 반복할 수 있습니다")
+        self._started = True
+
+        for stream in self._streams.values():
+            stream.started_at = time.perf_counter()
+            stream.task = asyncio.create_task(self._produce(stream))
+            stream.getter = asyncio.create_task(stream.queue.get())
+
+        try:
+            pending = {stream.getter: stream for stream in self._streams.values()}
+            while pending:
+                done, _ = await asyncio.wait(pending.keys(), return_when=asyncio.FIRST_COMPLETED)
+                for getter in done:
+                    stream = pending.pop(getter)
+                    item = getter.result()
+                    if item is _STREAM_END:
+                        stream.finished = True
+                        continue
+                    event, slotted = item
+                    if slotted:
+                        stream.slots.release()
+                    yield event
+                    stream.getter = asyncio.create_task(stream.queue.get())
+                    pending[stream.getter] = stream
+        finally:
+            await self.aclose()
+
+    async def _produce(self, stream: _ModelStream) -> None:
+        """모델 스트림을 읽어 (delta, finish_reason) 이벤트로 변환 후 큐에 전달"""
+        stream_response = None
+        final_event: Optional[ModelStreamEvent] = None
+        try:
+            stream_response = await self._open_stream(stream.model_name)
+            async for chunk in stream_response:
+                delta = chunk.content or ""
+                finish_reason = chunk.finish_reason
+                if not delta and not finish_reason:
+                    continue
+
+                now = time.perf_counter()
+                itl = None
+                if delta:
+                    if stream.ttft is None:
+                        stream.ttft = now - stream.started_at
+                        if self._on_ttft:
+                            self._on_ttft(stream.model_name, stream.ttft)
+                    elif stream.last_token_at is not None:
+                        itl = now - stream.last_token_at
+                        stream.itls.append(itl)
+                    stream.last_token_at = now
+
+                # 소비자가 느리면 여기서 대기 (해당 모델의 업스트림 읽기만 멈춤)
+                await stream.slots.acquire()
+                stream.queue.put_nowait((ModelStreamEvent(
+                    stream.model_name, delta, finish_reason, stream.timing(now, itl, final=bool(finish_reason))
+                ), True))
+                if finish_reason:
+                    break
+
+        except asyncio.CancelledError:
+            final_event = ModelStreamEvent(
+                stream.model_name, "", "cancelled", stream.timing(time.perf_counter(), final=True)
+            )
+        except Exception as e:
+            final_event = ModelStreamEvent(
+                stream.model_name, str(e), "error", stream.timing(time.perf_counter(), final=True)
+            )
+        finally:
+            if stream_response is not None:
+                await stream_response.aclose()
+
+        if final_event is not None:
+            stream.queue.put_nowait((final_event, False))
+        stream.queue.put_nowait(_STREAM_END)
@@ -1,10 +1,19 @@
-from client.base_client import BaseLLMClient
-import httpx
-from typing import AsyncIterator, Union, Dict, Any, List, Optional
+from ..base_client import BaseLLMClient
+from ..completion_types import Completion, StreamDelta
+from .model_catalog import ModelCatalog
+from .model_list import OpenRouterModels
+from typing import AsyncIterator, ClassVar, Union, Dict, Any, List, Optional, Tuple
 
 
 class OpenRouterClient(BaseLLMClient):
+    provider_name = "OpenRouter"
+
+    # 모델 카탈로그 (프로세스 단위 공유, 최초 조회 시 생성)
+    _catalog: ClassVar[Optional[ModelCatalog]] = None
+
     def __init__(self, settings):
+        if not settings.openrouter_api_key:
+            raise ValueError("OpenRouter API 키(openrouter_api_key)가 설정되지 않았습니다")
         super().__init__(settings)
         self.base_url = "https://openrouter.ai/api/v1"
         self.headers = {
@@ -22,7 +31,7 @@ class OpenRouterClient(BaseLLMClient):
             temperature: Optional[float] = None,
             stream: bool = False,
             **kwargs
-    ) -> Union[Dict[str, Any], AsyncIterator[Dict[str, Any]]]:
+    ) -> Union[Completion, AsyncIterator[StreamDelta]]:
         """OpenRouter Chat Completion API 호출 (Stream 지원)"""
 
         payload = {
@@ -40,60 +49,94 @@ class OpenRouterClient(BaseLLMClient):
         if "repetition_penalty" in kwargs:
             payload["repetition_penalty"] = kwargs["repetition_penalty"]
 
-        if stream:
-            return self._stream_completion(payload)
-        else:
-            return await self._regular_completion(payload)
+        return await self._dispatch(payload, stream)
 
-    async def _regular_completion(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+    async def _regular_completion(self, payload: Dict[str, Any]) -> Completion:
         """일반 완료 요청"""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/chat/completions",
-                headers=self.headers,
-                json=payload,
-                timeout=self.timeout
-            )
+        client = self._get_http_client()
+        response = await client.post(
+            f"{self.base_url}/chat/completions",
+            headers=self.headers,
+            json=payload,
+            timeout=self._upstream_timeout(payload)
+        )
 
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 402:
-                raise Exception("OpenRouter: 크레딧이 부족합니다.")
-            elif response.status_code == 429:
-                raise Exception("OpenRouter: 요청 한도 초과")
-            else:
-                raise Exception(f"OpenRouter API 호출 실패: {response.status_code} - {response.text}")
+        if response.status_code == 200:
+            return Completion.from_openai(response.json())
+        self._handle_error(response, "OpenRouter")
 
 
-    async def _stream_completion(self, payload: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+    async def _stream_completion(self, payload: Dict[str, Any]) -> AsyncIterator[StreamDelta]:
         """스트림 완료 요청"""
-        async with httpx.AsyncClient() as client:
-            async with client.stream(
-                    "POST",
-                    f"{self.base_url}/chat/completions",
-                    headers=self.headers,
-                    json=payload,
-                    timeout=self.timeout
-            ) as response:
-
-                if response.status_code != 200:
-                    self._handle_error(response, "OpenRouter")
-
-                async for line in response.aiter_lines():
-                    if line.strip():
-                        parsed_data = self._parse_sse_line(line)
-                        if parsed_data:
-                            yield parsed_data
+        async for chunk in self._stream_sse(f"{self.base_url}/chat/completions", payload):
+            yield chunk
 
     async def get_available_models(self) -> List[Dict[str, Any]]:
-        """OpenRouter 모델 목록 조회"""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/models",
-                headers=self.headers
+        """OpenRouter 모델 목록 조회 (캐시된 카탈로그 사용)"""
+        catalog = await self.get_model_catalog()
+        return [model.raw for model in catalog.all()]
+
+    async def get_model_catalog(self) -> ModelCatalog:
+        """공유 모델 카탈로그 반환 (스냅샷 또는 네트워크에서 적재, 오래되면 백그라운드 갱신)"""
+        if OpenRouterClient._catalog is None:
+            OpenRouterClient._catalog = ModelCatalog(
+                self._fetch_models,
+                refresh_interval=self.settings.model_catalog_refresh_interval,
+                snapshot_path=self.settings.model_catalog_snapshot_path,
+                aliases=OpenRouterModels.get_all_models()
             )
+        return await OpenRouterClient._catalog.ensure_loaded()
+
+    def _model_context_length(self, model: Optional[str]) -> Optional[int]:
+        """적재된 카탈로그의 컨텍스트 길이 (카탈로그가 없으면 None)"""
+        catalog = OpenRouterClient._catalog
+        info = catalog.get(model) if catalog is not None and model else None
+        return info.context_length if info is not None and info.context_length else None
+
+    async def _warm_up_resources(self) -> None:
+        """모델 카탈로그 적재 (스냅샷 또는 네트워크) 및 주기 갱신 시작 (aclose_all에서 중지)"""
+        catalog = await self.get_model_catalog()
+        catalog.start_auto_refresh()
+
+    @classmethod
+    def model_catalog_stats(cls) -> Dict[str, Any]:
+        """모델 카탈로그 상태 (모델 수 / 갱신 횟수 / 카탈로그에 없는 별칭)"""
+        catalog = OpenRouterClient._catalog
+        return catalog.stats().to_dict() if catalog else {}
 
-            if response.status_code == 200:
-                return response.json()["data"]
-            else:
-                self._handle_error(response, "OpenRouter")
\ No newline at end of file
+    @classmethod
+    async def _aclose_shared_resources(cls) -> None:
+        """공유 커넥션 풀 종료 전에 카탈로그 갱신 작업 중지 (BaseLLMClient.aclose_all에서 호출)"""
+        await cls.aclose_catalog()
+
+    @classmethod
+    async def aclose_catalog(cls) -> None:
+        """카탈로그 백그라운드 갱신 중지"""
+        if OpenRouterClient._catalog is not None:
+            await OpenRouterClient._catalog.aclose()
+            OpenRouterClient._catalog = None
+
+    async def _fetch_models(
+            self,
+            validators: Dict[str, str]
+    ) -> Optional[Tuple[List[Dict[str, Any]], Dict[str, str]]]:
+        """/models 조건부 요청 (304면 None)"""
+        headers = dict(self.headers)
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+        client = self._get_http_client()
+        response = await client.get(f"{self.base_url}/models", headers=headers, timeout=self.timeout)
+
+        if response.status_code == 304:
+            return None
+        if response.status_code != 200:
+            self._handle_error(response, "OpenRouter")
+        new_validators = {
+            name: response.headers[header]
+            for name, header in (("etag", "etag"), ("last_modified", "last-modified"))
+            if header in response.headers
+        }
+        return response.json()["data"], new_validators
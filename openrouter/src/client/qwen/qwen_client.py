@@ -1,10 +1,12 @@
 # clients/qwen_client.py
-from openrouter.src.client.base_client import BaseLLMClient
-import httpx
-from typing import AsyncIterator, Union
+from ..base_client import BaseLLMClient, SSEEvent
+from ..completion_types import Completion, StreamDelta
+from typing import AsyncIterator, Union, List, Dict, Any, Optional
 
 
 class QwenClient(BaseLLMClient):
+    provider_name = "Qwen"
+
     def __init__(self, settings):
         super().__init__(settings)
         self.base_url = "https://dashscope.aliyuncs.com/api/v1"
@@ -21,7 +23,7 @@ class QwenClient(BaseLLMClient):
             temperature: Optional[float] = None,
             stream: bool = False,
             **kwargs
-    ) -> Union[Dict[str, Any], AsyncIterator[Dict[str, Any]]]:
+    ) -> Union[Completion, AsyncIterator[StreamDelta]]:
         """Qwen Chat API 호출 (Stream 지원)"""
 
         payload = {
@@ -37,84 +39,61 @@ class QwenClient(BaseLLMClient):
             }
         }
 
-        if stream:
-            return self._stream_completion(payload)
-        else:
-            return await self._regular_completion(payload)
+        return await self._dispatch(payload, stream)
+
+    def _cache_identity(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Qwen은 parameters.incremental_output으로 스트림 여부를 표시"""
+        parameters = {k: v for k, v in payload["parameters"].items() if k != "incremental_output"}
+        return {**payload, "parameters": parameters}
 
-    async def _regular_completion(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+    async def _regular_completion(self, payload: Dict[str, Any]) -> Completion:
         """일반 완료 요청"""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/services/aigc/text-generation/generation",
-                headers=self.headers,
-                json=payload,
-                timeout=self.timeout
-            )
+        client = self._get_http_client()
+        response = await client.post(
+            f"{self.base_url}/services/aigc/text-generation/generation",
+            headers=self.headers,
+            json=payload,
+            timeout=self._upstream_timeout(payload)
+        )
 
-            if response.status_code == 200:
-                qwen_response = response.json()
-                # Qwen 응답을 OpenAI 형식으로 변환
-                return {
-                    "choices": [{
-                        "message": {
-                            "role": "assistant",
-                            "content": qwen_response["output"]["choices"][0]["message"]["content"]
-                        },
-                        "finish_reason": qwen_response["output"]["choices"][0]["finish_reason"]
-                    }],
-                    "usage": qwen_response.get("usage", {}),
-                    "model": payload["model"]
-                }
-            else:
-                self._handle_error(response, "Qwen")
+        if response.status_code == 200:
+            qwen_response = response.json()
+            # Qwen 응답을 공통 형식으로 변환
+            choice = qwen_response["output"]["choices"][0]
+            return Completion(
+                content=choice["message"]["content"],
+                finish_reason=choice["finish_reason"],
+                usage=qwen_response.get("usage", {}),
+                model=payload["model"]
+            )
+        else:
+            self._handle_error(response, "Qwen")
 
-    async def _stream_completion(self, payload: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+    async def _stream_completion(self, payload: Dict[str, Any]) -> AsyncIterator[StreamDelta]:
         """스트림 완료 요청"""
-        async with httpx.AsyncClient() as client:
-            async with client.stream(
-                    "POST",
-                    f"{self.base_url}/services/aigc/text-generation/generation",
-                    headers=self.headers,
-                    json=payload,
-                    timeout=self.timeout
-            ) as response:
-
-                if response.status_code != 200:
-                    self._handle_error(response, "Qwen")
-
-                async for line in response.aiter_lines():
-                    if line.strip():
-                        parsed_data = self._parse_qwen_stream(line)
-                        if parsed_data:
-                            yield parsed_data
+        async for chunk in self._stream_sse(f"{self.base_url}/services/aigc/text-generation/generation", payload):
+            yield chunk
 
-    def _parse_qwen_stream(self, line: str) -> Optional[Dict[str, Any]]:
-        """Qwen 스트림 데이터 파싱"""
-        if line.startswith("data:"):
-            data = line[5:].strip()  # "data:" 제거
-            if data == "[DONE]":
-                return None
-            try:
-                qwen_data = json.loads(data)
+    def _map_stream_event(self, event: SSEEvent) -> Optional[StreamDelta]:
+        """Qwen 스트림 이벤트를 StreamDelta로 변환"""
+        if event.is_done:
+            return None
+        try:
+            qwen_data = event.json()
+        except ValueError:
+            return None
 
-                # Qwen 스트림을 OpenAI 형식으로 변환
-                if "output" in qwen_data and "choices" in qwen_data["output"]:
-                    choice = qwen_data["output"]["choices"][0]
-                    content = choice["message"]["content"]
-                    finish_reason = choice.get("finish_reason")
-
-                    return {
-                        "choices": [{
-                            "delta": {
-                                "content": content
-                            },
-                            "finish_reason": finish_reason
-                        }]
-                    }
-                return None
-            except json.JSONDecodeError:
-                return None
+        if "output" in qwen_data and "choices" in qwen_data["output"]:
+            choice = qwen_data["output"]["choices"][0]
+            # DashScope는 진행 중 청크의 finish_reason을 문자열 "null"로 보냄
+            finish_reason = choice.get("finish_reason")
+            finish_reason = None if finish_reason == "null" else finish_reason
+            # usage는 누적값이므로 마지막 청크에만 포함
+            return StreamDelta(
+                choice["message"]["content"],
+                finish_reason,
+                qwen_data.get("usage") if finish_reason else None
+            )
         return None
 
     async def get_available_models(self) -> List[Dict[str, Any]]:
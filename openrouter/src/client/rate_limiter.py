@@ -0,0 +1,255 @@
+# clients/rate_limiter.py
+import asyncio
+import random
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, asdict
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Optional
+
+import httpx
+
+from .errors import LLMAPIError
+
+
+class TokenBucket:
+    """분당 한도 토큰 버킷 (요청 수 / 토큰 수 공용)
+
+    clock / sleep: 시각 조회 / 대기 함수 (테스트에서 가짜 시계로 교체)
+    """
+
+    def __init__(
+            self,
+            per_minute: float,
+            capacity: Optional[float] = None,
+            clock: Callable[[], float] = time.monotonic,
+            sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep
+    ):
+        self.rate = per_minute / 60.0
+        self.capacity = capacity or per_minute
+        self.tokens = self.capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, amount: float) -> float:
+        """amount만큼 소비 (부족하면 대기), 대기한 시간(초) 반환"""
+        amount = min(amount, self.capacity)
+        waited = 0.0
+        async with self._lock:  # 도착 순서대로 처리
+            while True:
+                self._refill()
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return waited
+                wait = (amount - self.tokens) / self.rate
+                await self._sleep(wait)
+                waited += wait
+
+    def adjust(self, delta: float) -> None:
+        """예상치와 실제 사용량 차이 반영 (양수면 추가 차감)"""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens - delta)
+
+    def available(self) -> float:
+        self._refill()
+        return self.tokens
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD 동시성 제한 (성공 시 가산 증가, 429 시 승산 감소)"""
+
+    def __init__(
+            self,
+            maximum: int,
+            minimum: int = 1,
+            decrease_factor: float = 0.5,
+            cooldown: float = 1.0,
+            clock: Callable[[], float] = time.monotonic
+    ):
+        self.maximum = maximum
+        self.minimum = minimum
+        self.limit = float(maximum)
+        self.in_flight = 0
+        self._decrease_factor = decrease_factor
+        self._cooldown = cooldown
+        self._clock = clock
+        self._last_decrease = float("-inf")
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self) -> None:
+        if self.in_flight < int(self.limit) and not self._waiters:
+            self.in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter  # 깨어날 때 in_flight는 이미 증가되어 있음
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            else:
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+            raise
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self._wake()
+
+    def on_success(self) -> None:
+        """가산 증가: 한도만큼 성공하면 1 증가"""
+        self.limit = min(float(self.maximum), self.limit + 1.0 / self.limit)
+        self._wake()
+
+    def on_throttle(self) -> None:
+        """승산 감소 (연속된 429는 cooldown 동안 한 번만 반영)"""
+        now = self._clock()
+        if now - self._last_decrease < self._cooldown:
+            return
+        self._last_decrease = now
+        self.limit = max(float(self.minimum), self.limit * self._decrease_factor)
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+
+@dataclass
+class RateLimiterStats:
+    """제한기 상태 (대기 시간과 업스트림 시간을 분리해 기록)"""
+    key: str
+    concurrency_limit: float
+    in_flight: int
+    waiting: int
+    requests_available: Optional[float]
+    tokens_available: Optional[float]
+    requests: int
+    throttled: int
+    retries: int
+    queue_time_total: float
+    upstream_time_total: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class ProviderRateLimiter:
+    """제공자/모델 단위 요청 제한 (RPM + TPM 버킷 + AIMD 동시성)
+
+    clock / sleep: 시각 조회 / 대기 함수 (버킷과 동시성 제한에 그대로 전달)
+    """
+
+    def __init__(
+            self,
+            key: str,
+            requests_per_minute: Optional[float] = None,
+            tokens_per_minute: Optional[float] = None,
+            max_concurrency: int = 64,
+            min_concurrency: int = 1,
+            clock: Callable[[], float] = time.monotonic,
+            sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep
+    ):
+        self.key = key
+        self._clock = clock
+        self._requests = TokenBucket(requests_per_minute, clock=clock, sleep=sleep) if requests_per_minute else None
+        self._tokens = TokenBucket(tokens_per_minute, clock=clock, sleep=sleep) if tokens_per_minute else None
+        self._concurrency = AdaptiveConcurrencyLimiter(max_concurrency, min_concurrency, clock=clock)
+        self._request_count = 0
+        self._throttled = 0
+        self._retries = 0
+        self._queue_time = 0.0
+        self._upstream_time = 0.0
+
+    @asynccontextmanager
+    async def slot(self, estimated_tokens: float) -> AsyncIterator[float]:
+        """요청 슬롯 확보 (버킷 -> 동시성 순), 대기 시간(초)을 전달하고 결과에 따라 동시성 한도 조정"""
+        queued_at = self._clock()
+        if self._requests:
+            await self._requests.acquire(1)
+        if self._tokens:
+            await self._tokens.acquire(estimated_tokens)
+        await self._concurrency.acquire()
+
+        started_at = self._clock()
+        self._queue_time += started_at - queued_at
+        self._request_count += 1
+        try:
+            yield started_at - queued_at
+        except LLMAPIError as e:
+            if e.is_rate_limited:
+                self._throttled += 1
+                self._concurrency.on_throttle()
+            raise
+        else:
+            self._concurrency.on_success()
+        finally:
+            self._upstream_time += self._clock() - started_at
+            self._concurrency.release()
+
+    def record_usage(self, estimated_tokens: float, actual_tokens: Optional[float]) -> None:
+        """실제 사용 토큰으로 TPM 버킷 보정"""
+        if self._tokens and actual_tokens is not None:
+            self._tokens.adjust(actual_tokens - estimated_tokens)
+
+    def record_retry(self) -> None:
+        self._retries += 1
+
+    def stats(self) -> RateLimiterStats:
+        return RateLimiterStats(
+            key=self.key,
+            concurrency_limit=round(self._concurrency.limit, 2),
+            in_flight=self._concurrency.in_flight,
+            waiting=self._concurrency.waiting,
+            requests_available=self._requests.available() if self._requests else None,
+            tokens_available=self._tokens.available() if self._tokens else None,
+            requests=self._request_count,
+            throttled=self._throttled,
+            retries=self._retries,
+            queue_time_total=round(self._queue_time, 4),
+            upstream_time_total=round(self._upstream_time, 4)
+        )
+
+
+class RetryPolicy:
+    """지터가 적용된 지수 백오프 (Retry-After 우선)"""
+
+    def __init__(self, max_attempts: int = 2, base_delay: float = 0.5, max_delay: float = 20.0):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def next_delay(self, error: Exception, attempt: int) -> Optional[float]:
+        """재시도 대기 시간 (재시도하지 않으면 None)"""
+        if attempt >= self.max_attempts:
+            return None
+
+        if isinstance(error, LLMAPIError):
+            if not error.is_retryable:
+                return None
+            if error.retry_after is not None:
+                # 서버가 요구한 대기 시간이 최대 대기보다 길면 포기
+                if error.retry_after > self.max_delay:
+                    return None
+                return error.retry_after + random.uniform(0, self.base_delay)
+        elif not isinstance(error, httpx.TransportError):
+            return None
+
+        # Full jitter
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
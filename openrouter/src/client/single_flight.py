@@ -0,0 +1,190 @@
+# clients/single_flight.py
+import asyncio
+import copy
+from dataclasses import dataclass, asdict
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from .completion_types import Completion, StreamDelta
+from .errors import LLMAPIError
+
+
+@dataclass
+class SingleFlightStats:
+    """중복 제거 통계 (upstream: 실제 호출 수, shared: 공유로 대체된 호출 수)"""
+    upstream_calls: int = 0
+    shared_calls: int = 0
+    upstream_streams: int = 0
+    shared_streams: int = 0
+    in_flight: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class _CallFlight:
+    """진행 중인 일반 요청 하나 (대기자 수가 0이 되면 취소)"""
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class _StreamFlight:
+    """진행 중인 스트림 하나를 여러 구독자에게 전달
+
+    업스트림 청크는 공유 로그에 한 번만 쌓이고 구독자마다 자신의 읽기 위치를 가집니다.
+    느린 구독자가 업스트림이나 다른 구독자를 막지 않으며, 늦게 합류한 구독자도
+    처음 청크부터 받습니다. 모든 구독자가 떠나면 업스트림 스트림을 취소합니다.
+    """
+
+    def __init__(self, source: AsyncIterator[StreamDelta], provider: str):
+        self.chunks: List[StreamDelta] = []
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self.subscribers = 0
+        self.cancelled = False
+        self._provider = provider
+        self._signal: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.task = asyncio.create_task(self._pump(source))
+
+    async def _pump(self, source: AsyncIterator[StreamDelta]) -> None:
+        try:
+            async for chunk in source:
+                self.chunks.append(chunk)
+                self._notify()
+        except asyncio.CancelledError:
+            # 남은 구독자에게는 (취소되지 않은 태스크에 CancelledError 대신) LLM 오류로 전달
+            self.error = LLMAPIError("공유 스트림의 업스트림 요청이 취소되었습니다", self._provider)
+            raise
+        except Exception as e:
+            self.error = e
+        finally:
+            self.done = True
+            self._notify()
+            aclose = getattr(source, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    def _notify(self) -> None:
+        signal = self._signal
+        self._signal = asyncio.get_running_loop().create_future()
+        if not signal.done():
+            signal.set_result(None)
+
+    def subscribe(self) -> "_Subscription":
+        """구독자 등록 (반복을 시작하기 전부터 업스트림 유지 대상으로 계산)"""
+        self.subscribers += 1
+        return _Subscription(self)
+
+    def unsubscribe(self) -> None:
+        self.subscribers -= 1
+        if self.subscribers == 0 and not self.task.done():
+            self.cancelled = True
+            self.task.cancel()
+
+
+class _Subscription:
+    """스트림 구독자 하나 (끝까지 읽거나 aclose / 취소 / 해제 시 구독 해지)"""
+    __slots__ = ("_flight", "_index", "_closed")
+
+    def __init__(self, flight: _StreamFlight):
+        self._flight = flight
+        self._index = 0
+        self._closed = False
+
+    def __aiter__(self) -> "_Subscription":
+        return self
+
+    async def __anext__(self) -> StreamDelta:
+        if self._closed:
+            raise StopAsyncIteration
+        flight = self._flight
+        try:
+            while True:
+                if self._index < len(flight.chunks):
+                    chunk = flight.chunks[self._index]
+                    self._index += 1
+                    # 공유 로그의 청크는 누구에게도 넘기지 않고 구독자마다 복사본 전달 (청크 수정 격리)
+                    return copy.deepcopy(chunk)
+                if flight.done:
+                    self._close()
+                    if flight.error is not None:
+                        raise flight.error
+                    raise StopAsyncIteration
+                # 공유 신호가 구독자 취소로 함께 취소되지 않도록 shield
+                await asyncio.shield(flight._signal)
+        except asyncio.CancelledError:
+            self._close()
+            raise
+
+    async def aclose(self) -> None:
+        self._close()
+
+    def _close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._flight.unsubscribe()
+
+    def __del__(self) -> None:
+        # 반복하지 않고 버린 구독자도 업스트림을 붙잡지 않도록 해지
+        self._close()
+
+
+class SingleFlight:
+    """동일 요청 동시 호출의 중복 제거 (일반 요청: 결과 공유, 스트림: 브로드캐스트)"""
+
+    def __init__(self):
+        self._calls: Dict[str, _CallFlight] = {}
+        self._streams: Dict[str, _StreamFlight] = {}
+        self._stats = SingleFlightStats()
+
+    async def call(self, key: str, fn: Callable[[], Awaitable[Completion]]) -> Completion:
+        """같은 key의 요청이 진행 중이면 그 결과를 기다림"""
+        flight = self._calls.get(key)
+        owner = flight is None
+        if owner:
+            # 요청자 취소가 다른 대기자에게 전파되지 않도록 별도 태스크에서 실행
+            flight = _CallFlight(asyncio.create_task(fn()))
+            self._calls[key] = flight
+            flight.task.add_done_callback(lambda _: self._discard(self._calls, key, flight))
+            self._stats.upstream_calls += 1
+        else:
+            self._stats.shared_calls += 1
+
+        flight.waiters += 1
+        try:
+            result = await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                flight.task.cancel()
+        # 태스크 결과는 누구에게도 넘기지 않고 요청자마다 복사본 전달 (결과 수정 격리)
+        return copy.deepcopy(result)
+
+    def stream(
+            self,
+            key: str,
+            factory: Callable[[], AsyncIterator[StreamDelta]],
+            provider: str
+    ) -> AsyncIterator[StreamDelta]:
+        """같은 key의 스트림이 진행 중이면 구독, 없으면 업스트림 스트림 시작 (구독자는 여기서 등록)"""
+        flight = self._streams.get(key)
+        owner = flight is None or flight.cancelled
+        if owner:
+            flight = _StreamFlight(factory(), provider)
+            self._streams[key] = flight
+            flight.task.add_done_callback(lambda _: self._discard(self._streams, key, flight))
+            self._stats.upstream_streams += 1
+        else:
+            self._stats.shared_streams += 1
+        return flight.subscribe()
+
+    def stats(self) -> SingleFlightStats:
+        self._stats.in_flight = len(self._calls) + len(self._streams)
+        return self._stats
+
+    @staticmethod
+    def _discard(registry: Dict[str, Any], key: str, flight: Any) -> None:
+        if registry.get(key) is flight:
+            del registry[key]
@@ -0,0 +1,98 @@
+# clients/timeouts.py
+import asyncio
+from dataclasses import dataclass, asdict
+from typing import Any, AsyncIterator, Awaitable, Dict, Optional, Tuple, TypeVar
+
+import httpx
+
+from .completion_types import StreamDelta
+from .errors import LLMTimeoutError
+
+T = TypeVar("T")
+
+
+@dataclass
+class PhaseTimeouts:
+    """단계별 업스트림 대기 한도 (초, None이면 제한 없음)
+
+    connect: 커넥션 수립 (httpx 단계)
+    ttft: 요청 전송부터 첫 청크까지 (비스트림 요청은 응답 전체 대기)
+    idle: 청크 간 최대 간격 (응답이 중간에 멈춘 스트림 정리)
+    total: 요청 전체 (대기열 / 재시도 포함)
+    """
+    connect: Optional[float] = 5.0
+    ttft: Optional[float] = 30.0
+    idle: Optional[float] = 30.0
+    total: Optional[float] = None
+
+    def httpx_timeout(self) -> httpx.Timeout:
+        """httpx에는 연결 단계만 위임 (읽기 단계는 청크 단위 데드라인으로 관리)"""
+        return httpx.Timeout(None, connect=self.connect)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _phase_deadline(
+        loop: asyncio.AbstractEventLoop,
+        phase: str,
+        seconds: Optional[float],
+        deadline: Optional[float]
+) -> Tuple[Optional[float], str]:
+    """단계 한도와 전체 데드라인 중 이른 시각 (loop.time() 기준)과 해당 단계"""
+    if seconds is None:
+        return deadline, "total"
+    when = loop.time() + seconds
+    if deadline is not None and deadline <= when:
+        return deadline, "total"
+    return when, phase
+
+
+async def with_deadline(
+        awaitable: Awaitable[T],
+        timeouts: PhaseTimeouts,
+        deadline: Optional[float],
+        provider: str
+) -> T:
+    """비스트림 요청: 응답 전체를 ttft 한도 / 전체 데드라인 안에서 대기"""
+    when, phase = _phase_deadline(asyncio.get_running_loop(), "ttft", timeouts.ttft, deadline)
+    scope = asyncio.timeout_at(when)
+    try:
+        async with scope:
+            return await awaitable
+    except TimeoutError:
+        if not scope.expired():
+            raise
+        raise LLMTimeoutError(provider, phase, getattr(timeouts, phase)) from None
+
+
+async def guard_stream(
+        chunks: AsyncIterator[StreamDelta],
+        timeouts: PhaseTimeouts,
+        deadline: Optional[float],
+        provider: str
+) -> AsyncIterator[StreamDelta]:
+    """스트림 청크를 단계별 데드라인 안에서 전달 (첫 청크: ttft, 이후: idle)
+
+    만료되면 업스트림 스트림을 닫고(커넥션 반환) LLMTimeoutError를 발생시킵니다.
+    ttft / idle 한도는 청크를 기다리는 시간만 셉니다 (호출자가 청크를 처리하는 시간 제외).
+    """
+    loop = asyncio.get_running_loop()
+    phase, seconds = "ttft", timeouts.ttft
+    try:
+        while True:
+            when, expiring = _phase_deadline(loop, phase, seconds, deadline)
+            scope = asyncio.timeout_at(when)
+            try:
+                async with scope:
+                    chunk = await chunks.__anext__()
+            except StopAsyncIteration:
+                return
+            except TimeoutError:
+                if not scope.expired():
+                    raise
+                raise LLMTimeoutError(provider, expiring, getattr(timeouts, expiring)) from None
+            yield chunk
+            phase, seconds = "idle", timeouts.idle
+    finally:
+        await chunks.aclose()
@@ -0,0 +1,322 @@
+# clients/token_budget.py
+import re
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+# 모델 계열별 기본 컨텍스트 길이 (토큰, 설정 / 카탈로그 값이 없을 때 사용)
+DEFAULT_CONTEXT_LIMITS: Dict[str, int] = {
+    "openai": 128000,
+    "anthropic": 200000,
+    "qwen": 32768,
+    "llama": 128000,
+    "gemini": 1000000,
+    "mistral": 32768,
+    "default": 32768,
+}
+
+# 계열별 휴리스틱 (ASCII 문자당 토큰, 비 ASCII 문자당 토큰)
+# 한글 음절은 계열별 어휘 크기에 따라 1음절당 토큰 수가 크게 다름
+_HEURISTICS: Dict[str, Tuple[float, float]] = {
+    "openai": (0.25, 1.0),
+    "anthropic": (0.28, 1.2),
+    "qwen": (0.25, 0.8),
+    "llama": (0.26, 1.1),
+    "gemini": (0.25, 0.9),
+    "mistral": (0.28, 1.4),
+    "default": (0.28, 1.2),
+}
+
+_MESSAGE_OVERHEAD = 4          # 메시지당 역할 / 구분 토큰
+_SENTENCE_END = re.compile(r"(?<=[.!?。])\s+|\n+")
+
+
+def model_family(model: Optional[str]) -> str:
+    """모델 이름으로 토크나이저 계열 추정"""
+    name = (model or "").lower()
+    if "claude" in name or "anthropic" in name:
+        return "anthropic"
+    if "qwen" in name:
+        return "qwen"
+    if "llama" in name:
+        return "llama"
+    if "gemini" in name or "google" in name:
+        return "gemini"
+    if "mistral" in name or "mixtral" in name:
+        return "mistral"
+    if "gpt" in name or "openai" in name or re.search(r"(^|/)o\d", name):
+        return "openai"
+    return "default"
+
+
+class TokenEstimator:
+    """계열별 빠른 토큰 수 추정기 (OpenAI 계열은 tiktoken 설치 시 정확히 계산)
+
+    휴리스틱은 UTF-8 길이로 비 ASCII 문자 수를 구해 문자 단위 순회 없이 계산합니다.
+    """
+
+    def __init__(self, family: str):
+        self.family = family
+        self._ascii_rate, self._non_ascii_rate = _HEURISTICS.get(family, _HEURISTICS["default"])
+        self._encoding = None
+        if family == "openai" and tiktoken is not None:
+            self._encoding = tiktoken.get_encoding("o200k_base")
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        if self._encoding is not None:
+            return len(self._encoding.encode(text, disallowed_special=()))
+        chars = len(text)
+        # 한글 / CJK는 UTF-8 3바이트 -> 비 ASCII 문자 수 ~= (바이트 수 - 문자 수) / 2
+        non_ascii = (len(text.encode("utf-8")) - chars) // 2
+        return int((chars - non_ascii) * self._ascii_rate + non_ascii * self._non_ascii_rate) + 1
+
+
+@dataclass
+class BudgetResult:
+    """예산 적용 결과 (saved_tokens: 줄어든 프롬프트 토큰 수)
+
+    summary: summarize 전략의 요약 본문 (summary_in_messages=False면 messages에 없으므로 호출자가 배치)
+    """
+    messages: List[Dict[str, Any]]
+    budget: int
+    original_tokens: int
+    tokens: int
+    dropped_messages: int = 0
+    truncated_messages: int = 0
+    summarized: bool = False
+    summary: Optional[str] = None
+
+    @property
+    def saved_tokens(self) -> int:
+        return self.original_tokens - self.tokens
+
+    @property
+    def changed(self) -> bool:
+        return self.saved_tokens > 0
+
+
+@dataclass
+class TokenBudgetStats:
+    """토큰 예산 통계"""
+    calls: int = 0
+    trimmed_calls: int = 0
+    original_tokens: int = 0
+    sent_tokens: int = 0
+    saved_tokens: int = 0
+    dropped_messages: int = 0
+    truncated_messages: int = 0
+    summarized_calls: int = 0
+    over_budget_calls: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class TokenBudget:
+    """컨텍스트 길이 / 지연 예산에 맞춘 대화 기록 정리 (메시지별 토큰 수 캐시)
+
+    정리 순서:
+        1. system 메시지와 마지막 메시지는 항상 유지
+        2. 오래된 메시지부터 제외 (strategy="summarize"면 제외된 메시지를 요약 한 건으로 대체)
+        3. 그래도 넘치면 가장 긴 메시지의 가운데를 잘라냄
+    """
+
+    def __init__(
+            self,
+            strategy: str = "trim",
+            summary_tokens: int = 256,
+            cache_size: int = 4096,
+            summarizer: Optional[Callable[[List[Dict[str, Any]], int, TokenEstimator], str]] = None
+    ):
+        if strategy not in ("trim", "summarize"):
+            raise ValueError(f"지원하지 않는 토큰 예산 전략: {strategy}")
+        self.strategy = strategy
+        self.summary_tokens = summary_tokens
+        self.cache_size = cache_size
+        self.summarizer = summarizer or extractive_summary
+        self._estimators: Dict[str, TokenEstimator] = {}
+        # (계열, 내용) -> 토큰 수 (LRU)
+        self._counts: "OrderedDict[Tuple[str, str], int]" = OrderedDict()
+        self._stats = TokenBudgetStats()
+
+    def estimator(self, model: Optional[str]) -> TokenEstimator:
+        family = model_family(model)
+        estimator = self._estimators.get(family)
+        if estimator is None:
+            estimator = self._estimators[family] = TokenEstimator(family)
+        return estimator
+
+    def count_text(self, text: str, estimator: TokenEstimator) -> int:
+        key = (estimator.family, text)
+        count = self._counts.get(key)
+        if count is not None:
+            self._counts.move_to_end(key)
+            self._stats.cache_hits += 1
+            return count
+        self._stats.cache_misses += 1
+        count = estimator.count(text)
+        self._counts[key] = count
+        if len(self._counts) > self.cache_size:
+            self._counts.popitem(last=False)
+        return count
+
+    def count_message(self, message: Dict[str, Any], estimator: TokenEstimator) -> int:
+        return self.count_text(_content_text(message.get("content")), estimator) + _MESSAGE_OVERHEAD
+
+    def count_messages(self, messages: List[Dict[str, Any]], model: Optional[str] = None) -> int:
+        estimator = self.estimator(model)
+        return sum(self.count_message(message, estimator) for message in messages)
+
+    def fit(
+            self,
+            messages: List[Dict[str, Any]],
+            model: Optional[str],
+            budget: int,
+            fixed_tokens: int = 0,
+            summary_in_messages: bool = True
+    ) -> BudgetResult:
+        """budget(프롬프트 토큰) 안에 들도록 messages 정리 (원본 목록은 변경하지 않음)
+
+        fixed_tokens: 메시지 목록 밖에서 차지하는 토큰 (예: Claude의 system 필드)
+        summary_in_messages: 요약을 system 메시지로 messages에 삽입할지 여부
+            (False면 BudgetResult.summary로만 반환, 예: system 역할 메시지를 받지 않는 Claude)
+        """
+        estimator = self.estimator(model)
+        counts = [self.count_message(message, estimator) for message in messages]
+        original = sum(counts) + fixed_tokens
+        self._stats.calls += 1
+        self._stats.original_tokens += original
+
+        if original <= budget:
+            result = BudgetResult(list(messages), budget, original, original)
+            return self._finish(result)
+
+        # 유지 대상: system 메시지 + 마지막 메시지 / 제외 후보: 나머지 (오래된 순)
+        last = len(messages) - 1
+        pinned = {i for i, message in enumerate(messages) if message.get("role") == "system"} | {last}
+        # summarize 전략은 요약이 들어갈 자리까지 비움
+        target = budget - (self.summary_tokens + _MESSAGE_OVERHEAD if self.strategy == "summarize" else 0)
+        total = original
+        dropped: List[int] = []
+        for index in range(len(messages)):
+            if total <= target:
+                break
+            if index in pinned:
+                continue
+            dropped.append(index)
+            total -= counts[index]
+
+        dropped_set = set(dropped)
+        kept = [i for i in range(len(messages)) if i not in dropped_set]
+        result_messages = [dict(messages[i]) for i in kept]
+        result_counts = [counts[i] for i in kept]
+        summary_text = None
+
+        if dropped and self.strategy == "summarize":
+            room = budget - total - _MESSAGE_OVERHEAD
+            summary_budget = min(self.summary_tokens, room)
+            if summary_budget > 0:
+                summary = self.summarizer([messages[i] for i in dropped], summary_budget, estimator)
+                if summary:
+                    summary_text = f"[이전 대화 요약]\n{summary}"
+                    summary_message = {"role": "system", "content": summary_text}
+                    summary_count = self.count_message(summary_message, estimator)
+                    total += summary_count
+                    if summary_in_messages:
+                        # 선행 system 메시지 뒤, 남은 대화 앞에 삽입
+                        position = next((n for n, i in enumerate(kept) if i not in pinned or i == last), len(kept))
+                        result_messages.insert(position, summary_message)
+                        result_counts.insert(position, summary_count)
+
+        truncated = 0
+        while total > budget:
+            # 가장 긴 메시지의 가운데를 잘라냄 (앞/뒤 문맥 유지)
+            longest = max(range(len(result_messages)), key=lambda n: result_counts[n])
+            content = _content_text(result_messages[longest].get("content"))
+            excess = total - budget
+            keep_tokens = result_counts[longest] - _MESSAGE_OVERHEAD - excess
+            if keep_tokens <= 0 or not isinstance(result_messages[longest].get("content"), str):
+                break
+            shortened = _truncate_middle(content, keep_tokens, estimator)
+            if len(shortened) >= len(content):
+                break
+            result_messages[longest]["content"] = shortened
+            new_count = self.count_message(result_messages[longest], estimator)
+            total += new_count - result_counts[longest]
+            result_counts[longest] = new_count
+            truncated += 1
+
+        result = BudgetResult(
+            messages=result_messages,
+            budget=budget,
+            original_tokens=original,
+            tokens=total,
+            dropped_messages=len(dropped),
+            truncated_messages=truncated,
+            summarized=summary_text is not None,
+            summary=summary_text
+        )
+        return self._finish(result)
+
+    def _finish(self, result: BudgetResult) -> BudgetResult:
+        self._stats.sent_tokens += result.tokens
+        if result.changed:
+            self._stats.trimmed_calls += 1
+            self._stats.saved_tokens += result.saved_tokens
+            self._stats.dropped_messages += result.dropped_messages
+            self._stats.truncated_messages += result.truncated_messages
+            self._stats.summarized_calls += int(result.summarized)
+        if result.tokens > result.budget:
+            self._stats.over_budget_calls += 1
+        return result
+
+    def stats(self) -> TokenBudgetStats:
+        return TokenBudgetStats(**asdict(self._stats))
+
+
+def _content_text(content: Any) -> str:
+    """메시지 content (문자열 또는 멀티파트 목록)의 텍스트"""
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return "".join(part.get("text", "") for part in content if isinstance(part, dict))
+    return "" if content is None else str(content)
+
+
+def _truncate_middle(text: str, keep_tokens: int, estimator: TokenEstimator) -> str:
+    """앞/뒤를 남기고 가운데를 생략 (토큰 비율로 문자 수 환산)"""
+    total_tokens = max(1, estimator.count(text))
+    marker = "\n...(중략)...\n"
+    keep_chars = max(0, int(len(text) * keep_tokens / total_tokens) - len(marker))
+    if keep_chars <= 0:
+        return marker.strip()
+    head = keep_chars * 2 // 3
+    tail = keep_chars - head
+    return text[:head] + marker + (text[-tail:] if tail else "")
+
+
+def extractive_summary(messages: List[Dict[str, Any]], max_tokens: int, estimator: TokenEstimator) -> str:
+    """LLM 호출 없는 추출 요약 (메시지별 첫 문장, 토큰 예산까지)"""
+    lines: List[str] = []
+    used = 0
+    for message in messages:
+        text = _content_text(message.get("content")).strip()
+        if not text:
+            continue
+        first = _SENTENCE_END.split(text, maxsplit=1)[0].strip()
+        line = f"- {message.get('role', 'user')}: {first}"
+        cost = estimator.count(line)
+        if used + cost > max_tokens:
+            break
+        lines.append(line)
+        used += cost
+    return "\n".join(lines)
@@ -0,0 +1,109 @@
+# clients/vllm_client.py
+from ..base_client import BaseLLMClient
+from ..completion_types import Completion, StreamDelta
+import asyncio
+from typing import AsyncIterator, Union, List, Dict, Any, Optional
+
+
+class VLLMClient(BaseLLMClient):
+    """자체 호스팅 OpenAI 호환 서버(vLLM) 클라이언트
+
+    vLLM은 도착한 요청을 연속 배치(continuous batching)로 묶어 처리하므로
+    여러 요청을 한 번에 보내야 GPU 배치가 채워집니다. batch_completion 참고.
+    """
+    provider_name = "vLLM"
+
+    def __init__(self, settings):
+        super().__init__(settings)
+        self.base_url = settings.vllm_base_url.rstrip("/")
+        self.headers = {"Content-Type": "application/json"}
+        if settings.vllm_api_key:
+            self.headers["Authorization"] = f"Bearer {settings.vllm_api_key}"
+
+    async def chat_completion(
+            self,
+            messages: List[Dict[str, str]],
+            model: Optional[str] = None,
+            max_tokens: Optional[int] = None,
+            temperature: Optional[float] = None,
+            stream: bool = False,
+            **kwargs
+    ) -> Union[Completion, AsyncIterator[StreamDelta]]:
+        """vLLM Chat Completion API 호출 (Stream 지원)"""
+
+        payload = {
+            "model": model or self.settings.vllm_model,
+            "messages": messages,
+            "max_tokens": max_tokens or self.settings.max_tokens,
+            "temperature": self.settings.temperature if temperature is None else temperature,
+            "stream": stream
+        }
+        if stream:
+            # 마지막 청크에 usage 포함 (지표 / TPM 집계용)
+            payload["stream_options"] = {"include_usage": True}
+
+        for key in ("top_p", "top_k", "repetition_penalty", "stop", "seed", "response_format"):
+            if key in kwargs:
+                payload[key] = kwargs[key]
+
+        return await self._dispatch(payload, stream)
+
+    async def batch_completion(
+            self,
+            batch: List[List[Dict[str, str]]],
+            model: Optional[str] = None,
+            max_tokens: Optional[int] = None,
+            temperature: Optional[float] = None,
+            concurrency: Optional[int] = None,
+            **kwargs
+    ) -> List[Union[Completion, Exception]]:
+        """여러 대화를 동시에 전송하고 입력 순서대로 결과 반환 (실패한 항목은 예외 객체)
+
+        OpenAI 호환 chat API는 요청 하나에 대화 하나만 받으므로 concurrency개까지 한꺼번에 보내
+        서버의 연속 배치에 함께 들어가도록 합니다. 공통 처리(재시도, 요청 제한, 지표)는 항목별로 적용됩니다.
+        """
+        if not batch:
+            return []
+        semaphore = asyncio.Semaphore(concurrency or self.settings.vllm_batch_concurrency)
+        # 커넥션 생성이 배치 시작을 늦추지 않도록 미리 풀 생성
+        self._get_http_client()
+
+        async def run(messages: List[Dict[str, str]]) -> Completion:
+            async with semaphore:
+                return await self.chat_completion(
+                    messages,
+                    model=model,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    **kwargs
+                )
+
+        return await asyncio.gather(*[run(messages) for messages in batch], return_exceptions=True)
+
+    async def _regular_completion(self, payload: Dict[str, Any]) -> Completion:
+        """일반 완료 요청"""
+        client = self._get_http_client()
+        response = await client.post(
+            f"{self.base_url}/chat/completions",
+            headers=self.headers,
+            json=payload,
+            timeout=self._upstream_timeout(payload)
+        )
+
+        if response.status_code == 200:
+            return Completion.from_openai(response.json())
+        self._handle_error(response, "vLLM")
+
+    async def _stream_completion(self, payload: Dict[str, Any]) -> AsyncIterator[StreamDelta]:
+        """스트림 완료 요청"""
+        async for chunk in self._stream_sse(f"{self.base_url}/chat/completions", payload):
+            yield chunk
+
+    async def get_available_models(self) -> List[Dict[str, Any]]:
+        """서빙 중인 모델 목록 조회"""
+        client = self._get_http_client()
+        response = await client.get(f"{self.base_url}/models", headers=self.headers, timeout=self.timeout)
+
+        if response.status_code == 200:
+            return response.json()["data"]
+        self._handle_error(response, "vLLM")
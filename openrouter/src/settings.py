@@ -1,19 +1,115 @@
 # settings.py
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import List, Dict, Optional
 
 
 class Settings(BaseSettings):
     """OpenRouter 설정 - Pydantic v2 기반"""
 
-    # **필수 설정**
-    openrouter_api_key: str = Field(..., description="OpenRouter API 키")
+    # **제공자 API 키** (OpenRouter 제공자 사용 시 필수)
+    openrouter_api_key: str = Field("", description="OpenRouter API 키")
 
     # **기본 설정**
     max_tokens: int = Field(1000, ge=1, le=8192, description="최대 토큰 수")
     temperature: float = Field(0.7, ge=0.0, le=2.0, description="창의성 온도")
-    timeout: float = Field(30.0, ge=1.0, description="타임아웃(초)")
+    timeout: float = Field(30.0, ge=1.0, description="기본 응답 대기 시간(초) - 첫 토큰 / 청크 간 대기 한도를 따로 지정하지 않으면 사용")
+
+    # **제공자별 설정** (직접 호출 클라이언트용)
+    openrouter_model: str = Field("openai/gpt-4.1-mini", description="OpenRouter 기본 모델")
+    openai_api_key: str = Field("", description="OpenAI API 키")
+    openai_model: str = Field("gpt-4.1-mini", description="OpenAI 기본 모델")
+    claude_api_key: str = Field("", description="Anthropic API 키")
+    claude_model: str = Field("claude-sonnet-4-20250514", description="Claude 기본 모델")
+    claude_prompt_cache_enabled: bool = Field(True, description="Claude 프롬프트 캐시 사용 여부 (system / tools / 표시된 메시지에 캐시 중단점 지정)")
+    claude_prompt_cache_ttl: str = Field("5m", pattern="^(5m|1h)$", description="Claude 프롬프트 캐시 유지 시간")
+    qwen_api_key: str = Field("", description="DashScope API 키")
+    qwen_model: str = Field("qwen-plus", description="Qwen 기본 모델")
+    vllm_base_url: str = Field("http://gpt-oss-120b-svc.pai-custom-models.svc.cluster.local:8000/v1", description="자체 호스팅 vLLM(OpenAI 호환) 주소")
+    vllm_api_key: str = Field("", description="vLLM API 키 (--api-key로 기동한 경우)")
+    vllm_model: str = Field("gpt-oss-120b", description="vLLM 기본 모델")
+    vllm_batch_concurrency: int = Field(32, ge=1, description="batch_completion 동시 전송 수 (서버 max_num_seqs에 맞춰 조정)")
+
+    # **커넥션 풀 설정** (제공자별 공유 풀)
+    http2: bool = Field(True, description="HTTP/2 사용 여부 (h2 패키지 필요)")
+    pool_max_connections: int = Field(100, ge=1, description="제공자별 최대 커넥션 수")
+    pool_max_keepalive_connections: int = Field(20, ge=0, description="유지할 keep-alive 커넥션 수")
+    pool_keepalive_expiry: float = Field(30.0, ge=0.0, description="유휴 커넥션 유지 시간(초)")
+    provider_pool_limits: Dict[str, Dict[str, float]] = Field(
+        default_factory=dict,
+        description='제공자별 풀 설정 덮어쓰기 (예: {"openrouter": {"max_connections": 200}})'
+    )
+
+    # **응답 캐시 설정** (정확 일치 캐시)
+    response_cache_enabled: bool = Field(False, description="응답 캐시 사용 여부")
+    response_cache_max_entries: int = Field(1024, ge=1, description="메모리 캐시 최대 항목 수 (LRU)")
+    response_cache_ttl: float = Field(3600.0, gt=0.0, description="캐시 유효 시간(초)")
+    response_cache_disk_path: Optional[str] = Field(None, description="디스크 캐시(SQLite) 경로, 미지정 시 메모리만 사용")
+
+    # **지표 설정** (TTFT / ITL / E2E 지연, 토큰 수)
+    metrics_enabled: bool = Field(True, description="LLM 호출 지연 / 토큰 지표 수집 여부")
+
+    # **중복 제거 설정** (동일 요청 동시 호출 시 업스트림 호출 공유)
+    single_flight_enabled: bool = Field(True, description="동일 요청 중복 제거 사용 여부")
+
+    # **요청 한도 / 재시도 설정** (제공자/모델별 적응형 제한)
+    rate_limits: Dict[str, Dict[str, float]] = Field(
+        default_factory=dict,
+        description='제공자 또는 "제공자:모델"별 한도 '
+                    '(예: {"openrouter": {"requests_per_minute": 600, "tokens_per_minute": 400000}, '
+                    '"openrouter:openai/gpt-4.1-mini": {"max_concurrency": 16}})'
+    )
+    rate_limit_max_concurrency: int = Field(64, ge=1, description="기본 최대 동시 요청 수 (429 발생 시 자동 감소)")
+    retry_max_attempts: int = Field(2, ge=0, description="재시도 가능한 오류(429/5xx/네트워크)의 최대 재시도 횟수")
+    retry_base_delay: float = Field(0.5, gt=0.0, description="지수 백오프 기본 대기(초)")
+    retry_max_delay: float = Field(20.0, gt=0.0, description="최대 재시도 대기(초), Retry-After가 더 길면 재시도하지 않음")
+
+    # **단계별 타임아웃 설정** (초과 시 스트림을 닫고 LLMTimeoutError -> 재시도 / 폴백 / 헤지)
+    connect_timeout: float = Field(5.0, gt=0.0, description="커넥션 수립 한도(초)")
+    ttft_timeout: Optional[float] = Field(None, gt=0.0, description="첫 토큰 대기 한도(초, 비스트림은 응답 전체), 미지정 시 timeout")
+    idle_timeout: Optional[float] = Field(None, gt=0.0, description="스트림 청크 간 대기 한도(초), 미지정 시 timeout")
+    total_timeout: Optional[float] = Field(None, gt=0.0, description="요청 전체 한도(초, 대기열 / 재시도 포함), 미지정 시 제한 없음")
+    phase_timeouts: Dict[str, Dict[str, Optional[float]]] = Field(
+        default_factory=dict,
+        description='제공자 또는 "제공자:모델"별 덮어쓰기 (connect / ttft / idle / total, null은 제한 없음) '
+                    '(예: {"vllm": {"ttft": 60}, "openrouter:openai/o3": {"ttft": 120, "total": 300}})'
+    )
+
+    # **서킷 브레이커 / 폴백 설정** (모델별)
+    circuit_breaker_enabled: bool = Field(True, description="서킷 브레이커 사용 여부")
+    circuit_window_seconds: float = Field(60.0, gt=0.0, description="오류율 / 지연 비율 집계 구간(초)")
+    circuit_min_calls: int = Field(10, ge=1, description="서킷 판단에 필요한 최소 호출 수")
+    circuit_failure_rate_threshold: float = Field(0.5, gt=0.0, le=1.0, description="서킷을 여는 오류율")
+    circuit_slow_call_seconds: float = Field(10.0, gt=0.0, description="지연 호출 기준(초, 스트림은 첫 토큰까지)")
+    circuit_slow_call_rate_threshold: float = Field(0.8, gt=0.0, le=1.0, description="서킷을 여는 지연 호출 비율")
+    circuit_open_seconds: float = Field(30.0, gt=0.0, description="서킷 열림 유지 시간(초), 이후 시험 호출")
+    circuit_half_open_probes: int = Field(1, ge=1, description="반열림 상태에서 허용하는 시험 호출 수")
+    fallback_chains: Dict[str, List[str]] = Field(
+        default_factory=dict,
+        description='용도별 폴백 모델 순서 (예: {"rewrite": ["gpt-4.1-mini", "qwen3-next-80b"]}), '
+                    '미지정 시 preferred_models 사용'
+    )
+
+    # **토큰 예산 설정** (요청 전 대화 기록 정리)
+    token_budget_enabled: bool = Field(True, description="컨텍스트 길이 초과 시 대화 기록 정리 여부")
+    token_budget_strategy: str = Field("trim", pattern="^(trim|summarize)$", description="초과분 처리 방식 (trim: 오래된 메시지 제외, summarize: 제외한 메시지를 요약 한 건으로 대체)")
+    token_budget_context_limits: Dict[str, int] = Field(
+        default_factory=dict,
+        description='모델 또는 계열별 컨텍스트 길이 (예: {"qwen-plus": 131072, "anthropic": 200000})'
+    )
+    token_budget_max_prompt_tokens: Optional[int] = Field(None, ge=1, description="지연 예산 - 컨텍스트 길이와 무관한 최대 프롬프트 토큰 수")
+    token_budget_summary_tokens: int = Field(256, ge=1, description="summarize 전략의 요약 최대 토큰 수")
+
+    # **모델 카탈로그 설정** (OpenRouter /models 캐시)
+    model_catalog_refresh_interval: float = Field(3600.0, gt=0.0, description="모델 목록 갱신 주기(초), 지나면 백그라운드에서 조건부 요청")
+    model_catalog_snapshot_path: Optional[str] = Field(None, description="모델 목록 스냅샷(JSON) 경로, 지정 시 재시작 후 네트워크 없이 시작")
+
+    # **헤지 요청 설정** (MultiModelManager.hedge_stream)
+    hedge_enabled: bool = Field(False, description="chat_with_fallback 스트림에 헤지 적용 (첫 토큰이 늦으면 체인의 다음 모델 동시 요청)")
+    hedge_default_delay: float = Field(1.5, gt=0.0, description="TTFT 표본이 부족할 때 사용할 헤지 지연(초)")
+    hedge_min_samples: int = Field(20, ge=1, description="p95 TTFT 계산에 필요한 최소 표본 수")
+    hedge_sample_window: int = Field(200, ge=1, description="모델별 TTFT 표본 보관 개수")
+    hedge_queue_size: int = Field(256, ge=1, description="헤지 스트림별 청크 버퍼 크기")
 
     # **선호 모델**
     preferred_models: List[str] = Field(
@@ -26,10 +122,19 @@ class Settings(BaseSettings):
         description="선호 모델 목록"
     )
 
+    @field_validator('phase_timeouts')
+    @classmethod
+    def validate_phase_timeouts(cls, v: Dict[str, Dict[str, Optional[float]]]) -> Dict[str, Dict[str, Optional[float]]]:
+        for key, phases in v.items():
+            unknown = set(phases) - {"connect", "ttft", "idle", "total"}
+            if unknown:
+                raise ValueError(f'{key}: 알 수 없는 타임아웃 단계 {sorted(unknown)}')
+        return v
+
     @field_validator('openrouter_api_key')
     @classmethod
     def validate_api_key(cls, v: str) -> str:
-        if not v.startswith('sk-or-v1-'):
+        if v and not v.startswith('sk-or-v1-'):
             raise ValueError('OpenRouter API 키는 sk-or-v1-로 시작해야 합니다')
         return v
 
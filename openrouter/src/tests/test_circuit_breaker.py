@@ -0,0 +1,206 @@
+# tests/test_circuit_breaker.py
+"""
+CircuitBreaker 상태 전이 테스트 (가짜 시계 사용)
+
+openrouter/src 에서 실행:
+    python -m pytest tests
+"""
+
+import asyncio
+from typing import Optional
+
+import httpx
+import pytest
+
+from client.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+from client.errors import LLMAPIError
+
+
+class _FakeClock:
+    """수동으로 진행하는 시계"""
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def _breaker(clock: _FakeClock, **overrides) -> CircuitBreaker:
+    config = dict(
+        window_seconds=60.0,
+        min_calls=4,
+        failure_rate_threshold=0.5,
+        slow_call_seconds=10.0,
+        slow_call_rate_threshold=0.8,
+        open_seconds=30.0,
+        half_open_probes=1
+    )
+    config.update(overrides)
+    return CircuitBreaker("test:model", "Test", clock=clock, **config)
+
+
+def _succeed(breaker: CircuitBreaker, clock: _FakeClock, latency: float = 0.1) -> None:
+    with breaker.guard():
+        clock.advance(latency)
+
+
+def _fail(breaker: CircuitBreaker, error: Optional[Exception] = None) -> None:
+    with pytest.raises(type(error) if error else LLMAPIError):
+        with breaker.guard():
+            raise error or LLMAPIError("upstream error", "Test", status_code=503)
+
+
+def _open(breaker: CircuitBreaker) -> None:
+    for _ in range(breaker.min_calls):
+        _fail(breaker)
+    assert breaker.state == CircuitState.OPEN
+
+
+def test_opens_when_failure_rate_reaches_threshold():
+    clock = _FakeClock()
+    breaker = _breaker(clock)
+
+    _succeed(breaker, clock)
+    _succeed(breaker, clock)
+    _fail(breaker)
+    assert breaker.state == CircuitState.CLOSED  # min_calls 미만
+
+    _fail(breaker)  # 2 / 4 = 0.5
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.stats().opened == 1
+
+
+def test_opens_when_slow_call_rate_reaches_threshold():
+    clock = _FakeClock()
+    breaker = _breaker(clock)
+
+    for _ in range(3):
+        _succeed(breaker, clock, latency=12.0)
+    assert breaker.state == CircuitState.CLOSED
+
+    _succeed(breaker, clock, latency=12.0)  # 4 / 4 지연
+    assert breaker.state == CircuitState.OPEN
+
+
+def test_stream_latency_is_measured_to_first_token():
+    clock = _FakeClock()
+    breaker = _breaker(clock, min_calls=1)
+
+    # 첫 토큰은 빨랐고 전체 스트림만 길었던 호출은 지연 호출이 아님
+    with breaker.guard() as outcome:
+        clock.advance(1.0)
+        outcome.mark_first_token()
+        clock.advance(60.0)
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.stats().slow_call_rate == 0.0
+
+
+def test_calls_outside_window_are_evicted():
+    clock = _FakeClock()
+    breaker = _breaker(clock)
+
+    _fail(breaker)
+    _fail(breaker)
+    _fail(breaker)
+    clock.advance(61.0)
+    assert breaker.stats().calls == 0
+
+    _fail(breaker)
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_client_errors_are_not_counted():
+    clock = _FakeClock()
+    breaker = _breaker(clock, min_calls=1)
+
+    _fail(breaker, LLMAPIError("bad request", "Test", status_code=400))
+    _fail(breaker, LLMAPIError("unauthorized", "Test", status_code=401))
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.stats().calls == 0
+
+    # 네트워크 오류는 실패로 반영
+    _fail(breaker, httpx.ConnectError("connection refused"))
+    assert breaker.state == CircuitState.OPEN
+
+
+def test_open_rejects_with_remaining_retry_after():
+    clock = _FakeClock()
+    breaker = _breaker(clock)
+    _open(breaker)
+
+    clock.advance(10.0)
+    with pytest.raises(CircuitOpenError) as exc_info:
+        breaker.check()
+    assert exc_info.value.retry_after == pytest.approx(20.0)
+
+    with pytest.raises(CircuitOpenError):
+        with breaker.guard():
+            pytest.fail("열린 서킷은 호출을 허용하면 안 됨")
+    assert breaker.stats().rejected == 2
+
+
+def test_half_open_limits_probes_and_closes_on_success():
+    clock = _FakeClock()
+    breaker = _breaker(clock, half_open_probes=2)
+    _open(breaker)
+    clock.advance(30.0)
+
+    with breaker.guard():
+        assert breaker.state == CircuitState.HALF_OPEN
+        with breaker.guard():
+            # 시험 호출 2개가 진행 중이면 나머지는 차단
+            with pytest.raises(CircuitOpenError):
+                breaker.check()
+            with pytest.raises(CircuitOpenError):
+                with breaker.guard():
+                    pass
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.stats().calls == 0
+
+
+def test_half_open_probe_failure_reopens():
+    clock = _FakeClock()
+    breaker = _breaker(clock)
+    _open(breaker)
+    clock.advance(30.0)
+
+    _fail(breaker)
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.stats().opened == 2
+
+    # 다시 open_seconds 동안 차단
+    clock.advance(29.0)
+    with pytest.raises(CircuitOpenError) as exc_info:
+        breaker.check()
+    assert exc_info.value.retry_after == pytest.approx(1.0)
+
+
+def test_half_open_slow_probe_reopens():
+    clock = _FakeClock()
+    breaker = _breaker(clock)
+    _open(breaker)
+    clock.advance(30.0)
+
+    _succeed(breaker, clock, latency=15.0)
+    assert breaker.state == CircuitState.OPEN
+
+
+def test_abandoned_probe_frees_slot_without_deciding():
+    clock = _FakeClock()
+    breaker = _breaker(clock)
+    _open(breaker)
+    clock.advance(30.0)
+
+    # 첫 토큰 전에 취소된 시험 호출은 결과로 반영하지 않음
+    with pytest.raises(asyncio.CancelledError):
+        with breaker.guard():
+            raise asyncio.CancelledError()
+    assert breaker.state == CircuitState.HALF_OPEN
+
+    breaker.check()
+    _succeed(breaker, clock)
+    assert breaker.state == CircuitState.CLOSED
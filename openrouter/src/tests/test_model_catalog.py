@@ -0,0 +1,79 @@
+# tests/test_model_catalog.py
+"""
+ModelCatalog 주기 갱신 / 별칭 검증 테스트
+
+openrouter/src 에서 실행:
+    python -m pytest tests
+"""
+
+import asyncio
+import logging
+from typing import Dict, List
+
+from client.base_client import BaseLLMClient
+from client.openrouter.model_catalog import ModelCatalog
+from client.openrouter.openrouter_client import OpenRouterClient
+from settings import Settings
+
+_MODELS = [{"id": "openai/gpt-4.1-mini", "context_length": 1047576}]
+
+
+class _Fetcher:
+    """호출 수를 세는 /models 조회 함수 (첫 호출만 목록, 이후 304)"""
+
+    def __init__(self):
+        self.calls: List[Dict[str, str]] = []
+
+    async def __call__(self, validators: Dict[str, str]):
+        self.calls.append(validators)
+        return (_MODELS, {"etag": "v1"}) if len(self.calls) == 1 else None
+
+
+def test_auto_refresh_runs_every_interval_until_closed():
+    async def scenario():
+        fetch = _Fetcher()
+        catalog = ModelCatalog(fetch, refresh_interval=0.01)
+        await catalog.ensure_loaded()
+        catalog.start_auto_refresh()
+        await asyncio.sleep(0.06)
+        await catalog.aclose()
+        calls = len(fetch.calls)
+        await asyncio.sleep(0.03)
+        return calls, len(fetch.calls), catalog.stats()
+
+    calls, calls_after_close, stats = asyncio.run(scenario())
+    assert calls >= 3
+    assert calls_after_close == calls
+    assert stats.not_modified == calls - 1
+
+
+def test_unknown_aliases_are_logged_once_at_load(caplog):
+    async def scenario():
+        catalog = ModelCatalog(_Fetcher(), aliases={"gpt": "openai/gpt-4.1-mini", "old": "openai/gpt-3"})
+        with caplog.at_level(logging.WARNING, logger="client.openrouter.model_catalog"):
+            await catalog.ensure_loaded()
+            catalog._build_index(_MODELS)
+        return catalog.stats()
+
+    stats = asyncio.run(scenario())
+    assert stats.unknown_aliases == {"old": "openai/gpt-3"}
+    warnings = [record.getMessage() for record in caplog.records]
+    assert len(warnings) == 1 and "old -> openai/gpt-3" in warnings[0]
+
+
+def test_warm_up_starts_refresh_and_aclose_all_stops_it():
+    async def scenario():
+        client = OpenRouterClient(Settings(openrouter_api_key="sk-or-v1-test", model_catalog_refresh_interval=0.01))
+        fetch = _Fetcher()
+        client._fetch_models = fetch
+        await client._warm_up_resources()
+        catalog = OpenRouterClient._catalog
+        task = catalog._auto_refresh_task
+        await asyncio.sleep(0.03)
+        await BaseLLMClient.aclose_all()
+        return task, len(fetch.calls), OpenRouterClient._catalog
+
+    task, calls, catalog_after_close = asyncio.run(scenario())
+    assert task.cancelled()
+    assert calls >= 2
+    assert catalog_after_close is None
@@ -0,0 +1,103 @@
+# tests/test_multi_model_manager.py
+"""
+MultiModelManager 폴백 / 헤지 스트림 테스트 (모델별 응답 시점을 조절하는 가짜 스트림 사용)
+
+openrouter/src 에서 실행:
+    python -m pytest tests
+"""
+
+import asyncio
+from typing import Dict, List, Optional
+
+from client.base_client import BaseLLMClient
+from client.completion_types import StreamDelta
+from client.errors import LLMAPIError
+from client.openrouter.multi_model_manager import MultiModelManager
+from settings import Settings
+
+
+class _FakeModel:
+    """첫 토큰 지연(ttft) 후 토큰을 내는 모델 (error면 첫 토큰 전에 실패)"""
+
+    def __init__(self, ttft: float, error: Optional[Exception] = None):
+        self.ttft = ttft
+        self.error = error
+        self.started = False
+        self.closed = False
+
+    async def stream(self, name: str):
+        self.started = True
+        try:
+            await asyncio.sleep(self.ttft)
+            if self.error is not None:
+                raise self.error
+            yield StreamDelta(f"{name}-1")
+            yield StreamDelta(f"{name}-2", "stop")
+        finally:
+            self.closed = True
+
+
+class _FakeManager(MultiModelManager):
+    def __init__(self, models: Dict[str, _FakeModel], **settings):
+        super().__init__(Settings(openrouter_api_key="sk-or-v1-test", **settings))
+        self.fake_models = models
+
+    async def chat_with_model(self, model_name, messages, stream=False, **kwargs):
+        return self.fake_models[model_name].stream(model_name)
+
+
+def _collect(manager: MultiModelManager, chain: List[str]) -> List[str]:
+    async def scenario():
+        try:
+            stream = await manager.chat_with_fallback([{"role": "user", "content": "hi"}], models=chain, stream=True)
+            return [chunk.content async for chunk in stream]
+        finally:
+            await BaseLLMClient.aclose_all()
+
+    return asyncio.run(scenario())
+
+
+def test_hedged_stream_uses_first_token_winner_and_cancels_the_loser():
+    slow, fast = _FakeModel(ttft=5.0), _FakeModel(ttft=0.0)
+    manager = _FakeManager({"slow": slow, "fast": fast}, hedge_enabled=True, hedge_default_delay=0.02)
+
+    assert _collect(manager, ["slow", "fast"]) == ["fast-1", "fast-2"]
+    assert slow.started and slow.closed
+    stats = manager.hedge_stats()
+    assert stats["hedges"] == 1
+    assert stats["wins:fast"] == 1
+
+
+def test_hedged_stream_fails_over_immediately_when_primary_errors():
+    broken = _FakeModel(ttft=0.0, error=LLMAPIError("unavailable", "OpenRouter", status_code=503))
+    backup = _FakeModel(ttft=0.0)
+    manager = _FakeManager({"broken": broken, "backup": backup}, hedge_enabled=True, hedge_default_delay=5.0)
+
+    assert _collect(manager, ["broken", "backup"]) == ["backup-1", "backup-2"]
+    assert manager.hedge_stats()["failovers"] == 1
+
+
+def test_hedge_delay_follows_the_most_recently_started_model():
+    primary, second, third = _FakeModel(ttft=5.0), _FakeModel(ttft=0.1), _FakeModel(ttft=0.0)
+    manager = _FakeManager(
+        {"primary": primary, "second": second, "third": third},
+        hedge_enabled=True,
+        hedge_min_samples=1
+    )
+    manager._record_ttft("primary", 0.01)
+    manager._record_ttft("second", 1.0)
+
+    # 두 번째 모델의 p95(1초) 안에 첫 토큰이 오므로 세 번째 모델은 요청하지 않음
+    assert _collect(manager, ["primary", "second", "third"]) == ["second-1", "second-2"]
+    assert primary.closed
+    assert not third.started
+
+
+def test_fallback_stream_without_hedging_tries_models_in_order():
+    broken = _FakeModel(ttft=0.0, error=LLMAPIError("unavailable", "OpenRouter", status_code=503))
+    backup = _FakeModel(ttft=0.0)
+    manager = _FakeManager({"broken": broken, "backup": backup}, hedge_enabled=False)
+
+    assert _collect(manager, ["broken", "backup"]) == ["backup-1", "backup-2"]
+    assert manager.fallback_stats() == {"failed:broken": 1, "served:backup": 1}
+    assert manager.hedge_stats() == {"delays": {}}
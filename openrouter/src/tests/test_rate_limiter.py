@@ -0,0 +1,307 @@
+# tests/test_rate_limiter.py
+"""
+TokenBucket / AdaptiveConcurrencyLimiter / ProviderRateLimiter / RetryPolicy 테스트 (가짜 시계 사용)
+
+openrouter/src 에서 실행:
+    python -m pytest tests
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from client.errors import LLMAPIError
+from client.rate_limiter import (
+    AdaptiveConcurrencyLimiter,
+    ProviderRateLimiter,
+    RetryPolicy,
+    TokenBucket,
+)
+
+
+class _FakeClock:
+    """수동으로 진행하는 시계 (sleep()은 실제로 기다리지 않고 시각만 진행)"""
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.advance(seconds)
+        await asyncio.sleep(0)
+
+
+def _throttled() -> LLMAPIError:
+    return LLMAPIError("rate limited", "Test", status_code=429)
+
+
+# ---------- TokenBucket ----------
+
+def test_token_bucket_waits_for_refill():
+    async def scenario():
+        clock = _FakeClock()
+        bucket = TokenBucket(60, clock=clock, sleep=clock.sleep)  # 초당 1개
+
+        assert await bucket.acquire(60) == 0.0
+        assert bucket.available() == 0.0
+
+        # 부족한 3개가 채워질 때까지 대기
+        assert await bucket.acquire(3) == pytest.approx(3.0)
+        assert clock.sleeps == [pytest.approx(3.0)]
+        assert bucket.available() == pytest.approx(0.0)
+
+    asyncio.run(scenario())
+
+
+def test_token_bucket_refill_is_capped_at_capacity():
+    clock = _FakeClock()
+    bucket = TokenBucket(60, capacity=10, clock=clock)
+
+    bucket.adjust(10)
+    assert bucket.available() == 0.0
+    clock.advance(5)
+    assert bucket.available() == pytest.approx(5.0)
+    clock.advance(600)
+    assert bucket.available() == 10
+
+
+def test_token_bucket_adjust_applies_actual_usage():
+    clock = _FakeClock()
+    bucket = TokenBucket(600, clock=clock)
+
+    bucket.adjust(100)  # 예상보다 100 더 사용
+    assert bucket.available() == 500
+    bucket.adjust(-1000)  # 과다 예상분 반환 (capacity를 넘지 않음)
+    assert bucket.available() == 600
+
+
+def test_token_bucket_serves_waiters_in_arrival_order():
+    async def scenario():
+        clock = _FakeClock()
+        bucket = TokenBucket(60, capacity=1, clock=clock, sleep=clock.sleep)
+        order = []
+
+        async def take(name):
+            await bucket.acquire(1)
+            order.append((name, clock.now))
+
+        await asyncio.gather(take("a"), take("b"), take("c"))
+        assert order == [("a", 0.0), ("b", pytest.approx(1.0)), ("c", pytest.approx(2.0))]
+
+    asyncio.run(scenario())
+
+
+# ---------- AdaptiveConcurrencyLimiter ----------
+
+def test_concurrency_throttle_halves_limit_once_per_cooldown():
+    clock = _FakeClock()
+    limiter = AdaptiveConcurrencyLimiter(16, minimum=2, cooldown=1.0, clock=clock)
+
+    limiter.on_throttle()
+    assert limiter.limit == 8
+
+    # 같은 순간에 몰린 429는 한 번만 반영
+    clock.advance(0.5)
+    limiter.on_throttle()
+    assert limiter.limit == 8
+
+    clock.advance(0.5)
+    limiter.on_throttle()
+    assert limiter.limit == 4
+
+    for _ in range(5):
+        clock.advance(1.0)
+        limiter.on_throttle()
+    assert limiter.limit == 2  # minimum 아래로 내려가지 않음
+
+
+def test_concurrency_success_increases_additively_up_to_maximum():
+    clock = _FakeClock()
+    limiter = AdaptiveConcurrencyLimiter(8, clock=clock)
+    limiter.on_throttle()
+    assert limiter.limit == 4
+
+    # 한도만큼 성공하면 약 1 증가
+    for _ in range(4):
+        limiter.on_success()
+    assert 4.9 < limiter.limit < 5.0
+
+    for _ in range(100):
+        limiter.on_success()
+    assert limiter.limit == 8
+
+
+def test_concurrency_waiters_wake_in_order_when_slots_free():
+    async def scenario():
+        limiter = AdaptiveConcurrencyLimiter(2, clock=_FakeClock())
+        await limiter.acquire()
+        await limiter.acquire()
+
+        woken = []
+
+        async def wait(name):
+            await limiter.acquire()
+            woken.append(name)
+
+        tasks = [asyncio.create_task(wait(name)) for name in ("a", "b")]
+        await asyncio.sleep(0)
+        assert limiter.waiting == 2 and woken == []
+
+        limiter.release()
+        await asyncio.sleep(0)
+        assert woken == ["a"] and limiter.in_flight == 2
+
+        limiter.release()
+        await asyncio.gather(*tasks)
+        assert woken == ["a", "b"] and limiter.waiting == 0
+
+    asyncio.run(scenario())
+
+
+def test_concurrency_lowered_limit_holds_waiters_until_in_flight_drops():
+    async def scenario():
+        clock = _FakeClock()
+        limiter = AdaptiveConcurrencyLimiter(4, clock=clock)
+        for _ in range(4):
+            await limiter.acquire()
+
+        limiter.on_throttle()  # 4 -> 2
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+
+        # in_flight 4 -> 2까지는 깨우지 않음
+        limiter.release()
+        limiter.release()
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        limiter.release()
+        await asyncio.sleep(0)
+        assert waiter.done() and limiter.in_flight == 2
+
+    asyncio.run(scenario())
+
+
+def test_concurrency_cancelled_waiter_leaves_queue():
+    async def scenario():
+        limiter = AdaptiveConcurrencyLimiter(1, clock=_FakeClock())
+        await limiter.acquire()
+
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert limiter.waiting == 1
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert limiter.waiting == 0
+
+        limiter.release()
+        assert limiter.in_flight == 0
+
+    asyncio.run(scenario())
+
+
+# ---------- ProviderRateLimiter ----------
+
+def test_slot_backs_off_on_429_and_records_stats():
+    async def scenario():
+        clock = _FakeClock()
+        limiter = ProviderRateLimiter("test:model", max_concurrency=8, clock=clock)
+
+        with pytest.raises(LLMAPIError):
+            async with limiter.slot(100):
+                clock.advance(2.0)
+                raise _throttled()
+
+        stats = limiter.stats()
+        assert stats.concurrency_limit == 4
+        assert stats.throttled == 1 and stats.requests == 1
+        assert stats.in_flight == 0
+        assert stats.upstream_time_total == pytest.approx(2.0)
+
+        # 429가 아닌 오류는 한도를 줄이지 않음
+        with pytest.raises(LLMAPIError):
+            async with limiter.slot(100):
+                raise LLMAPIError("bad request", "Test", status_code=400)
+        assert limiter.stats().concurrency_limit == 4
+
+        async with limiter.slot(100):
+            clock.advance(1.0)
+        stats = limiter.stats()
+        assert stats.concurrency_limit == pytest.approx(4.25)
+        assert stats.throttled == 1 and stats.requests == 3
+        assert stats.upstream_time_total == pytest.approx(3.0)
+
+    asyncio.run(scenario())
+
+
+def test_slot_reports_queue_time_from_buckets():
+    async def scenario():
+        clock = _FakeClock()
+        limiter = ProviderRateLimiter(
+            "test:model", requests_per_minute=2, tokens_per_minute=60, clock=clock, sleep=clock.sleep
+        )
+
+        # RPM 여유 있음, TPM 60개를 모두 사용
+        async with limiter.slot(60) as queued:
+            assert queued == 0.0
+        # TPM 버킷이 30개를 채울 때까지 30초 대기
+        async with limiter.slot(30) as queued:
+            assert queued == pytest.approx(30.0)
+        # 그동안 RPM 버킷이 1개 회복
+        async with limiter.slot(0) as queued:
+            assert queued == 0.0
+        # RPM을 모두 썼으므로 다음 1개가 회복될 때까지 대기
+        async with limiter.slot(0) as queued:
+            assert queued == pytest.approx(30.0)
+        assert limiter.stats().queue_time_total == pytest.approx(60.0)
+
+    asyncio.run(scenario())
+
+
+def test_record_usage_corrects_token_bucket():
+    clock = _FakeClock()
+    limiter = ProviderRateLimiter("test:model", tokens_per_minute=1000, clock=clock)
+
+    limiter.record_usage(100, 400)
+    assert limiter.stats().tokens_available == 700
+    limiter.record_usage(100, None)
+    assert limiter.stats().tokens_available == 700
+
+
+# ---------- RetryPolicy ----------
+
+def test_retry_policy_honours_retry_after_within_max_delay():
+    policy = RetryPolicy(max_attempts=3, base_delay=0.5, max_delay=20.0)
+
+    error = LLMAPIError("rate limited", "Test", status_code=429, retry_after=3.0)
+    assert 3.0 <= policy.next_delay(error, 0) <= 3.5
+
+    # 서버가 요구한 대기 시간이 max_delay보다 길면 재시도하지 않음
+    error = LLMAPIError("rate limited", "Test", status_code=429, retry_after=60.0)
+    assert policy.next_delay(error, 0) is None
+
+
+def test_retry_policy_backoff_is_capped_and_bounded_by_attempts():
+    policy = RetryPolicy(max_attempts=10, base_delay=0.5, max_delay=2.0)
+    error = httpx.ConnectError("connection refused")
+
+    for attempt in range(10):
+        assert 0.0 <= policy.next_delay(error, attempt) <= min(2.0, 0.5 * 2 ** attempt)
+    assert policy.next_delay(error, 10) is None
+
+
+def test_retry_policy_skips_non_retryable_errors():
+    policy = RetryPolicy()
+
+    assert policy.next_delay(LLMAPIError("bad request", "Test", status_code=400), 0) is None
+    assert policy.next_delay(ValueError("parse"), 0) is None
@@ -0,0 +1,157 @@
+# tests/test_single_flight.py
+"""
+SingleFlight 스트림 구독 / 결과 공유 테스트
+
+openrouter/src 에서 실행:
+    python -m pytest tests
+"""
+
+import asyncio
+import gc
+
+import pytest
+
+from client.completion_types import Completion, StreamDelta
+from client.errors import LLMAPIError
+from client.single_flight import SingleFlight
+
+
+class _Upstream:
+    """청크를 하나씩 흘려보내는 업스트림 스트림 (release()마다 한 청크, 종료 / 취소 여부 기록)"""
+
+    def __init__(self, count: int):
+        self.count = count
+        self.gate = asyncio.Semaphore(0)
+        self.closed = False
+
+    def release(self, n: int = 1) -> None:
+        for _ in range(n):
+            self.gate.release()
+
+    async def stream(self):
+        try:
+            for i in range(self.count):
+                await self.gate.acquire()
+                yield StreamDelta(f"t{i}", "stop" if i == self.count - 1 else None)
+        finally:
+            self.closed = True
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_shared_subscriber_survives_owner_closing_before_it_iterates():
+    async def scenario():
+        flights = SingleFlight()
+        upstream = _Upstream(3)
+        owner = flights.stream("k", upstream.stream, "Test")
+        shared = flights.stream("k", upstream.stream, "Test")
+
+        upstream.release()
+        assert (await owner.__anext__()).content == "t0"
+        await owner.aclose()
+
+        upstream.release(2)
+        contents = [chunk.content async for chunk in shared]
+        return contents, upstream
+
+    contents, upstream = asyncio.run(scenario())
+    assert contents == ["t0", "t1", "t2"]
+    assert upstream.closed
+
+
+def test_unused_subscribers_release_the_upstream():
+    async def scenario():
+        flights = SingleFlight()
+        upstream = _Upstream(3)
+        owner = flights.stream("k", upstream.stream, "Test")
+        flights.stream("k", upstream.stream, "Test")  # 반복하지 않고 버린 구독자
+        gc.collect()
+
+        upstream.release()
+        await owner.__anext__()
+        await owner.aclose()
+        await _settle()
+        return upstream, flights.stats().in_flight
+
+    upstream, in_flight = asyncio.run(scenario())
+    assert upstream.closed
+    assert in_flight == 0
+
+
+def test_cancelled_upstream_reaches_subscribers_as_llm_error():
+    async def scenario():
+        flights = SingleFlight()
+        upstream = _Upstream(3)
+        subscriber = flights.stream("k", upstream.stream, "Test")
+        upstream.release()
+        await subscriber.__anext__()
+
+        flights._streams["k"].task.cancel()
+        await _settle()
+        with pytest.raises(LLMAPIError) as exc_info:
+            await subscriber.__anext__()
+        return exc_info.value
+
+    error = asyncio.run(scenario())
+    assert error.provider == "Test"
+
+
+def test_new_caller_after_last_subscriber_left_starts_a_fresh_upstream():
+    async def scenario():
+        flights = SingleFlight()
+        first, second = _Upstream(1), _Upstream(1)
+        subscriber = flights.stream("k", first.stream, "Test")
+        await subscriber.aclose()
+
+        second.release()
+        contents = [chunk.content async for chunk in flights.stream("k", second.stream, "Test")]
+        return contents, flights.stats()
+
+    contents, stats = asyncio.run(scenario())
+    assert contents == ["t0"]
+    assert stats.upstream_streams == 2
+    assert stats.shared_streams == 0
+
+
+def test_every_caller_gets_its_own_copy_of_the_shared_result():
+    async def scenario():
+        flights = SingleFlight()
+        gate = asyncio.Event()
+
+        async def fetch():
+            await gate.wait()
+            return Completion("answer", "stop", {"total_tokens": 3})
+
+        tasks = [asyncio.create_task(flights.call("k", fetch)) for _ in range(3)]
+        await _settle()
+        gate.set()
+        owner, *others = await asyncio.gather(*tasks)
+        owner.usage["total_tokens"] = -1
+        owner.content = "mutated"
+        return others, flights.stats()
+
+    others, stats = asyncio.run(scenario())
+    assert [(c.content, c.usage) for c in others] == [("answer", {"total_tokens": 3})] * 2
+    assert stats.upstream_calls == 1
+    assert stats.shared_calls == 2
+
+
+def test_owner_mutating_a_chunk_does_not_leak_to_late_subscribers():
+    async def scenario():
+        flights = SingleFlight()
+        upstream = _Upstream(2)
+        owner = flights.stream("k", upstream.stream, "Test")
+        upstream.release()
+        chunk = await owner.__anext__()
+        chunk.content = "mutated"
+
+        late = flights.stream("k", upstream.stream, "Test")
+        upstream.release()
+        contents = [c.content async for c in late]
+        await owner.aclose()
+        return contents
+
+    assert asyncio.run(scenario()) == ["t0", "t1"]
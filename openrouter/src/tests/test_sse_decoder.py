@@ -0,0 +1,83 @@
+# tests/test_sse_decoder.py
+"""
+SSEDecoder 증분 디코딩 테스트
+
+openrouter/src 에서 실행:
+    python -m pytest tests
+"""
+
+import json
+from typing import Iterable, List, Tuple
+
+from client.base_client import SSEDecoder
+
+
+def _decode(chunks: Iterable[bytes]) -> List[Tuple[str, bytes, str]]:
+    decoder = SSEDecoder(json.loads)
+    events = []
+    for chunk in chunks:
+        events += decoder.feed(chunk)
+    events += decoder.flush()
+    return [(event.event, event.data, event.id) for event in events]
+
+
+def _split_every(data: bytes, size: int) -> List[bytes]:
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+_STREAM = (
+    b": keep-alive\n\n"
+    b"event: message_start\nid: 1\ndata: {\"a\": 1}\n\n"
+    b"data: line one\ndata: line two\n\n"
+    b"data: [DONE]\n\n"
+)
+_EXPECTED = [
+    ("message_start", b'{"a": 1}', "1"),
+    (None, b"line one\nline two", "1"),
+    (None, b"[DONE]", "1"),
+]
+
+
+def test_events_split_at_every_byte_boundary():
+    assert _decode([_STREAM]) == _EXPECTED
+    for size in (1, 2, 3, 7):
+        assert _decode(_split_every(_STREAM, size)) == _EXPECTED
+
+
+def test_crlf_and_cr_line_endings():
+    for newline in (b"\r\n", b"\r"):
+        stream = _STREAM.replace(b"\n", newline)
+        assert _decode([stream]) == _EXPECTED
+        assert _decode(_split_every(stream, 1)) == _EXPECTED
+
+
+def test_crlf_split_between_chunks_does_not_produce_an_empty_line():
+    # CR 뒤에서 청크가 나뉘어도 LF가 빈 줄(이벤트 종료)로 처리되면 안 됨
+    chunks = [b"data: a\r", b"\ndata: b\r", b"\n\r", b"\n"]
+    assert _decode(chunks) == [(None, b"a\nb", None)]
+
+
+def test_comments_and_unknown_fields_are_ignored():
+    stream = b":comment\nretry: 1000\nfoo: bar\ndata:no-space\n\n: trailing comment\n\n"
+    assert _decode([stream]) == [(None, b"no-space", None)]
+
+
+def test_multibyte_utf8_split_across_chunks():
+    payload = json.dumps({"content": "롯데카드 혜택 안내"}, ensure_ascii=False).encode("utf-8")
+    stream = b"data: " + payload + b"\n\n"
+    events = _decode(_split_every(stream, 1))
+    assert events == [(None, payload, None)]
+    assert json.loads(events[0][1])["content"] == "롯데카드 혜택 안내"
+
+
+def test_trailing_event_without_final_blank_line_is_flushed():
+    assert _decode([b"data: first\n\n", b"data: last"]) == [(None, b"first", None), (None, b"last", None)]
+    assert _decode([b"data: last\n"]) == [(None, b"last", None)]
+    assert _decode([b"data: last\r"]) == [(None, b"last", None)]
+
+
+def test_json_helper_and_done_marker():
+    decoder = SSEDecoder(json.loads)
+    first, done = decoder.feed(b'data: {"x": [1, 2]}\n\ndata: [DONE]\n\n')
+    assert first.json() == {"x": [1, 2]} and not first.is_done
+    assert done.is_done
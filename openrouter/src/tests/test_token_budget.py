@@ -0,0 +1,87 @@
+# tests/test_token_budget.py
+"""
+TokenBudget summarize 전략의 요약 배치 테스트
+
+openrouter/src 에서 실행:
+    python -m pytest tests
+"""
+
+import asyncio
+from typing import Any, Dict, List
+
+from client.base_client import BaseLLMClient
+from client.claude.claude_client import ClaudeClient
+from client.completion_types import Completion
+from client.token_budget import TokenBudget
+from settings import Settings
+
+_HISTORY = [{"role": "system", "content": "너는 카드 상담원이다."}] + [
+    {"role": "user" if i % 2 == 0 else "assistant", "content": f"질문 {i}. 로카 카드 혜택이 궁금합니다. " * 40}
+    for i in range(30)
+]
+
+
+def test_summary_is_inserted_as_system_message_after_leading_system_prompt():
+    result = TokenBudget(strategy="summarize").fit(_HISTORY, "qwen-plus", 2000)
+
+    assert result.summarized
+    assert result.messages[0] == _HISTORY[0]
+    assert result.messages[1]["role"] == "system"
+    assert result.messages[1]["content"] == result.summary
+    assert result.messages[-1] == _HISTORY[-1]
+    assert result.tokens <= 2000
+
+
+def test_summary_can_be_returned_without_touching_messages():
+    result = TokenBudget(strategy="summarize").fit(_HISTORY, "claude", 2000, summary_in_messages=False)
+
+    assert result.summary.startswith("[이전 대화 요약]")
+    assert all(message["role"] != "system" for message in result.messages[1:])
+    assert result.tokens <= 2000
+
+
+class _CapturingClaudeClient(ClaudeClient):
+    """업스트림 대신 전송할 payload를 기록"""
+
+    def __init__(self, settings: Settings):
+        super().__init__(settings)
+        self.payloads: List[Dict[str, Any]] = []
+
+    async def _regular_completion(self, payload: Dict[str, Any]) -> Completion:
+        self.payloads.append(payload)
+        return Completion("ok", "stop")
+
+
+def _send(cache_prompt: bool) -> Dict[str, Any]:
+    async def scenario():
+        client = _CapturingClaudeClient(Settings(
+            claude_api_key="test",
+            token_budget_strategy="summarize",
+            token_budget_max_prompt_tokens=2000,
+            circuit_breaker_enabled=False,
+            single_flight_enabled=False,
+            retry_max_attempts=0
+        ))
+        try:
+            await client.chat_completion(_HISTORY, model="claude-sonnet-4", cache_prompt=cache_prompt)
+        finally:
+            await BaseLLMClient.aclose_all()
+        return client.payloads[0]
+
+    return asyncio.run(scenario())
+
+
+def test_claude_summary_goes_into_system_field():
+    payload = _send(cache_prompt=False)
+
+    assert all(message["role"] in ("user", "assistant") for message in payload["messages"])
+    assert payload["system"].startswith("너는 카드 상담원이다.\n\n[이전 대화 요약]")
+
+
+def test_claude_summary_is_appended_after_cached_system_block():
+    payload = _send(cache_prompt=True)
+
+    assert all(message["role"] in ("user", "assistant") for message in payload["messages"])
+    cached, summary = payload["system"]
+    assert cached["text"] == "너는 카드 상담원이다." and "cache_control" in cached
+    assert summary["text"].startswith("[이전 대화 요약]") and "cache_control" not in summary
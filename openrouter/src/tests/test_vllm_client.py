@@ -0,0 +1,84 @@
+# tests/test_vllm_client.py
+"""
+VLLMClient.batch_completion 테스트 (벤치마크 모의 서버 사용)
+
+openrouter/src 에서 실행:
+    python -m pytest tests
+"""
+
+import asyncio
+from typing import Any, Dict
+
+from benchmark.mock_server import MockLLMServer, MockServerConfig
+from client.base_client import BaseLLMClient
+from client.errors import LLMAPIError
+from client.vllm.vllm_client import VLLMClient
+from settings import Settings
+
+
+class _EchoServer(MockLLMServer):
+    """마지막 메시지를 그대로 답변하는 모의 서버 ("fail"이면 400, 동시 처리 수 기록)"""
+
+    def __init__(self):
+        super().__init__(MockServerConfig())
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _route(self, path: str, body: Dict[str, Any], writer: asyncio.StreamWriter) -> None:
+        content = body["messages"][-1]["content"]
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            # 뒤쪽 항목이 먼저 끝나도록 지연을 역순으로 부여 (결과 순서 검증용)
+            await asyncio.sleep(0.01 * (10 - int(content[-1])) if content[-1].isdigit() else 0.01)
+            if content == "fail":
+                await self._write_json(writer, 400, {"error": {"message": "bad request"}})
+            else:
+                await self._write_json(writer, 200, self._completion_body("openai", body["model"], f"echo {content}"))
+        finally:
+            self.in_flight -= 1
+
+
+def _settings(port: int) -> Settings:
+    return Settings(
+        openrouter_api_key="sk-or-v1-test",
+        openai_api_key="test",
+        claude_api_key="test",
+        qwen_api_key="test",
+        vllm_base_url=f"http://127.0.0.1:{port}/v1",
+        vllm_batch_concurrency=3,
+        circuit_breaker_enabled=False,
+        retry_max_attempts=0,
+        response_cache_enabled=False
+    )
+
+
+async def _run_batch(batch, concurrency=None):
+    server = _EchoServer()
+    port = await server.start()
+    serve_task = asyncio.create_task(server.serve_forever())
+    try:
+        client = VLLMClient(_settings(port))
+        results = await client.batch_completion(batch, concurrency=concurrency)
+        return results, server.max_in_flight
+    finally:
+        await BaseLLMClient.aclose_all()
+        serve_task.cancel()
+
+
+def test_batch_completion_keeps_input_order_and_concurrency_cap():
+    batch = [[{"role": "user", "content": f"q{i}"}] for i in range(8)]
+    results, max_in_flight = asyncio.run(_run_batch(batch))
+
+    assert [result.content for result in results] == [f"echo q{i}" for i in range(8)]
+    assert max_in_flight == 3
+
+
+def test_batch_completion_returns_failed_item_as_exception_in_its_slot():
+    batch = [[{"role": "user", "content": content}] for content in ("q1", "fail", "q3")]
+    results, _ = asyncio.run(_run_batch(batch, concurrency=2))
+
+    assert results[0].content == "echo q1"
+    assert isinstance(results[1], LLMAPIError)
+    assert results[1].status_code == 400
+    assert results[2].content == "echo q3"
@@ -1,5 +1,6 @@
 import asyncio
 
+from client.base_client import BaseLLMClient
 from client.openrouter.multi_model_manager import MultiModelManager
 from open_router_config import OpenRouterConfig
 from settings import get_settings
@@ -31,17 +32,13 @@ async def run_single_model(config: OpenRouterConfig):
 
         content = ""
         async for chunk in stream_response:
-            if "choices" in chunk and chunk["choices"]:
-                delta = chunk["choices"][0].get("delta", {})
-                if "content" in delta:
-                    chunk_content = delta["content"]
-                    print(chunk_content, end="", flush=True)
-                    content += chunk_content
-
-                finish_reason = chunk["choices"][0].get("finish_reason")
-                if finish_reason:
-                    print(f"\n\n**완료**: {finish_reason}")
-                    break
+            if chunk.content:
+                print(chunk.content, end="", flush=True)
+                content += chunk.content
+
+            if chunk.finish_reason:
+                print(f"\n\n**완료**: {chunk.finish_reason}")
+                break
     else:
         response = await manager.chat_with_model(
             model_name=selected_model,
@@ -51,8 +48,8 @@ async def run_single_model(config: OpenRouterConfig):
             stream=False
         )
 
-        content = response["choices"][0]["message"]["content"]
-        usage = response.get("usage", {})
+        content = response.content
+        usage = response.usage
 
         print(f"**응답**: {content}")
         print(f"**토큰 사용량**: {usage}")
@@ -101,12 +98,20 @@ async def run_stream_multiple(config: OpenRouterConfig):
     print(f"**질문**: {config.user_message}")
     print("-" * 50)
 
-    await manager.stream_multiple_models(
+    async with manager.stream_multiple_models(
         model_names=config.selected_models,
         messages=messages,
         temperature=config.temperature,
         max_tokens=config.max_tokens
-    )
+    ) as stream:
+        async for model_name, delta, finish_reason, timing in stream:
+            if delta and finish_reason != "error":
+                print(f"[{model_name}] {delta}", end="", flush=True)
+            if finish_reason == "error":
+                print(f"\n[{model_name}] **오류**: {delta}")
+            elif finish_reason:
+                ttft = f"{timing.ttft:.2f}s" if timing.ttft is not None else "-"
+                print(f"\n[{model_name}] **완료**: {finish_reason} (TTFT {ttft}, 총 {timing.elapsed:.2f}s)")
 
 
 async def run_provider_analysis(config: OpenRouterConfig):
@@ -179,6 +184,9 @@ async def main():
         print("❌ 지원하지 않는 테스트 모드입니다.")
         print("사용 가능한 모드: single, compare, stream, provider")
 
+    # 공유 커넥션 풀 정리
+    await BaseLLMClient.aclose_all()
+
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file